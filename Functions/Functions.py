@@ -45,6 +45,7 @@ def deltaG_T2(deltaH_1, deltaS_1, delta_Cp, T1, T2):
     Input:
     deltaH_1 : The reaction enthalpy at T1              - [J/mol]
     deltaS_1 : The reaction entropy at T1               - [J/K*mol]
+    delta_Cp : The heat capacity coefficients, Cp = a + b*T + c/T^2, the last axis holds [a, b, c] - [J/K*mol]
     T1 : The old temperature (25 degrees)               - [K]
     T2 : The new temperature                            - [K]
     
@@ -52,8 +53,8 @@ def deltaG_T2(deltaH_1, deltaS_1, delta_Cp, T1, T2):
     deltaG_2 : The Gibbs free energy for reaction at T2 - [J/mol]
     '''
 
-    deltaH_2 = deltaH_1 + (delta_Cp[0]*(T2 - T1) + delta_Cp[1]*(T2**2 - T1**2) - delta_Cp[2]*(1/T2 - 1/T1))
-    deltaS_2 = deltaS_1 + (delta_Cp[0]*np.log(T2/T1) + delta_Cp[1]*(T2 - T1) - (1/2)*delta_Cp[2]*(1/(T2**2) - 1/(T1**2)))
+    deltaH_2 = deltaH_1 + (delta_Cp[..., 0]*(T2 - T1) + (1/2)*delta_Cp[..., 1]*(T2**2 - T1**2) - delta_Cp[..., 2]*(1/T2 - 1/T1))
+    deltaS_2 = deltaS_1 + (delta_Cp[..., 0]*np.log(T2/T1) + delta_Cp[..., 1]*(T2 - T1) - (1/2)*delta_Cp[..., 2]*(1/(T2**2) - 1/(T1**2)))
     return deltaH_2 - T2*deltaS_2
 
 # Calculating the standard reduction potential using that the derivative of the standrad reduction potential with respect to temperature is the entropy for the reaction
@@ -75,6 +76,62 @@ def E0_2(E0_1, deltaS_1, T1, T2, n):
 
     return E0_1 + (deltaS_1/(n*96485))*(T2 - T1)
 
+# Evaluating the Gibbs free energy for many reactions and temperatures in one broadcasted call
+def deltaG_sweep(deltaG_1, deltaH_1, deltaS_1, delta_Cp, T1, T, method='deltaG_T2'):
+    '''
+    Assumptions:
+    The same as for the function given by method
+
+    Input:
+    deltaG_1 : Gibbs free energy for the reactions at T1     - [J/mol]   - (n_reactions)
+    deltaH_1 : The reaction enthalpies at T1                 - [J/mol]   - (n_reactions)
+    deltaS_1 : The reaction entropies at T1                  - [J/K*mol] - (n_reactions)
+    delta_Cp : The reaction heat capacity coefficients       - [J/K*mol] - (n_reactions x 3)
+    T1 : The reference temperature (25 degrees)              - [K]
+    T : The new temperatures                                 - [K]       - (n_T)
+    method : 'deltaG_T2', 'vant_Hoff' or 'deltaG_weak'
+
+    Output:
+    deltaG : Gibbs free energy for the reactions at T        - [J/mol]   - (n_reactions x n_T)
+    '''
+    deltaG_1 = np.asarray(deltaG_1, dtype=float)[:, None]
+    deltaH_1 = np.asarray(deltaH_1, dtype=float)[:, None]
+    deltaS_1 = np.asarray(deltaS_1, dtype=float)[:, None]
+    delta_Cp = np.asarray(delta_Cp, dtype=float)[:, None, :]
+    T = np.atleast_1d(np.asarray(T, dtype=float))[None, :]
+
+    if method == 'deltaG_T2':
+        return deltaG_T2(deltaH_1, deltaS_1, delta_Cp, T1, T)
+    elif method == 'vant_Hoff':
+        return vant_Hoff(deltaG_1, deltaH_1, T1, T)
+    elif method == 'deltaG_weak':
+        return deltaG_weak(deltaH_1, deltaS_1, T)
+    raise ValueError(f"Unknown method '{method}', use 'deltaG_T2', 'vant_Hoff' or 'deltaG_weak'")
+
+# Evaluating the standard reduction potential for many reactions and temperatures in one broadcasted call
+def E0_sweep(deltaG_1, deltaH_1, deltaS_1, delta_Cp, n, T1, T, method='deltaG_T2'):
+    '''
+    Assumptions:
+    E0 = -deltaG/(nF) with deltaG from deltaG_sweep, or method='E0_2' which uses that the entropy is a weak function of temperature
+
+    Input:
+    deltaG_1, deltaH_1, deltaS_1, delta_Cp, T1, T : As for deltaG_sweep
+    n : The number of electrons for the reactions            - [-]       - (n_reactions)
+    method : 'deltaG_T2', 'vant_Hoff', 'deltaG_weak' or 'E0_2'
+
+    Output:
+    E0 : The standard reduction potentials at T              - [V vs SHE] - (n_reactions x n_T), NaN for reactions without electrons
+    '''
+    n = np.asarray(n, dtype=float)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'E0_2':
+            E0_1 = -np.asarray(deltaG_1, dtype=float)[:, None]/(n*96485)
+            T = np.atleast_1d(np.asarray(T, dtype=float))[None, :]
+            E0 = E0_2(E0_1, np.asarray(deltaS_1, dtype=float)[:, None], T1, T, n)
+        else:
+            E0 = -deltaG_sweep(deltaG_1, deltaH_1, deltaS_1, delta_Cp, T1, T, method)/(n*96485)
+    return np.where(n > 0, E0, np.nan)
+
 # Adding polygons to fill in the shapes in the Pourbaix diagram
 def add_polygon(ax, vertices, colour, alpha, label, text_coord, text, text_rotation=0):
     '''
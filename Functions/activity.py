@@ -0,0 +1,153 @@
+import numpy as np
+
+MODELS = ('ideal', 'davies', 'debye_huckel', 'pitzer')
+
+M_water = 0.018015          # [kg/mol] - Molar mass of water
+
+# Ion size parameters of the extended Debye-Hueckel equation (Kielland), 4 Angstrom for the ions not listed - [Angstrom]
+ion_size = {'H^+': 9.0, 'OH^-': 3.5, 'K^+': 3.0, 'Zn^2+': 6.0}
+
+# Pitzer parameters of KOH at 25 degrees (Pitzer and Mayorga), used for all temperatures
+pitzer_parameters = {'beta0': 0.1298, 'beta1': 0.32, 'C_phi': 0.0041, 'alpha': 2.0, 'b': 1.2}
+
+# The constants of the Debye-Hueckel equations at the temperature T
+def debye_huckel_constants(T):
+    '''
+    Assumptions:
+    The dielectric constant of water from Malmberg and Maryott and the density from the Thiesen formula
+
+    Input:
+    T : Temperature, a number or an array                       - [K]
+
+    Output:
+    A : The Debye-Hueckel slope, log10(gamma) = -A*z^2*sqrt(I) in the limit - [(kg/mol)^0.5]
+    B : For the ion size term, B*a*sqrt(I) with a in Angstrom  - [(kg/mol)^0.5/Angstrom]
+    '''
+    t = np.asarray(T, dtype=float) - 273.15
+    epsilon = 87.74 - 0.40008*t + 9.398e-4*t**2 - 1.410e-6*t**3
+    rho = 1 - (t + 288.9414)/(508929.2*(t + 68.12963))*(t - 3.9863)**2     # [kg/L]
+    return 1.82483e6*np.sqrt(rho)/(epsilon*T)**1.5, 50.2916*np.sqrt(rho)/np.sqrt(epsilon*T)
+
+# log10 of the activity coefficients of the dissolved species
+def log_gamma(species, charge, I, model='ideal', T=298.15):
+    '''
+    Assumptions:
+    The electrolyte is KOH, so for 'pitzer' the ionic strength is the molality of KOH. K^+ and OH^- get the mean
+    activity coefficient of KOH and other ions only the Debye-Hueckel part of the Pitzer equation, since there are no
+    parameters for their interactions (e.g. the zincates with K^+). Neutral species have activity coefficient 1 in all models
+
+    Input:
+    species : The names of the species                          - (n_species)
+    charge : The charges of the species                         - (n_species)
+    I : Ionic strength, a number or an array of any shape       - [mol/kg]
+    model : One of MODELS
+    T : Temperature                                             - [K]
+
+    Output:
+    log10(gamma)                                                - (I.shape + (n_species))
+    '''
+    z = np.asarray(charge, dtype=float)
+    I = np.asarray(I, dtype=float)[..., None]
+    root = np.sqrt(I)
+    A, B = debye_huckel_constants(T)
+    if model == 'ideal':
+        return np.zeros(I.shape[:-1] + z.shape)
+    if model == 'davies':
+        return -A*z**2*(root/(1 + root) - 0.3*I)
+    if model == 'debye_huckel':
+        a = np.array([ion_size.get(name, 4.0) for name in species])
+        return -A*z**2*root/(1 + B*a*root)
+    if model == 'pitzer':
+        p = pitzer_parameters
+        f = -A*np.log(10)/3*(root/(1 + p['b']*root) + 2/p['b']*np.log(1 + p['b']*root))
+        x = p['alpha']*root
+        with np.errstate(divide='ignore', invalid='ignore'):
+            g = np.where(x > 0, 2*(1 - (1 + x)*np.exp(-x))/np.where(x > 0, x, 1)**2, 1)
+        mean = f + I*(2*p['beta0'] + p['beta1']*(g + np.exp(-x))) + 1.5*I**2*p['C_phi']     # ln(gamma_+-) of KOH
+        salt = np.array([name in ('K^+', 'OH^-') for name in species])
+        return np.where(salt, mean, z**2*f)/np.log(10)
+    raise ValueError(f'Unknown activity model {model}, use one of {MODELS}')
+
+# log10 of the activity of water in a solution of KOH
+def log_water_activity(I, model='ideal', T=298.15):
+    '''
+    Assumptions:
+    ln(a_w) = -2*m*M_water*phi for the molality m = I of KOH, with the osmotic coefficient phi that belongs to the
+    activity coefficients of log_gamma (Gibbs-Duhem). 'ideal' keeps the activity of water at 1
+
+    Input:
+    I, model, T : See log_gamma
+
+    Output:
+    log10(a_w)                                                  - (I.shape)
+    '''
+    I = np.asarray(I, dtype=float)
+    root = np.sqrt(I)
+    A, B = debye_huckel_constants(T)
+    alpha = A*np.log(10)
+    if model == 'ideal':
+        return np.zeros(I.shape)
+    if model == 'davies':
+        phi = 1 - alpha*root/3*_sigma(root) + 0.15*alpha*I
+    elif model == 'debye_huckel':
+        phi = 1 - alpha*root/3*_sigma(B*(ion_size['K^+'] + ion_size['OH^-'])/2*root)
+    elif model == 'pitzer':
+        p = pitzer_parameters
+        phi = 1 - alpha/3*root/(1 + p['b']*root) + I*(p['beta0'] + p['beta1']*np.exp(-p['alpha']*root)) + I**2*p['C_phi']
+    else:
+        raise ValueError(f'Unknown activity model {model}, use one of {MODELS}')
+    return -2*I*M_water*phi/np.log(10)
+
+def _sigma(x):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma = 3/x**3*(1 + x - 2*np.log(1 + x) - 1/(1 + x))
+    return np.where(x < 1e-3, 1 - 1.5*x + 1.8*x**2, sigma)
+
+# The change of log10(Q) of the reactions from the activity coefficients and the activity of water
+def reaction_activity_shift(db, I, model='ideal', T=None, reactions=None):
+    '''
+    Assumptions:
+    pH is -log10 of the activity of H^+, and OH^- has the activity Kw*a_w/a_H from Kw = a_H*a_OH/a_w, so OH^- only
+    needs the correction for the activity of water. The other dissolved species have the concentration 10^-pZn and the
+    activity gamma*10^-pZn, and water has the activity a_w
+
+    Input:
+    db : ThermoDatabase
+    I, model : See log_gamma
+    T : Temperature, the reference temperature if None      - [K]
+    reactions : Names of the reactions, all reactions of db if None
+
+    Output:
+    Sum of nu*log10(gamma) over the dissolved species plus (nu_H2O + nu_OH)*log10(a_w), added to log10(Q)
+    - (I.shape + (n_reactions))
+    '''
+    T = db.T_ref if T is None else float(T)
+    names = db.species_names
+    reactions = db.reaction_names if reactions is None else list(reactions)
+    nu = db.stoichiometry[[db.reaction_index[name] for name in reactions]]
+    dissolved = [j for j, name in enumerate(names) if db.species[name]['phase'] == 'aq' and name not in ('H^+', 'OH^-')]
+    gamma = log_gamma([names[j] for j in dissolved], [db.species[names[j]].get('charge', 0) for j in dissolved], I, model, T)
+    shift = gamma @ nu[:, dissolved].T
+    water = sum(nu[:, names.index(name)] for name in ('H2O', 'OH^-') if name in names)
+    return shift + log_water_activity(I, model, T)[..., None]*water
+
+# The pH of a KOH solution, on the activity scale of the Pourbaix diagrams
+def alkaline_pH(c_KOH, model='ideal', T=None, db=None, method='deltaG_T2'):
+    '''
+    Input:
+    c_KOH : Molality of KOH, a number or an array               - [mol/kg]
+    model : See log_gamma
+    T : Temperature, the reference temperature if None      - [K]
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    method : As for ThermoDatabase.logK
+
+    Output:
+    pH = pKw + log10(gamma_OH*c_KOH) - log10(a_w), from Kw = a_H*a_OH/a_w  - (c_KOH.shape)
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    T = db.T_ref if T is None else float(T)
+    c_KOH = np.asarray(c_KOH, dtype=float)
+    pKw = -float(np.ravel(db.logK(['W'], np.array([T]), method))[0])
+    return pKw + log_gamma(['OH^-'], [-1], c_KOH, model, T)[..., 0] + np.log10(c_KOH) - log_water_activity(c_KOH, model, T)
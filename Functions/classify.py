@@ -0,0 +1,148 @@
+import numpy as np
+from Functions.pourbaix import energy_planes_T, domain_polygons
+
+class PointClassifier:
+    '''
+    Index for the predominating species at many (pH, E, T, pZn) points.
+
+    For every bucket of the (T, pZn) grid the exact boundaries of the diagram are sorted into slabs: vertical strips
+    between the pH of the vertices, in which the boundaries do not cross and can be ordered by E. A point is classified
+    with one binary search for its slab and one among the boundaries of the slab, so O(log n) per point.
+    Points are given the bucket with the nearest T and pZn, and the classification is exact for that bucket.
+    '''
+
+    def __init__(self, db=None, species=None, T=None, pZn=(6,), pH_range=(0, 16), E_range=(-2.5, 2.5), method='deltaG_T2', element='Zn'):
+        '''
+        INPUT:
+        db: ThermoDatabase, Data.thermodynamic_data.database() if None
+        species, method, element: See Functions.pourbaix.energy_planes
+        T: The temperatures of the buckets, the reference temperature if None           - [K]
+        pZn: The pZn of the buckets, sorted
+        pH_range, E_range: The window, points outside are given the label -1
+        '''
+        if db is None:
+            from Data.thermodynamic_data import database
+            db = database()
+        self.T = np.atleast_1d(np.asarray(db.T_ref if T is None else T, dtype=float))
+        self.pZn = np.unique(np.asarray(pZn, dtype=float))
+        self.pH_range = pH_range
+        self.E_range = E_range
+        self.method = method
+
+        species, a, b, c = energy_planes_T(db, species, self.T, 0, method, element)
+        self.species = species
+        dissolved_shift = np.array([db.species[name]['phase'] == 'aq' for name in species])/np.array([db.species[name][element] for name in species])
+        RTln10 = db.constants['R']*self.T*np.log(10)
+
+        (x0, x1), (y0, y1) = pH_range, E_range
+        self._span = 2*(x1 - x0)                        # Separates the buckets in the combined slab key
+        breaks, slabs = [], []
+        for k in range(len(self.T)):
+            for j, pZn_value in enumerate(self.pZn):
+                x, slab = _slabs(species, a[k] - dissolved_shift*RTln10[k]*pZn_value, b[k], c, pH_range, E_range)
+                breaks.append((k*len(self.pZn) + j)*self._span + x - x0)
+                slabs += slab + [([], [], [-1])]        # The gap to the next bucket
+        self._breaks = np.concatenate(breaks)
+        width = max(len(slope) for slope, _, _ in slabs)
+        self._slope = np.zeros((len(slabs), max(width, 1)))
+        self._intercept = np.full((len(slabs), max(width, 1)), np.inf)      # Missing boundaries are above every point
+        self._labels = np.full((len(slabs), max(width, 1) + 1), -1, dtype=np.int16)
+        for s, (slope, intercept, labels) in enumerate(slabs):
+            self._slope[s, :len(slope)] = slope
+            self._intercept[s, :len(intercept)] = intercept
+            self._labels[s, :len(labels)] = labels
+
+    def classify(self, pH, E, T=None, pZn=None, chunk=1000000):
+        '''
+        INPUT:
+        pH, E: The points, arrays of any shape that broadcast
+        T, pZn: Temperature and pZn of the points, the first bucket if None - [K]
+        chunk: Number of points classified at a time, to limit the memory of the temporary arrays
+
+        RETURNS:
+        Index in species of the predominating species, -1 outside the window - (the shape of the points)
+        '''
+        T = self.T[0] if T is None else T
+        pZn = self.pZn[0] if pZn is None else pZn
+        pH, E, T, pZn = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (pH, E, T, pZn)))
+        labels = np.empty(pH.shape, dtype=np.int16)
+        flat = [value.reshape(-1) for value in (pH, E, T, pZn)]
+        out = labels.reshape(-1)
+        for start in range(0, out.size, chunk):
+            part = slice(start, start + chunk)
+            out[part] = self._classify(*(value[part] for value in flat))
+        return labels
+
+    def classify_chunks(self, chunks):
+        '''
+        Classifies streamed input, e.g. the blocks of a large log file
+
+        INPUT:
+        chunks: Iterable of (pH, E) or (pH, E, T) or (pH, E, T, pZn)
+
+        RETURNS:
+        Generator of the labels of every chunk
+        '''
+        for chunk in chunks:
+            yield self.classify(*chunk)
+
+    def species_of(self, labels):
+        '''The names of the labels, '' for points outside the window'''
+        return np.append(np.array(self.species), '')[labels]
+
+    def _classify(self, pH, E, T, pZn):
+        bucket = _nearest(self.T, T)*len(self.pZn) + _nearest(self.pZn, pZn)
+        slab = np.searchsorted(self._breaks, bucket*self._span + pH - self.pH_range[0], side='right') - 1
+        slab -= pH >= self.pH_range[1]                  # The end of the window belongs to the last slab
+
+        # Number of boundaries of the slab below the point, by binary search
+        lo, hi = np.zeros(len(pH), dtype=np.int64), np.full(len(pH), self._slope.shape[1])
+        while np.any(lo < hi):
+            active = lo < hi
+            mid = (lo + hi)//2
+            midpoint = np.minimum(mid, self._slope.shape[1] - 1)
+            below = self._slope[slab, midpoint]*pH + self._intercept[slab, midpoint] <= E
+            lo = np.where(active & below, mid + 1, lo)
+            hi = np.where(active & ~below, mid, hi)
+
+        labels = self._labels[slab, lo]
+        (x0, x1), (y0, y1) = self.pH_range, self.E_range
+        return np.where((pH >= x0) & (pH <= x1) & (E >= y0) & (E <= y1), labels, -1)
+
+    def __repr__(self):
+        return f'PointClassifier({len(self.species)} species, {len(self.T)} x {len(self.pZn)} buckets, {len(self._labels)} slabs)'
+
+def _nearest(grid, values):
+    if len(grid) == 1:
+        return np.zeros(len(values), dtype=np.int64)
+    return np.searchsorted((grid[1:] + grid[:-1])/2, values)
+
+# The slabs of one diagram
+def _slabs(species, a, b, c, pH_range, E_range):
+    '''
+    Output:
+    x : The pH where the slabs start, the last value is the end of the window
+    slabs : [(slope, intercept, labels)] per slab, the boundaries E = slope*pH + intercept ordered upwards and the
+            species between them, from the bottom of the window to the top
+    '''
+    (x0, x1), (y0, y1) = pH_range, E_range
+    boundaries = domain_polygons(species, a, b, c, pH_range, E_range)[1]
+    segments = [np.array(ends) for ends in boundaries.values()]
+    x = np.unique(np.concatenate([[x0, x1]] + [segment[:, 0] for segment in segments]))
+    x = x[np.concatenate([[True], np.diff(x) > 1e-12*(x1 - x0)])]
+
+    slabs = []
+    for left, right in zip(x[:-1], x[1:]):
+        middle = (left + right)/2
+        lines = []
+        for (P, Q) in segments:
+            if abs(Q[0] - P[0]) <= 1e-12*(x1 - x0) or min(P[0], Q[0]) > middle or max(P[0], Q[0]) < middle:
+                continue                                # Vertical or outside the slab
+            slope = (Q[1] - P[1])/(Q[0] - P[0])
+            lines.append((slope*middle + P[1] - slope*P[0], slope, P[1] - slope*P[0]))
+        lines.sort()
+        levels = [y0] + [y for y, _, _ in lines] + [y1]
+        E_middle = (np.array(levels[:-1]) + np.array(levels[1:]))/2
+        labels = (a[:, None] + b[:, None]*middle + c[:, None]*E_middle[None, :]).argmin(axis=0)
+        slabs.append(([slope for _, slope, _ in lines], [intercept for _, _, intercept in lines], list(labels)))
+    return x, slabs
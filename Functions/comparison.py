@@ -0,0 +1,126 @@
+import numpy as np
+from Functions.pourbaix import PredominanceMap, energy_planes, lowest_line, domain_polygons, phase_model_species
+
+class PhaseModelComparison:
+    '''
+    The predominance maps of several phase models on the same grid, labelled with the same species list so the maps
+    can be compared point by point, and the exact domains of every model for the boundary metrics.
+    '''
+
+    def __init__(self, pH, E, labels, species, models, domains, T, pZn, method):
+        '''
+        INPUT:
+        pH, E: The grid                                         - (n_pH), [V vs SHE] - (n_E)
+        labels: Index in species of the predominating species   - (n_models x n_E x n_pH)
+        species: Names of the species of all the models
+        models: Names of the phase models, the order of labels
+        domains: {model: (polygons, boundaries, triple_points)}, see Functions.pourbaix.domain_polygons
+        T, pZn, method: The temperature, -log10 of the activity of the dissolved species and the method
+        '''
+        self.pH = pH
+        self.E = E
+        self.labels = labels
+        self.species = list(species)
+        self.models = list(models)
+        self.domains = domains
+        self.T = T
+        self.pZn = pZn
+        self.method = method
+
+    def map(self, model):
+        '''The PredominanceMap of a model'''
+        return PredominanceMap(self.pH, self.E, self.labels[self.models.index(model)], self.species, self.T, self.pZn, self.method)
+
+    def passive(self, model):
+        '''The species that only this model has, e.g. the passivating phase'''
+        shared = set.intersection(*(set(polygons) for polygons, _, _ in self.domains.values()))
+        return [name for name in self.domains[model][0] if name not in shared]
+
+    def difference(self, model_a, model_b):
+        '''Where the predominating species differs between two models  - (n_E x n_pH)'''
+        return self.labels[self.models.index(model_a)] != self.labels[self.models.index(model_b)]
+
+    def changed(self):
+        '''Where any two of the models disagree                         - (n_E x n_pH)'''
+        return (self.labels != self.labels[:1]).any(axis=0)
+
+    def area_changed(self, model_a, model_b):
+        '''Fraction of the grid and area where the models differ        - [-], [pH*V]'''
+        fraction = self.difference(model_a, model_b).mean()
+        return fraction, fraction*(self.pH[-1] - self.pH[0])*(self.E[-1] - self.E[0])
+
+    def boundary_shifts(self, model_a, model_b):
+        '''
+        The boundaries of both models, with the model specific species called 'passive' so they can be matched
+
+        RETURNS:
+        {(species, species): (shift in pH, shift in E)} of the midpoints of the boundaries, from model_a to model_b
+        '''
+        a, b = self._midpoints(model_a), self._midpoints(model_b)
+        return {pair: tuple(np.subtract(b[pair], a[pair])) for pair in a if pair in b}
+
+    def summary(self):
+        '''
+        RETURNS:
+        {'area_changed': {(model, model): (fraction, area)}, 'boundary_shifts': {(model, model): {...}},
+         'passive_area': {model: area of the model specific domains}, 'passive_pH': {model: (min, max) pH of them}}
+        '''
+        pairs = [(a, b) for k, a in enumerate(self.models) for b in self.models[k + 1:]]
+        summary = {'area_changed': {pair: self.area_changed(*pair) for pair in pairs},
+                   'boundary_shifts': {pair: self.boundary_shifts(*pair) for pair in pairs},
+                   'passive_area': {}, 'passive_pH': {}}
+        for model in self.models:
+            polygons = [self.domains[model][0][name] for name in self.passive(model)]
+            x, y = (np.concatenate([vertices[:, k] for vertices in polygons]) if polygons else np.array([np.nan]) for k in (0, 1))
+            summary['passive_area'][model] = sum(0.5*abs(v[:, 0] @ np.roll(v[:, 1], -1) - v[:, 1] @ np.roll(v[:, 0], -1)) for v in polygons)
+            summary['passive_pH'][model] = (np.min(x), np.max(x))
+        return summary
+
+    def _midpoints(self, model):
+        passive = set(self.passive(model))
+        return {tuple(sorted('passive' if name in passive else name for name in pair)): np.mean(ends, axis=0)
+                for pair, ends in self.domains[model][1].items()}
+
+    def __repr__(self):
+        return f'PhaseModelComparison({", ".join(self.models)}, {self.changed().mean():.1%} of the grid differs, T = {self.T} K, pZn = {self.pZn})'
+
+# All phase models in one pass
+def compare_phase_models(db=None, models=('eps', 'aq', 'ox'), T=None, pZn=6, pH=None, E=None, method='deltaG_T2', element='Zn'):
+    '''
+    Assumptions:
+    The energy planes of all species of all the models are computed once. Every model is the same set of planes with
+    the species it does not have lifted far above the others, so the rows of all models are labelled in one call of
+    Functions.pourbaix.lowest_line
+
+    Input:
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    models : Names of phase models in Data.thermodynamic_data.phase_models
+    T, pZn, method, element : See Functions.pourbaix.energy_planes
+    pH : Increasing pH values, np.arange(0, 16, 0.01) if None
+    E : The potentials, np.linspace(-1.5, 1.5, 1000) if None   - [V vs SHE]
+
+    Output:
+    PhaseModelComparison
+    '''
+    from Data.thermodynamic_data import phase_models
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    pH = np.arange(0, 16, 0.01) if pH is None else np.asarray(pH, dtype=float)
+    E = np.linspace(-1.5, 1.5, 1000) if E is None else np.asarray(E, dtype=float)
+    members = {model: set(phase_model_species(db, phase_models[model], element)) for model in models}
+    species = [name for name in db.species_names if any(name in names for names in members.values())]
+    species, a, b, c = energy_planes(db, species, T, pZn, method, element)
+
+    excluded = np.array([[name not in members[model] for name in species] for model in models])
+    lift = 1e3*(np.abs(a).max() + np.abs(b).max()*np.abs(pH).max() + np.abs(c).max()*np.abs(E).max())
+    alpha = a + c*E[:, None] + lift*excluded[:, None, :]                # (n_models x n_E x n_species)
+    beta = np.broadcast_to(b, alpha.shape)
+    labels = lowest_line(alpha.reshape(-1, len(species)), beta.reshape(-1, len(species)), pH).reshape(len(models), len(E), len(pH))
+
+    domains = {}
+    for k, model in enumerate(models):
+        keep = ~excluded[k]
+        domains[model] = domain_polygons([name for name, flag in zip(species, keep) if flag], a[keep], b[keep], c[keep],
+                                         (pH[0], pH[-1]), (E[0], E[-1]))
+    return PhaseModelComparison(pH, E, labels, species, models, domains, db.T_ref if T is None else float(T), pZn, method)
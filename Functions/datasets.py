@@ -0,0 +1,169 @@
+import json
+import os
+from functools import lru_cache
+import numpy as np
+from Functions.heat_capacity import models
+
+# Folder with the dataset files, one JSON file per dataset named <name>.json
+dataset_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Data', 'datasets')
+
+PHASES = ('s', 'aq', 'l', 'g')      # Solid, dissolved, liquid and gas
+
+'''
+Schema of a dataset file:
+
+{
+    "name": "revised_pourbaix",                 -- Required, the same as the file name
+    "description": "...",                       -- Optional
+    "base": "other_dataset",                    -- Optional, the species of the base dataset are used and can be changed or extended
+    "reference_temperature": 298.15,            -- [K], required unless a base is given
+    "units": {...},                             -- Optional, only documentation
+    "species": {
+        "Zn(OH)3^-": {
+            "phase": "aq",                      -- One of PHASES
+            "composition": {"Zn": 1, "O": 3, "H": 3},
+            "charge": -1,
+            "deltaG": -696520.0,                -- [J/mol]   - Gibbs free energy of formation at the reference temperature
+            "S": 40.0,                          -- [J/K*mol] - Entropy at the reference temperature
+            "Cp": [94.0, 0.0, 0.0],             -- [J/K*mol] - Heat capacity coefficients of cp_model
+            "cp_model": "maier_kelley",         -- Optional, a model in Functions.heat_capacity, Maier-Kelley (Cp = a + b*T + c/T^2) if not given
+            "source": "REVISED POURBAIX"        -- Optional, where the values come from
+        }
+    }
+}
+
+With a base, a species entry only needs the fields that are changed.
+'''
+DATASET_FIELDS = {'name': str, 'description': str, 'base': str, 'reference_temperature': (int, float), 'units': dict, 'species': dict}
+SPECIES_FIELDS = {'phase': str, 'composition': dict, 'charge': int, 'deltaG': (int, float), 'S': (int, float), 'Cp': list, 'cp_model': str, 'source': str}
+REQUIRED_SPECIES_FIELDS = ('phase', 'composition', 'charge', 'deltaG', 'S', 'Cp')
+
+class Dataset:
+    '''
+    Formation data of the species in a dataset, both as the dictionaries used by the scripts
+    (e.g. deltaG_formation['deltaG_Zn^2+']) and as contiguous arrays with one entry per species.
+    '''
+
+    def __init__(self, name, description, reference_temperature, species_data):
+        self.name = name
+        self.description = description
+        self.reference_temperature = reference_temperature
+        self.sources = {name: entry.get('source', '') for name, entry in species_data.items()}
+
+        # Arrays, one row per species in the order of the file
+        self.species_names = list(species_data)
+        self.elements = sorted({element for entry in species_data.values() for element in entry['composition']})
+        self.G = np.ascontiguousarray([entry['deltaG'] for entry in species_data.values()], dtype=float)        # [J/mol]   - (n_species)
+        self.S = np.ascontiguousarray([entry['S'] for entry in species_data.values()], dtype=float)             # [J/K*mol] - (n_species)
+        self.cp_models = {name: (entry.get('cp_model', 'maier_kelley'), np.array(entry['Cp'], dtype=float)) for name, entry in species_data.items()}
+        self.Cp = np.ascontiguousarray([_maier_kelley(*self.cp_models[name], reference_temperature) for name in self.species_names])  # [J/K*mol] - (n_species x 3)
+        self.charge = np.ascontiguousarray([entry['charge'] for entry in species_data.values()], dtype=float)   # [-]       - (n_species)
+        self.phase = np.array([entry['phase'] for entry in species_data.values()])                              # (n_species)
+        self.composition = np.ascontiguousarray([[entry['composition'].get(element, 0) for element in self.elements]
+                                                 for entry in species_data.values()], dtype=float)              # (n_species x n_elements)
+
+        # Dictionaries in the format of Data.thermodynamic_data
+        self.species = {name: {'phase': entry['phase'], **{element: entry['composition'].get(element, 0) for element in self.elements},
+                               'charge': entry['charge']} for name, entry in species_data.items()}
+        self.deltaG_formation = {'deltaG_' + name: G for name, G in zip(self.species_names, self.G)}
+        self.S_formation = {'S_' + name: S for name, S in zip(self.species_names, self.S)}
+        self.constants_Cp = {'Cp_' + name: Cp for name, Cp in zip(self.species_names, self.Cp)}
+
+    def database(self, reactions, constants):
+        '''
+        Input:
+        reactions : The reactions, see Data.thermodynamic_data.reactions
+        constants : Dictionary with 'R' and 'F', the reference temperature is taken from the dataset
+
+        Output:
+        ThermoDatabase for this dataset
+        '''
+        from Functions.thermo_database import ThermoDatabase
+        constants = dict(constants, T=self.reference_temperature)
+        return ThermoDatabase(self.species, reactions, self.deltaG_formation, self.S_formation, self.constants_Cp, constants, self.cp_models)
+
+    def __repr__(self):
+        return f'Dataset({self.name!r}, {len(self.species_names)} species)'
+
+def available_datasets():
+    '''
+    Output:
+    The names of the datasets in dataset_dir
+    '''
+    return sorted(name[:-5] for name in os.listdir(dataset_dir) if name.endswith('.json'))
+
+def load_dataset(name):
+    '''
+    Input:
+    name : Name of a dataset in dataset_dir, or the path to a dataset file
+
+    Output:
+    Dataset, validated against the schema. Files are only read again if they have changed
+    '''
+    path = name if name.endswith('.json') else os.path.join(dataset_dir, name + '.json')
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No dataset '{name}', the available datasets are {available_datasets()}")
+    return _load(os.path.abspath(path), os.path.getmtime(path))
+
+@lru_cache(maxsize=None)
+def _load(path, mtime):
+    name, description, reference_temperature, species_data = _read(path, ())
+    return Dataset(name, description, reference_temperature, species_data)
+
+def _read(path, visited):
+    # Reads a dataset file and its base datasets, returning the merged species entries
+    if path in visited:
+        raise ValueError(f'Circular base datasets: {visited + (path,)}')
+    with open(path) as file:
+        content = json.load(file)
+    _check_fields(content, DATASET_FIELDS, path)
+    for field in ('name', 'species'):
+        if field not in content:
+            raise ValueError(f"{path}: missing '{field}'")
+
+    if 'base' in content:
+        base_path = os.path.join(os.path.dirname(path), content['base'] + '.json')
+        _, _, reference_temperature, species_data = _read(base_path, visited + (path,))
+        species_data = {name: dict(entry) for name, entry in species_data.items()}
+    elif 'reference_temperature' in content:
+        reference_temperature, species_data = None, {}
+    else:
+        raise ValueError(f"{path}: missing 'reference_temperature'")
+    reference_temperature = float(content.get('reference_temperature', reference_temperature))
+
+    for name, entry in content['species'].items():
+        _check_fields(entry, SPECIES_FIELDS, f'{path}, species {name}')
+        species_data.setdefault(name, {}).update(entry)
+    for name, entry in species_data.items():
+        _check_species(name, entry, path)
+    return content['name'], content.get('description', ''), reference_temperature, species_data
+
+def _check_fields(content, fields, where):
+    for field, value in content.items():
+        if field not in fields:
+            raise ValueError(f"{where}: unknown field '{field}'")
+        if not isinstance(value, fields[field]) or isinstance(value, bool):
+            raise ValueError(f"{where}: '{field}' has the wrong type {type(value).__name__}")
+
+def _check_species(name, entry, path):
+    where = f'{path}, species {name}'
+    missing = [field for field in REQUIRED_SPECIES_FIELDS if field not in entry]
+    if missing:
+        raise ValueError(f'{where}: missing {missing}')
+    if entry['phase'] not in PHASES:
+        raise ValueError(f"{where}: phase must be one of {PHASES}, not '{entry['phase']}'")
+    model = models.get(entry.get('cp_model', 'maier_kelley'))
+    if model is None:
+        raise ValueError(f"{where}: unknown cp_model '{entry['cp_model']}', use one of {list(models)}")
+    if len(entry['Cp']) not in model.n_coefficients:
+        raise ValueError(f'{where}: Cp must have {model.n_coefficients} coefficients for the {model.name} model')
+    numbers = [entry['deltaG'], entry['S'], *entry['Cp'], *entry['composition'].values()]
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) and np.isfinite(value) for value in numbers):
+        raise ValueError(f'{where}: deltaG, S, Cp and the composition must be finite numbers')
+
+def _maier_kelley(model, coefficients, T_ref):
+    # The coefficients [a, b, c] used by the methods in Functions.Functions. Other models are given as the constant Cp at T_ref,
+    # the exact model is only used by method='heat_capacity'
+    if model == 'maier_kelley':
+        return coefficients
+    return np.array([models[model].Cp(coefficients[None, :], np.array([[T_ref]]))[0, 0], 0, 0])
@@ -0,0 +1,72 @@
+import numpy as np
+
+# The reactions in Data.thermodynamic_data behind the equilibrium constants of the solution scripts (Zn_NH3_solution.py,
+# Try_own_script.py), as {key: {reaction: coefficient}} so that log(K_key) = sum(coefficient*log(K_reaction)).
+# The keys follow the way the constants are used in the scripts, e.g. c_HCO3 = c_CO3*c_H*K_HCO3 is the reverse of Ka2.
+# Keys that are not listed (NH3, ZnCO3, the ammine complexes and the fluorides) have no data and keep their 25 degree values
+temperature_reactions = {
+    'Zn(OH)':    {'beta1': 1},      # Zn^2+ + OH^- <--> Zn(OH)^+
+    'ZnOH':      {'beta1': 1},
+    'ZnOH2_aq':  {'VIII': 1},       # Zn^2+ + 2OH^- <--> Zn(OH)2(aq)
+    'Zn(OH)3':   {'beta3': 1},      # Zn^2+ + 3OH^- <--> Zn(OH)3^-
+    'ZnOH3':     {'beta3': 1},
+    'Zn(OH)4':   {'beta4': 1},      # Zn^2+ + 4OH^- <--> Zn(OH)4^2-
+    'ZnOH4':     {'beta4': 1},
+    'ZnOH2_sat': {'VIII-eps': -1},  # Zn(OH)2(s) <--> Zn^2+ + 2OH^-
+    'ZnO':       {'VIII-ox': -1},   # ZnO(s) + H2O <--> Zn^2+ + 2OH^-
+    'H2CO3':     {'Ka1': -1},       # HCO3^- + H^+ <--> CO2(aq) + H2O
+    'HCO3':      {'Ka2': -1},       # CO3^2- + H^+ <--> HCO3^-
+    'pCO2':      {'KH': 1},         # CO2(g) <--> CO2(aq)
+    'Kw':        {'W': 1},          # H2O <--> H^+ + OH^-
+}
+
+# Change of log(K) from the reference temperature for a temperature grid
+def logK_table(T, keys=None, db=None, method='deltaG_T2'):
+    '''
+    Assumptions:
+    The 25 degree constants of the scripts are kept, only the change with temperature is taken from the database
+
+    Input:
+    T : The temperatures                                        - [K] - (n_T)
+    keys : The keys of temperature_reactions, all if None
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    method : As for ThermoDatabase.logK
+
+    Output:
+    Dictionary with 'T' and log(K(T)) - log(K(T_ref)) for every key - (n_T)
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    keys = list(temperature_reactions) if keys is None else [key for key in keys if key in temperature_reactions]
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+
+    # One call for all reactions and temperatures
+    names = sorted({name for key in keys for name in temperature_reactions[key]})
+    shift = db.logK(names, T, method) - db.logK(names, np.array([db.T_ref]), method)
+    shift = dict(zip(names, shift))
+
+    table = {'T': T}
+    for key in keys:
+        table[key] = sum(coefficient*shift[name] for name, coefficient in temperature_reactions[key].items())
+    return table
+
+# The equilibrium constants of a script at the temperature T
+def constants_at_T(equilibrium_constants, T, db=None, method='deltaG_T2', table=None):
+    '''
+    Input:
+    equilibrium_constants : The constants at 25 degrees, {key: K}
+    T : Temperature                                             - [K]
+    db, method : See logK_table, not used if table is given
+    table : A table from logK_table, interpolated linearly in T instead of calling the database
+
+    Output:
+    {key: K(T)} with K(T) = K(25 degrees)*10**(log(K(T)) - log(K(T_ref))), unchanged for keys without data
+    '''
+    keys = [key for key in equilibrium_constants if key in temperature_reactions]
+    if table is None:
+        table = logK_table(T, keys, db, method)
+        shift = {key: table[key][0] for key in keys}
+    else:
+        shift = {key: np.interp(T, table['T'], table[key]) for key in keys}
+    return {key: K*10**shift[key] if key in shift else K for key, K in equilibrium_constants.items()}
@@ -0,0 +1,116 @@
+import numpy as np
+
+class HeatCapacityModel:
+    '''
+    A heat capacity model, given by Cp(T) and the antiderivatives of Cp and Cp/T in temperature.
+    All functions take the coefficients as (n_species x n_coefficients) and the temperatures as (1 x n_T)
+    and return (n_species x n_T), so that a whole group of species is evaluated in one call.
+    '''
+
+    def __init__(self, name, n_coefficients, Cp, H, S):
+        '''
+        INPUT:
+        name: Name used in the datasets, e.g. 'shomate'
+        n_coefficients: Allowed numbers of coefficients, e.g. (5,)
+        Cp: Cp(c, T)                                - [J/K*mol]
+        H: Antiderivative of Cp, H(c, T)            - [J/mol]
+        S: Antiderivative of Cp/T, S(c, T)          - [J/K*mol]
+        '''
+        self.name = name
+        self.n_coefficients = tuple(n_coefficients)
+        self.Cp = Cp
+        self.H = H
+        self.S = S
+
+    def __repr__(self):
+        return f'HeatCapacityModel({self.name!r})'
+
+# The models, new models are added with register_model
+models = {}
+
+def register_model(model):
+    models[model.name] = model
+    return model
+
+# Constant heat capacity: Cp = a
+register_model(HeatCapacityModel(
+    'constant', (1,),
+    Cp=lambda c, T: c[:, [0]]*np.ones_like(T),
+    H=lambda c, T: c[:, [0]]*T,
+    S=lambda c, T: c[:, [0]]*np.log(T),
+))
+
+# Maier-Kelley, as used by REVISED POURBAIX: Cp = a + b*T + c/T^2
+register_model(HeatCapacityModel(
+    'maier_kelley', (3,),
+    Cp=lambda c, T: c[:, [0]] + c[:, [1]]*T + c[:, [2]]/T**2,
+    H=lambda c, T: c[:, [0]]*T + c[:, [1]]*T**2/2 - c[:, [2]]/T,
+    S=lambda c, T: c[:, [0]]*np.log(T) + c[:, [1]]*T - c[:, [2]]/(2*T**2),
+))
+
+# Shomate, as used by the NIST Chemistry WebBook: Cp = A + B*t + C*t^2 + D*t^3 + E/t^2 with t = T/1000
+register_model(HeatCapacityModel(
+    'shomate', (5,),
+    Cp=lambda c, T: c[:, [0]] + c[:, [1]]*(T/1000) + c[:, [2]]*(T/1000)**2 + c[:, [3]]*(T/1000)**3 + c[:, [4]]/(T/1000)**2,
+    H=lambda c, T: 1000*(c[:, [0]]*(T/1000) + c[:, [1]]*(T/1000)**2/2 + c[:, [2]]*(T/1000)**3/3 + c[:, [3]]*(T/1000)**4/4 - c[:, [4]]/(T/1000)),
+    S=lambda c, T: c[:, [0]]*np.log(T/1000) + c[:, [1]]*(T/1000) + c[:, [2]]*(T/1000)**2/2 + c[:, [3]]*(T/1000)**3/3 - c[:, [4]]/(2*(T/1000)**2),
+))
+
+# NASA 7-coefficient polynomials: Cp/R = a1 + a2*T + a3*T^2 + a4*T^3 + a5*T^4. a6 and a7 are integration constants and are not
+# needed for the changes with temperature, so five or seven coefficients can be given. Only one temperature range is supported
+_R = 8.31451    # [J/(K*mol)] - The same value as in Data.thermodynamic_data
+register_model(HeatCapacityModel(
+    'nasa7', (5, 7),
+    Cp=lambda c, T: _R*sum(c[:, [k]]*T**k for k in range(5)),
+    H=lambda c, T: _R*sum(c[:, [k]]*T**(k + 1)/(k + 1) for k in range(5)),
+    S=lambda c, T: _R*(c[:, [0]]*np.log(T) + sum(c[:, [k]]*T**k/k for k in range(1, 5))),
+))
+
+# Integrals of the heat capacity for all species, grouped by model so that every model is one vectorized call
+def species_integrals(cp_models, T1, T):
+    '''
+    Input:
+    cp_models : The heat capacity of every species as a list of (model name, coefficients)
+    T1 : The reference temperature                              - [K]
+    T : The temperatures                                        - [K] - (n_T)
+
+    Output:
+    H : Integral of Cp from T1 to T                             - [J/mol]   - (n_species x n_T)
+    S : Integral of Cp/T from T1 to T                           - [J/K*mol] - (n_species x n_T)
+    '''
+    T = np.atleast_1d(np.asarray(T, dtype=float))[None, :]
+    T1 = np.array([[T1]], dtype=float)
+    H = np.zeros((len(cp_models), T.shape[1]))
+    S = np.zeros((len(cp_models), T.shape[1]))
+
+    groups = {}
+    for i, (name, coefficients) in enumerate(cp_models):
+        groups.setdefault((name, len(coefficients)), []).append(i)
+    for (name, _), rows in groups.items():
+        model = models[name]
+        c = np.array([cp_models[i][1] for i in rows], dtype=float)
+        H[rows] = model.H(c, T) - model.H(c, T1)
+        S[rows] = model.S(c, T) - model.S(c, T1)
+    return H, S
+
+# Reaction enthalpy, entropy and Gibbs free energy at the temperatures T
+def reaction_thermo_T(nu, deltaH_1, deltaS_1, cp_models, T1, T):
+    '''
+    Assumptions:
+    No phase transitions between T1 and T, and the heat capacity models are valid in the whole range
+
+    Input:
+    nu : Stoichiometry matrix                                   - (n_reactions x n_species)
+    deltaH_1 : The reaction enthalpies at T1                    - [J/mol]   - (n_reactions)
+    deltaS_1 : The reaction entropies at T1                     - [J/K*mol] - (n_reactions)
+    cp_models : The heat capacity of every species (columns of nu), see species_integrals
+    T1 : The reference temperature (25 degrees)                 - [K]
+    T : The temperatures                                        - [K]       - (n_T)
+
+    Output:
+    deltaH, deltaS, deltaG : The reaction properties at T       - (n_reactions x n_T)
+    '''
+    H, S = species_integrals(cp_models, T1, T)
+    deltaH = np.asarray(deltaH_1, dtype=float)[:, None] + nu @ H
+    deltaS = np.asarray(deltaS_1, dtype=float)[:, None] + nu @ S
+    return deltaH, deltaS, deltaH - np.atleast_1d(np.asarray(T, dtype=float))[None, :]*deltaS
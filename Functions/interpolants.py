@@ -0,0 +1,77 @@
+import numpy as np
+from numpy.polynomial import chebyshev
+
+class ChebyshevTable:
+    '''
+    Chebyshev series of a reaction property in temperature, one series per reaction, all evaluated in one call.
+    '''
+
+    def __init__(self, coefficients, T_min, T_max, reaction_names, max_error, quantity=''):
+        '''
+        INPUT:
+        coefficients: Chebyshev coefficients                            - (degree+1 x n_reactions)
+        T_min, T_max: The temperature range of the fit                  - [K]
+        reaction_names: The reactions, columns of coefficients
+        max_error: Largest deviation from the exact formula per reaction on the verification grid, NaN if not fitted
+        quantity: Name of the property, only used for printing
+        '''
+        self.coefficients = coefficients
+        self.T_min = T_min
+        self.T_max = T_max
+        self.reaction_names = list(reaction_names)
+        self.max_error = max_error
+        self.quantity = quantity
+        self._index = {name: i for i, name in enumerate(self.reaction_names)}
+
+    def __call__(self, T, reactions=None):
+        '''
+        INPUT:
+        T: A temperature or an array of temperatures within [T_min, T_max]  - [K]
+        reactions: A reaction name, a list of names or None for all reactions
+
+        RETURNS:
+        The property - (n_reactions, n_T), without the axes that were not given as lists/arrays
+        '''
+        T = np.asarray(T, dtype=float)
+        if np.any(T < self.T_min - 1e-9) or np.any(T > self.T_max + 1e-9):
+            raise ValueError(f'Temperature outside the fitted range {self.T_min}-{self.T_max} K')
+        coefficients = self.coefficients
+        if isinstance(reactions, str):
+            coefficients = coefficients[:, self._index[reactions]]
+        elif reactions is not None:
+            coefficients = coefficients[:, [self._index[name] for name in reactions]]
+        x = (2*T - (self.T_max + self.T_min))/(self.T_max - self.T_min)     # Mapping the temperature to [-1, 1]
+        return chebyshev.chebval(x, coefficients)
+
+    def __repr__(self):
+        return f'ChebyshevTable({self.quantity}, {self.T_min}-{self.T_max} K, degree {len(self.coefficients)-1}, max error {np.nanmax(self.max_error):.2e})'
+
+# Fitting Chebyshev series to a function of temperature for all reactions
+def fit_chebyshev(function, T_min, T_max, reaction_names, degree=10, n_check=2001, quantity=''):
+    '''
+    Assumptions:
+    The function is smooth on [T_min, T_max], which holds for all the methods in Functions.Functions
+
+    Input:
+    function : Exact property, takes an array of temperatures and returns (n_reactions x n_T)
+    T_min, T_max : The temperature range                        - [K]
+    reaction_names : The reactions, rows of the output of function
+    degree : Degree of the Chebyshev series
+    n_check : Number of equally spaced temperatures used to find the error against function
+
+    Output:
+    ChebyshevTable, with max_error the largest absolute deviation from function on the verification grid
+    '''
+    # Interpolating in the Chebyshev points of the first kind, which is close to the best polynomial approximation
+    x = np.cos(np.pi*(np.arange(degree + 1) + 0.5)/(degree + 1))
+    T = (x*(T_max - T_min) + (T_max + T_min))/2
+    values = function(T)                                    # (n_reactions x degree+1)
+    fitted = np.isfinite(values).all(axis=1)
+
+    coefficients = np.full((degree + 1, len(reaction_names)), np.nan)
+    coefficients[:, fitted] = chebyshev.chebfit(x, values[fitted].T, degree)
+
+    table = ChebyshevTable(coefficients, T_min, T_max, reaction_names, np.full(len(reaction_names), np.nan), quantity)
+    T_check = np.linspace(T_min, T_max, n_check)
+    table.max_error[fitted] = np.max(np.abs(table(T_check)[fitted] - function(T_check)[fitted]), axis=1)
+    return table
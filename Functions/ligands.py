@@ -0,0 +1,129 @@
+import numpy as np
+from Functions.pourbaix import PredominanceMap, energy_planes, lowest_line
+
+class LigandPredominanceMap(PredominanceMap):
+    '''
+    A predominance map that includes the complexes of the element with the ligands of the additives, with the
+    activity of the free ligands that was solved for every pH column.
+    '''
+
+    def __init__(self, pH, E, labels, species, T, pZn, method, totals, log_free):
+        '''
+        INPUT:
+        pH, E, labels, species, T, pZn, method: See Functions.pourbaix.PredominanceMap
+        totals: {ligand: total concentration}                   - [mol/L]
+        log_free: {ligand: log10 of the activity of the free ligand} - (n_pH)
+        '''
+        super().__init__(pH, E, labels, species, T, pZn, method)
+        self.totals = totals
+        self.log_free = log_free
+
+    def __repr__(self):
+        totals = ', '.join(f'{name} = {total:g} M' for name, total in self.totals.items())
+        return f'LigandPredominanceMap({len(self.species)} species, {self.labels.shape[1]} x {self.labels.shape[0]} grid, {totals}, T = {self.T} K, pZn = {self.pZn})'
+
+# Activity of the free ligands at every pH, from the mass balances of the ligands
+def free_ligands(totals, pH, log_hydroxo, pZn=6, pKw=14.0, ligands=None, iterations=80, tolerance=1e-12):
+    '''
+    Assumptions:
+    All dissolved species of the element add up to 10^-pZn, shared between the free ion, its hydroxo complexes and the
+    ligand complexes. The mass balance of a ligand increases with its free activity, so it is solved by bisection in
+    log10 of the activity, for all pH values at once. Several ligands only meet through the free ion and are solved
+    one after the other until the activities do not change
+
+    Input:
+    totals : {ligand: total concentration}                      - [mol/L]
+    pH : The pH values                                          - (n_pH)
+    log_hydroxo : log10 of the hydroxo complexes per free ion, summed, e.g. log10([Zn(OH)3^-]/[Zn^2+]) - (n_pH)
+    pZn : -log10 of the activity of all dissolved species of the element
+    pKw : -log10 of the ion product of water
+    ligands : {ligand: {'protonated': ..., 'complexes': ...}}, Data.thermodynamic_data.ligands if None
+    iterations : Bisection steps per ligand, the interval is halved from 50 decades
+    tolerance : Largest change of log10 of the activities between two rounds over the ligands
+
+    Output:
+    {ligand: log10 of the activity of the free ligand}          - (n_pH)
+    '''
+    if ligands is None:
+        from Data.thermodynamic_data import ligands
+    pH = np.asarray(pH, dtype=float)
+    totals = {name: total for name, total in totals.items() if total > 0}
+    log_free = {name: np.log10(total) + np.zeros_like(pH) for name, total in totals.items()}
+
+    # log10 of the complexes per free ion, without the ligand term       - (n_pH x n_complexes)
+    def complexes(name):
+        n, m, log_beta = (np.array(values, dtype=float) for values in zip(*ligands[name]['complexes'].values()))
+        return n, log_beta + m*(pH[:, None] - pKw)
+
+    def bound_per_ion(name, log_L):
+        n, log_c = complexes(name)
+        terms = 10**(log_c + n*log_L[:, None])
+        return terms.sum(axis=1), (n*terms).sum(axis=1)
+
+    for _ in range(1 if len(totals) < 2 else 100):
+        previous = {name: values.copy() for name, values in log_free.items()}
+        for name, total in totals.items():
+            others = sum((bound_per_ion(other, log_free[other])[0] for other in totals if other != name), np.zeros_like(pH))
+            n_H, m_H, log_K = (np.array(values, dtype=float) for values in zip(*ligands[name]['protonated'].values()))
+            lo, hi = np.full_like(pH, np.log10(total) - 50), np.full_like(pH, np.log10(total))
+            for _ in range(iterations):
+                log_L = (lo + hi)/2
+                protonated = (n_H*10**(log_K + n_H*log_L[:, None] - m_H*pH[:, None])).sum(axis=1)
+                ions, ligand = bound_per_ion(name, log_L)
+                balance = 10**log_L + protonated + 10**-pZn*ligand/(1 + 10**log_hydroxo + others + ions) - total
+                lo, hi = np.where(balance < 0, log_L, lo), np.where(balance < 0, hi, log_L)
+            log_free[name] = (lo + hi)/2
+        if all(np.abs(log_free[name] - previous[name]).max() < tolerance for name in totals):
+            break
+    return log_free
+
+# Predominance map with the complexes of the ligands, one speciation per pH column
+def ligand_predominance_map(db=None, totals=None, species=None, T=None, pZn=6, pH=None, E=None, method='deltaG_T2', element='Zn', ligands=None):
+    '''
+    Assumptions:
+    A complex has the same charge per atom of the element as the free ion, so its energy is the plane of the free ion
+    lowered by RT ln(10)*(log beta + n log[L] + m log[OH^-]), which does not depend on E. With the free ligand from
+    free_ligands, every pH column is a set of lines in E and is labelled with Functions.pourbaix.lowest_line.
+    The constants of the ligands are the 25 degree values, the planes of the element are at T
+
+    Input:
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    totals : {ligand: total concentration}, e.g. {'NH3': 0.5}, no ligands if None - [mol/L]
+    species, T, pZn, method, element : See Functions.pourbaix.energy_planes, pZn is a number
+    pH : Increasing pH values, np.arange(0, 16, 0.01) if None
+    E : Increasing potentials, np.linspace(-1.5, 1.5, 1000) if None - [V vs SHE]
+    ligands : See free_ligands
+
+    Output:
+    LigandPredominanceMap
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    if ligands is None:
+        from Data.thermodynamic_data import ligands
+    totals = {} if totals is None else dict(totals)
+    pH = np.arange(0, 16, 0.01) if pH is None else np.asarray(pH, dtype=float)
+    E = np.linspace(-1.5, 1.5, 1000) if E is None else np.asarray(E, dtype=float)
+    species, a, b, c = energy_planes(db, species, T, pZn, method, element)
+    RTln10 = db.constants['R']*(db.T_ref if T is None else float(T))*np.log(10)
+    pKw = -float(np.ravel(db.logK(['W'], None if T is None else np.array([float(T)]), method))[0])
+
+    # The free ion and its hydroxo complexes, the dissolved species with the same charge per atom
+    ion = f'{element}^2+'
+    i = species.index(ion)
+    hydroxo = [k for k, name in enumerate(species) if k != i and db.species[name]['phase'] == 'aq' and c[k] == c[i]]
+    g = a[None, :] + b[None, :]*pH[:, None]                                  # At E = 0 - (n_pH x n_species)
+    log_hydroxo = np.log10(np.sum(10**((g[:, [i]] - g[:, hydroxo])/RTln10), axis=1)) if hydroxo else np.full_like(pH, -np.inf)
+    log_free = free_ligands(totals, pH, log_hydroxo, pZn, pKw, ligands)
+
+    names, alpha, beta = list(species), [g], [c]
+    for ligand, log_L in log_free.items():
+        for name, (n, m, log_beta) in ligands[ligand]['complexes'].items():
+            names.append(name)
+            alpha.append((g[:, i] - RTln10*(log_beta + n*log_L + m*(pH - pKw)))[:, None])
+            beta.append(c[[i]])
+    alpha = np.concatenate(alpha, axis=1)
+    beta = np.broadcast_to(np.concatenate(beta), alpha.shape)
+    labels = lowest_line(alpha, beta, E).T
+    return LigandPredominanceMap(pH, E, labels, names, db.T_ref if T is None else float(T), pZn, method, totals, log_free)
@@ -0,0 +1,597 @@
+import numpy as np
+from Functions.reactions import line_coefficients
+
+class PredominanceMap:
+    '''
+    The predominating species on a (pH x E) grid, from the species with the lowest Gibbs free energy at every point.
+    '''
+
+    def __init__(self, pH, E, labels, species, T, pZn, method):
+        '''
+        INPUT:
+        pH: The pH values, columns of labels                    - (n_pH)
+        E: The potentials, rows of labels                       - [V vs SHE] - (n_E)
+        labels: Index in species of the predominating species   - (n_E x n_pH)
+        species: Names of the species
+        T, pZn, method: The temperature, -log10 of the activity of the dissolved species and the method of the map
+        '''
+        self.pH = pH
+        self.E = E
+        self.labels = labels
+        self.species = list(species)
+        self.T = T
+        self.pZn = pZn
+        self.method = method
+        self._index = {name: i for i, name in enumerate(self.species)}
+
+    def mask(self, name):
+        '''The grid points where the species predominates - (n_E x n_pH)'''
+        return self.labels == self._index[name]
+
+    def species_at(self, pH, E):
+        '''The predominating species at the grid point nearest to (pH, E)'''
+        i = np.abs(self.E - E).argmin()
+        j = np.abs(self.pH - pH).argmin()
+        return self.species[self.labels[i, j]]
+
+    def fractions(self):
+        '''Share of the grid where each species predominates, {species: fraction}'''
+        counts = np.bincount(self.labels.ravel(), minlength=len(self.species))
+        return dict(zip(self.species, counts/self.labels.size))
+
+    def __repr__(self):
+        return f'PredominanceMap({len(self.species)} species, {self.labels.shape[1]} x {self.labels.shape[0]} grid, T = {self.T} K, pZn = {self.pZn})'
+
+# The species of the element that take part in the reactions of a phase model
+def phase_model_species(db, phase_model, element='Zn'):
+    '''
+    Input:
+    db : ThermoDatabase
+    phase_model : {'reactions': [...], ...}, see Data.thermodynamic_data.phase_models
+    element : The element of the diagram
+
+    Output:
+    The species names in the order of db.species_names
+    '''
+    used = {name for reaction in phase_model['reactions'] for name in db.reactions[reaction]['nu']}
+    return [name for name in db.species_names if name in used and db.species[name].get(element, 0) > 0]
+
+# The Gibbs free energy of every species as a plane in (pH, E)
+def energy_planes(db, species=None, T=None, pZn=6, method='deltaG_T2', element='Zn'):
+    '''
+    Assumptions:
+    Every species is formed from the pure element as k M(s) + w H2O <--> X + m H^+ + n e^-, with m = 2w - b and n = z + m
+    for X = M_k O_w H_b^z. All dissolved species have the activity 10^-pZn, solids have activity 1, as in activity_terms
+
+    Input:
+    db : ThermoDatabase
+    species : Names of the species, all species made of the element, O and H if None
+    T : Temperature, the reference temperature if None      - [K]
+    pZn : -log10 of the activity of the dissolved species, a number or an array (n_pZn)
+    method : As for ThermoDatabase.deltaG
+    element : The element of the diagram
+
+    Output:
+    species : The names of the species
+    a, b, c : Gibbs free energy per atom of the element, g = a + b*pH + c*E, relative to the pure element - [J/mol] - (n_species),
+              a is (n_pZn x n_species) for an array of pZn
+    '''
+    species, nu, k, m, n, dissolved = formation_reactions(db, species, element)
+    T = db.T_ref if T is None else float(T)
+    R, F = db.constants['R'], db.constants['F']
+    RTln10 = R*T*np.log(10)
+    deltaG = db.deltaG_stoichiometry(nu, None if T == db.T_ref else T, method)
+    a = (deltaG - dissolved*RTln10*np.asarray(pZn, dtype=float)[..., None])/k
+    return species, a, -m*RTln10/k, -n*F/k
+
+# The energy planes for all temperatures in one call
+def energy_planes_T(db, species=None, T=None, pZn=6, method='deltaG_T2', element='Zn'):
+    '''
+    Input:
+    As for Functions.pourbaix.energy_planes, with T an array  - [K] - (n_T)
+
+    Output:
+    species : The names of the species
+    a, b : (n_T x n_species), c : (n_species), g = a + b*pH + c*E at every temperature
+    '''
+    species, nu, k, m, n, dissolved = formation_reactions(db, species, element)
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    R, F = db.constants['R'], db.constants['F']
+    RTln10 = R*T[:, None]*np.log(10)
+    deltaG = db.deltaG_stoichiometry(nu, T, method).T                  # (n_T x n_species)
+    return species, (deltaG - dissolved*RTln10*pZn)/k, -m*RTln10/k, -n*F/k
+
+# Formation of the species from the pure element, water and protons
+def formation_reactions(db, species=None, element='Zn'):
+    '''
+    Input:
+    db : ThermoDatabase
+    species, element : See energy_planes
+
+    Output:
+    species : The names of the species
+    nu : The formation reactions over db.species_names          - (n_species x n_db_species)
+    k, m, n : Atoms of the element, protons and electrons released by the formation - (n_species)
+    dissolved : True for the dissolved species                  - (n_species)
+    '''
+    names = db.species_names
+    elements = {key for entry in db.species.values() for key in entry if key not in ('phase', 'charge')}
+    if species is None:
+        species = [name for name in names if db.species[name].get(element, 0) > 0
+                   and all(db.species[name].get(other, 0) == 0 for other in elements if other not in (element, 'O', 'H'))]
+    reference = [name for name in names if db.species[name]['phase'] != 'aq' and db.species[name].get('charge', 0) == 0
+                 and all(db.species[name].get(other, 0) == 0 for other in elements if other != element)]
+    if not reference:
+        raise ValueError(f'No species of pure {element} in the database')
+    column = {name: j for j, name in enumerate(names)}
+
+    nu = np.zeros((len(species), len(names)))
+    k, m, n = np.zeros(len(species)), np.zeros(len(species)), np.zeros(len(species))
+    for i, name in enumerate(species):
+        composition = db.species[name]
+        k[i] = composition.get(element, 0)
+        w, h = composition.get('O', 0), composition.get('H', 0)
+        m[i] = 2*w - h
+        n[i] = composition.get('charge', 0) + m[i]
+        nu[i, column[name]] += 1
+        nu[i, column[reference[0]]] -= k[i]
+        nu[i, column['H2O']] -= w
+        nu[i, column['H^+']] += m[i]
+    dissolved = np.array([db.species[name]['phase'] == 'aq' for name in species])
+    return list(species), nu, k, m, n, dissolved
+
+# Predominance map from the lowest Gibbs free energy at every grid point
+def predominance_map(db=None, species=None, T=None, pZn=6, pH=None, E=None, method='deltaG_T2', element='Zn'):
+    '''
+    Input:
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    species, T, pZn, method, element : See energy_planes
+    pH : Increasing pH values, np.arange(0, 16, 0.01) if None
+    E : The potentials, np.linspace(-1.5, 1.5, 1000) if None   - [V vs SHE]
+
+    Output:
+    PredominanceMap
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    pH = np.arange(0, 16, 0.01) if pH is None else np.asarray(pH, dtype=float)
+    E = np.linspace(-1.5, 1.5, 1000) if E is None else np.asarray(E, dtype=float)
+    species, a, b, c = energy_planes(db, species, T, pZn, method, element)
+    return PredominanceMap(pH, E, lowest_plane(a, b, c, pH, E), species, db.T_ref if T is None else float(T), pZn, method)
+
+# Index of the lowest plane g = a + b*pH + c*E at every grid point, the same as the argmin over the planes
+def lowest_plane(a, b, c, pH, E):
+    '''
+    Assumptions:
+    Along a row of constant E every plane is a line in pH, and the pH where a line is the lowest is one interval,
+    bounded by its crossings with the other lines. The intervals are found for all rows at once and written into the
+    grid with a cumulative sum, so the cost is one pass over the grid instead of one per species.
+    Ties go to the first plane, as for np.argmin, except exactly on a crossing, which goes to the plane at higher pH
+
+    Input:
+    a, b, c : The planes                                        - (n_planes)
+    pH : Increasing pH values                                   - (n_pH)
+    E : The potentials                                          - (n_E)
+
+    Output:
+    labels : Index of the lowest plane                          - (n_E x n_pH)
+    '''
+    alpha = a[None, :] + c[None, :]*E[:, None]                  # The lines in pH for every row - (n_E x n_planes)
+    return lowest_line(alpha, np.broadcast_to(b, alpha.shape), pH)
+
+# Index of the lowest line alpha + beta*x for every row of lines
+def lowest_line(alpha, beta, x):
+    '''
+    Input:
+    alpha, beta : One set of lines per row                      - (n_rows x n_lines)
+    x : Increasing values                                       - (n_x)
+
+    Output:
+    labels : Index of the lowest line, see lowest_plane         - (n_rows x n_x)
+    '''
+    n = alpha.shape[1]
+    slope = beta[:, None, :] - beta[:, :, None]                 # [row, i, j] = beta_j - beta_i
+    difference = alpha[:, :, None] - alpha[:, None, :]          # [row, i, j] = alpha_i - alpha_j
+    with np.errstate(divide='ignore', invalid='ignore'):
+        crossing = difference/slope                             # Line i is below line j for x above the crossing if slope > 0
+    lo = np.where(slope > 0, crossing, -np.inf).max(axis=2)
+    hi = np.where(slope < 0, crossing, np.inf).min(axis=2)
+    parallel = (slope == 0) & ~np.eye(n, dtype=bool)
+    empty = (parallel & ((difference > 0) | ((difference == 0) & np.tri(n, k=-1, dtype=bool)))).any(axis=2)
+
+    start, end = np.searchsorted(x, lo), np.searchsorted(x, hi)
+    rows, lines = np.nonzero(~empty & (end > start))
+    steps = np.zeros((alpha.shape[0], len(x) + 1), dtype=np.int16)
+    np.add.at(steps, (rows, start[rows, lines]), lines)
+    np.add.at(steps, (rows, end[rows, lines]), -lines)
+    return np.cumsum(steps[:, :-1], axis=1, dtype=np.int16)
+
+class PourbaixDomains:
+    '''
+    The exact domains of a Pourbaix diagram as convex polygons, with the boundaries between them and the triple points.
+    '''
+
+    def __init__(self, polygons, boundaries, triple_points, T, pZn, method, dataset=None, phase_model=None):
+        '''
+        INPUT:
+        polygons: {species: vertices}, counter-clockwise (pH, E) vertices of the domains that are not empty  - (n_vertices x 2)
+        boundaries: {(species, species): ((pH, E), (pH, E))}, the end points of the line between two domains
+        triple_points: {(species, species, species): (pH, E)}, the points where three domains meet
+        T, pZn, method: The temperature, -log10 of the activity of the dissolved species and the method
+        dataset, phase_model: Names of the dataset and phase model, if known
+        '''
+        self.polygons = polygons
+        self.boundaries = boundaries
+        self.triple_points = triple_points
+        self.T = T
+        self.pZn = pZn
+        self.method = method
+        self.dataset = dataset
+        self.phase_model = phase_model
+
+    @property
+    def species(self):
+        return list(self.polygons)
+
+    def area(self, name):
+        '''Area of the domain                                   - [pH*V]'''
+        x, y = self.polygons[name].T
+        return 0.5*(x @ np.roll(y, -1) - y @ np.roll(x, -1))
+
+    def centroid(self, name):
+        '''Centroid of the domain, e.g. for the label           - (pH, E)'''
+        x, y = self.polygons[name].T
+        cross = x*np.roll(y, -1) - np.roll(x, -1)*y
+        return (np.sum((x + np.roll(x, -1))*cross), np.sum((y + np.roll(y, -1))*cross))/(3*np.sum(cross))
+
+    def add_to(self, ax, colours=None, alpha=0.3, labels=None):
+        '''
+        Fills the domains with Functions.Functions.add_polygon, with the text at the centroid
+
+        INPUT:
+        ax: The Axes
+        colours: {species: colour}, the matplotlib colour cycle if None
+        alpha: Transparency (0-1)
+        labels: {species: text}, the species names if None
+        '''
+        from Functions.Functions import add_polygon
+        for k, name in enumerate(self.polygons):
+            colour = f'C{k}' if colours is None else colours[name]
+            text = name if labels is None else labels[name]
+            add_polygon(ax, self.polygons[name], colour, alpha, name, self.centroid(name), text)
+
+    def metadata(self):
+        '''T and pZn as floats, so NumPy numbers can be written as json'''
+        return {'T': float(self.T), 'pZn': float(self.pZn), 'method': self.method, 'dataset': self.dataset, 'phase_model': self.phase_model}
+
+    def to_dict(self):
+        '''Plain lists and numbers, for json'''
+        return {**self.metadata(),
+                'polygons': {name: vertices.tolist() for name, vertices in self.polygons.items()},
+                'boundaries': [[list(pair), [list(P), list(Q)]] for pair, (P, Q) in self.boundaries.items()],
+                'triple_points': [[list(names), list(point)] for names, point in self.triple_points.items()]}
+
+    @classmethod
+    def from_dict(cls, data):
+        '''The inverse of to_dict'''
+        return cls({name: np.array(vertices, dtype=float) for name, vertices in data['polygons'].items()},
+                   {tuple(pair): (tuple(P), tuple(Q)) for pair, (P, Q) in data['boundaries']},
+                   {tuple(names): tuple(point) for names, point in data['triple_points']},
+                   data['T'], data['pZn'], data['method'], data.get('dataset'), data.get('phase_model'))
+
+    def save(self, path):
+        '''Writes the domains as compact json'''
+        import json
+        with open(path, 'w') as file:
+            json.dump(self.to_dict(), file, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        '''Reads domains written with save'''
+        import json
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+    def to_geojson(self, path=None):
+        '''
+        The domains as a GeoJSON FeatureCollection with pH as x and E as y: a Polygon per domain, a LineString per
+        boundary and a Point per triple point, with the metadata in the properties of every feature
+
+        INPUT:
+        path: Also writes the collection to this file if given
+
+        RETURNS:
+        The FeatureCollection as a dictionary
+        '''
+        metadata = self.metadata()
+        features = [{'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': [vertices.tolist() + vertices[:1].tolist()]},
+                     'properties': {'kind': 'domain', 'species': name, **metadata}} for name, vertices in self.polygons.items()]
+        features += [{'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': [list(P), list(Q)]},
+                      'properties': {'kind': 'boundary', 'species': list(pair), **metadata}} for pair, (P, Q) in self.boundaries.items()]
+        features += [{'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': list(point)},
+                      'properties': {'kind': 'triple_point', 'species': list(names), **metadata}} for names, point in self.triple_points.items()]
+        collection = {'type': 'FeatureCollection', 'features': features}
+        if path is not None:
+            import json
+            with open(path, 'w') as file:
+                json.dump(collection, file)
+        return collection
+
+    def __repr__(self):
+        return f'PourbaixDomains({len(self.polygons)} domains, {len(self.triple_points)} triple points, T = {self.T} K, pZn = {self.pZn})'
+
+# Exact domains from clipping the window with the half-planes g_i <= g_j
+def domain_polygons(species, a, b, c, pH_range=(0, 16), E_range=(-1.5, 1.5)):
+    '''
+    Assumptions:
+    Every domain is convex, the window clipped by the half-planes where the species is below each of the others.
+    The edges remember which plane cut them, which gives the boundaries and the triple points without a second search.
+    Clipping is O(n) per domain; with the handful of species of a diagram this is simpler and more robust than a
+    convex hull of the dual points, which are degenerate (all the Zn(II) species have the same number of electrons)
+
+    Input:
+    species : Names of the species
+    a, b, c : The planes g = a + b*pH + c*E, see energy_planes  - (n_species)
+    pH_range, E_range : The window of the diagram
+
+    Output:
+    polygons, boundaries, triple_points : See PourbaixDomains
+    '''
+    (x0, x1), (y0, y1) = pH_range, E_range
+    window = [((x0, y0), None), ((x1, y0), None), ((x1, y1), None), ((x0, y1), None)]   # (vertex, plane of the edge to the next vertex)
+
+    polygons, edges = {}, {}
+    for i, name in enumerate(species):
+        polygon = window
+        for j in range(len(species)):
+            if j == i:
+                continue
+            alpha, beta, gamma = a[i] - a[j], b[i] - b[j], c[i] - c[j]
+            if beta == 0 and gamma == 0:
+                if alpha > 0 or (alpha == 0 and j < i):     # Parallel planes, the lowest (or the first of equal ones) wins
+                    polygon = []
+                    break
+                continue
+            tolerance = 1e-12*(abs(alpha) + abs(beta)*(x1 - x0) + abs(gamma)*(y1 - y0))
+            polygon = _clip(polygon, alpha, beta, gamma, j, tolerance)
+            if not polygon:
+                break
+        vertices = np.array([vertex for vertex, _ in polygon]).reshape(-1, 2)
+        if len(vertices) >= 3 and 0.5*abs(vertices[:, 0] @ np.roll(vertices[:, 1], -1) - vertices[:, 1] @ np.roll(vertices[:, 0], -1)) > 1e-12:
+            polygons[name] = vertices
+            edges[name] = polygon
+
+    # Boundaries are the edges cut by another species that has a domain, triple points the vertices between two such edges
+    boundaries, triple_points = {}, {}
+    for name, polygon in edges.items():
+        for k, (vertex, plane) in enumerate(polygon):
+            if plane is None or species[plane] not in polygons:
+                continue
+            pair = tuple(sorted((name, species[plane]), key=species.index))
+            boundaries.setdefault(pair, (vertex, polygon[(k + 1) % len(polygon)][0]))
+            previous = polygon[k - 1][1]
+            if previous is not None and previous != plane and species[previous] in polygons:
+                point = tuple(sorted((name, species[plane], species[previous]), key=species.index))
+                triple_points.setdefault(point, vertex)
+    return polygons, boundaries, triple_points
+
+# One step of Sutherland-Hodgman, keeping alpha + beta*pH + gamma*E <= 0
+def _clip(polygon, alpha, beta, gamma, plane, tolerance):
+    f = [alpha + beta*x + gamma*y for (x, y), _ in polygon]
+    clipped = []
+    for k, (P, label) in enumerate(polygon):
+        Q = polygon[(k + 1) % len(polygon)][0]
+        f_P, f_Q = f[k], f[(k + 1) % len(polygon)]
+        if f_P <= tolerance:
+            clipped.append((P, label))
+            if f_Q > tolerance and f_P < -tolerance:
+                clipped.append((_crossing(P, Q, f_P, f_Q), plane))
+            elif f_Q > tolerance:
+                clipped[-1] = (P, plane)                        # P is on the line, the edge from P follows the line
+        elif f_Q < -tolerance:
+            clipped.append((_crossing(P, Q, f_P, f_Q), label))
+    return clipped if len(clipped) >= 3 else []
+
+def _crossing(P, Q, f_P, f_Q):
+    t = f_P/(f_P - f_Q)
+    return (P[0] + t*(Q[0] - P[0]), P[1] + t*(Q[1] - P[1]))
+
+# The exact domains of a Pourbaix diagram
+def pourbaix_domains(db=None, species=None, T=None, pZn=6, pH_range=(0, 16), E_range=(-1.5, 1.5), method='deltaG_T2', element='Zn'):
+    '''
+    Input:
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    species, T, pZn, method, element : See energy_planes
+    pH_range, E_range : The window of the diagram               - [-], [V vs SHE]
+
+    Output:
+    PourbaixDomains
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    species, a, b, c = energy_planes(db, species, T, pZn, method, element)
+    polygons, boundaries, triple_points = domain_polygons(species, a, b, c, pH_range, E_range)
+    return PourbaixDomains(polygons, boundaries, triple_points, db.T_ref if T is None else float(T), pZn, method)
+
+# The lines of any set of reactions, derived from their stoichiometry and evaluated together
+def reaction_lines(db=None, reactions=None, T=None, pH=None, pZn=6, method='deltaG_T2', I=None, activity_model='ideal'):
+    '''
+    Input:
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    reactions : Names of the reactions, all reactions of db if None
+    T : Temperature, the reference temperature if None      - [K]
+    pH : The pH values, np.arange(0, 16, 0.01) if None      - (n_pH)
+    pZn : The values of pZn                                 - (n_pZn)
+    method : As for ThermoDatabase.E0
+    I : Ionic strength, a number or an array, activity equal to concentration if None - [mol/kg]
+    activity_model : The activity coefficients and activity of water, see Functions.activity.log_gamma
+
+    Output:
+    Dictionary with
+    'reactions' : The names of the reactions
+    'electrochemical' : True for the reactions with electrons  - (n_reactions)
+    'intercept', 'pH_slope', 'pZn_slope' : See Functions.reactions.line_coefficients - (n_reactions), intercept is
+                  (n_reactions x I.shape) for an array of I
+    'E' : The electrochemical lines, NaN for the others     - [V vs SHE] - (n_reactions x I.shape x n_pZn x n_pH)
+    'pH_boundary' : The chemical lines, NaN for the others  - (n_reactions x I.shape x n_pZn)
+    and the inputs 'T', 'pZn', 'pH', 'I' and 'activity_model'
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    T = db.T_ref if T is None else float(T)
+    T_query = None if T == db.T_ref else T
+    pZn = np.atleast_1d(np.asarray(pZn, dtype=float))
+    pH = np.arange(0, 16, 0.01) if pH is None else np.asarray(pH, dtype=float)
+    R, F = db.constants['R'], db.constants['F']
+    reactions = db.reaction_names if reactions is None else list(reactions)
+    index = np.array([db.reaction_index[name] for name in reactions], dtype=int)
+
+    deltaG = db.deltaG(None, T_query, 'deltaG_weak' if method == 'E0_2' else method)
+    E0 = db.E0(None, T_query, method)
+    pKw = deltaG[db.reaction_index['W']]/(R*T*np.log(10))
+    s, h, nu_OH = (term[index] for term in db.activity_terms)
+    n = db.electrons[index]
+    shift = 0
+    if I is not None:
+        from Functions.activity import reaction_activity_shift
+        shift = reaction_activity_shift(db, I, activity_model, T, reactions)
+    intercept, pH_slope, pZn_slope = line_coefficients(E0[index], deltaG[index], n, s, h, nu_OH, T, pKw, R, F, shift)
+    intercept = np.moveaxis(intercept, -1, 0)
+
+    electrochemical = n > 0
+    axes = (slice(None),) + (None,)*(intercept.ndim - 1)             # The reactions first, then the axes of I
+    return {
+        'T': T, 'pZn': pZn, 'pH': pH, 'I': I, 'activity_model': activity_model, 'reactions': reactions, 'electrochemical': electrochemical,
+        'intercept': intercept, 'pH_slope': pH_slope, 'pZn_slope': pZn_slope,
+        'E': intercept[..., None, None] + pH_slope[axes][..., None, None]*pH + pZn_slope[axes][..., None, None]*pZn[:, None],
+        'pH_boundary': np.where(electrochemical[axes][..., None], np.nan, intercept[..., None] + pZn_slope[axes][..., None]*pZn),
+    }
+
+# All lines, boundaries and triple points of a phase model for many pZn at once
+def pourbaix_lines(phase_model, db=None, T=None, pZn=(6,), pH=None, method='deltaG_T2', element='Zn'):
+    '''
+    Assumptions:
+    The activity terms of activity_terms, so every line is linear in pZn and the whole pZn family is one broadcasted
+    evaluation. An electrochemical line is drawn where it is the lowest of the lines of the phase model (the border of
+    the metal domain), a chemical line where its two species are the lowest of the species with the same oxidation state
+
+    Input:
+    phase_model : {'reactions': [...], 'triple_points': {...}, 'pZn_thresholds': {...}}, see Data.thermodynamic_data.phase_models
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    T : Temperature, the reference temperature if None      - [K]
+    pZn : The values of pZn                                 - (n_pZn)
+    pH : The pH values, np.arange(0, 16, 0.01) if None      - (n_pH)
+    method : As for ThermoDatabase.E0
+    element : The element of the diagram
+
+    Output:
+    Dictionary with
+    'E' : {reaction: E}, the electrochemical lines              - [V vs SHE] - (n_pZn x n_pH)
+    'E_visible' : {reaction: mask}, where the line is a boundary of the diagram - (n_pZn x n_pH)
+    'pH_boundary' : {reaction: pH}, the chemical lines          - (n_pZn)
+    'pH_visible' : {reaction: mask}, the pZn where the chemical line is a boundary - (n_pZn)
+    'E_start' : {reaction: E}, the lower end of the chemical lines, on the border of the metal domain - [V vs SHE] - (n_pZn)
+    'triple_points' : {name: {'pH': pH, 'E': E}}                - (n_pZn)
+    'pZn_thresholds' : {name: pZn}, where a domain appears or vanishes
+    and the inputs 'T', 'pZn' and 'pH'
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    T = db.T_ref if T is None else float(T)
+    T_query = None if T == db.T_ref else T
+    pZn = np.atleast_1d(np.asarray(pZn, dtype=float))
+    pH = np.arange(0, 16, 0.01) if pH is None else np.asarray(pH, dtype=float)
+    RTln10 = db.constants['R']*T*np.log(10)
+
+    # All lines of the model in one call, the electrochemical ones (n_lines x n_pZn x n_pH) and the chemical ones (n_lines x n_pZn)
+    model = reaction_lines(db, phase_model['reactions'], T, pH, pZn, method)
+    line = {name: k for k, name in enumerate(model['reactions'])}
+    electrochemical = [name for name, flag in zip(model['reactions'], model['electrochemical']) if flag]
+    chemical = [name for name, flag in zip(model['reactions'], model['electrochemical']) if not flag]
+    intercept, pH_slope, pZn_slope = model['intercept'], model['pH_slope'], model['pZn_slope']
+    i, j = [line[name] for name in electrochemical], [line[name] for name in chemical]
+    lines = model['E'][i]
+    lowest = lines.argmin(axis=0)
+    boundaries = model['pH_boundary'][j]
+    E_start = (intercept[i, None, None] + pH_slope[i, None, None]*boundaries[None, :, :] + pZn_slope[i, None, None]*pZn).min(axis=0)
+
+    # A chemical line is a boundary if no other species of the same oxidation state is lower at its pH
+    species, a, b, c = energy_planes(db, phase_model_species(db, phase_model, element), T, pZn, method, element)
+    column = {name: k for k, name in enumerate(species)}
+    visible = np.zeros(boundaries.shape, dtype=bool)
+    for row, reaction in enumerate(chemical):
+        pair = [column[name] for name in db.reactions[reaction]['nu'] if name in column]
+        same = np.isclose(c, c[pair[0]])
+        g = a[:, same] + b[same]*boundaries[row][:, None]                           # (n_pZn x n_same)
+        g_pair = a[:, pair[0]] + b[pair[0]]*boundaries[row]
+        visible[row] = g.min(axis=1) >= g_pair - 1e-9*np.abs(g_pair).max()
+
+    triple_points = {}
+    for point, (chemical_name, electrochemical_name) in phase_model.get('triple_points', {}).items():
+        r, e = line[chemical_name], line[electrochemical_name]
+        x = intercept[r] + pZn_slope[r]*pZn
+        triple_points[point] = {'pH': x, 'E': intercept[e] + pH_slope[e]*x + pZn_slope[e]*pZn}
+
+    deltaG = db.deltaG(None, T_query, 'deltaG_weak' if method == 'E0_2' else method)
+    thresholds = {name: sum(coefficient*deltaG[db.reaction_index[reaction]] for reaction, coefficient in combination.items())/RTln10
+                  for name, combination in phase_model.get('pZn_thresholds', {}).items()}
+
+    return {
+        'T': T, 'pZn': pZn, 'pH': pH,
+        'E': {name: lines[k] for k, name in enumerate(electrochemical)},
+        'E_visible': {name: lowest == k for k, name in enumerate(electrochemical)},
+        'pH_boundary': {name: boundaries[k] for k, name in enumerate(chemical)},
+        'pH_visible': {name: visible[k] for k, name in enumerate(chemical)},
+        'E_start': {name: E_start[k] for k, name in enumerate(chemical)},
+        'triple_points': triple_points,
+        'pZn_thresholds': thresholds,
+    }
+
+# Exact domains for a dataset and phase model, computed once and then read from the cache
+def pourbaix_diagram(dataset=None, phase_model=None, T=None, pZn=6, pH_range=(0, 16), E_range=(-1.5, 1.5), method='deltaG_T2',
+                     element='Zn', cache_dir=None):
+    '''
+    Input:
+    dataset : Name of the dataset, see Data.thermodynamic_data.database
+    phase_model : Name of a phase model in Data.thermodynamic_data.phase_models, all species of the element if None
+    T, pZn, pH_range, E_range, method, element : See pourbaix_domains
+    cache_dir : Directory of the cached diagrams, Functions.thermo_cache.default_cache_dir if None, False to not cache.
+                The file is keyed by the data hash of the dataset and all the other inputs
+
+    Output:
+    PourbaixDomains
+    '''
+    import hashlib
+    import os
+    import uuid
+    from Data.thermodynamic_data import database, dataset_name, phase_models
+    from Functions.thermo_cache import data_hash, default_cache_dir
+    dataset = dataset_name if dataset is None else dataset
+    db = database(dataset)
+    T = db.T_ref if T is None else float(T)
+
+    path = None
+    if cache_dir is not False:
+        key = hashlib.sha256(repr((phase_model, T, float(pZn), tuple(map(float, pH_range)), tuple(map(float, E_range)), element)).encode()).hexdigest()[:16]
+        path = os.path.join(default_cache_dir if cache_dir is None else cache_dir, f'domains-{method}-{data_hash(db, method)[:20]}-{key}.json')
+        if os.path.exists(path):
+            return PourbaixDomains.load(path)
+
+    species = None if phase_model is None else phase_model_species(db, phase_models[phase_model], element)
+    domains = pourbaix_domains(db, species, T, pZn, pH_range, E_range, method, element)
+    domains.dataset, domains.phase_model = dataset, phase_model
+    if path is not None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.tmp-{uuid.uuid4().hex}'
+        try:
+            domains.save(tmp)
+            os.replace(tmp, path)
+        except BaseException:       # No half written files are left in the cache
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+    return domains
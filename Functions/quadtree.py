@@ -0,0 +1,158 @@
+import numpy as np
+from Functions.pourbaix import energy_planes
+
+class QuadtreeMap:
+    '''
+    Predominance map stored as a quadtree over the window. Cells whose corners agree on the species are leaves,
+    the others are split down to the finest level, so the cells are only small along the boundaries.
+    '''
+
+    def __init__(self, children, labels, depth, pH_range, E_range, species, evaluations, T, pZn, method):
+        '''
+        INPUT:
+        children: The four children of every node (x + 2*y order, x towards higher pH), -1 for leaves - (n_nodes x 4)
+        labels: Index in species of the leaves, -1 for the other nodes                             - (n_nodes)
+        depth: The finest level, the window is split in 2**depth x 2**depth cells there
+        pH_range, E_range: The window
+        species: Names of the species
+        evaluations: Number of points where the species were compared
+        T, pZn, method: The temperature, -log10 of the activity of the dissolved species and the method
+        '''
+        self.children = children
+        self.labels = labels
+        self.depth = depth
+        self.pH_range = pH_range
+        self.E_range = E_range
+        self.species = list(species)
+        self.evaluations = evaluations
+        self.T = T
+        self.pZn = pZn
+        self.method = method
+
+    def lookup(self, pH, E):
+        '''Index in species of the predominating species at the points, one step per level of the tree'''
+        x = self._unit(pH, self.pH_range)
+        y = self._unit(E, self.E_range)
+        node = np.zeros(np.broadcast(x, y).shape, dtype=np.int64)
+        for level in range(1, self.depth + 1):
+            inner = self.children[node, 0] >= 0
+            if not inner.any():
+                break
+            quadrant = _cell(x, level) % 2 + 2*(_cell(y, level) % 2)
+            node = np.where(inner, self.children[node, np.broadcast_to(quadrant, node.shape)], node)
+        return self.labels[node]
+
+    def species_at(self, pH, E):
+        '''The predominating species at a point'''
+        return self.species[int(self.lookup(pH, E))]
+
+    def rasterize(self, pH, E):
+        '''The labels on a grid, as PredominanceMap.labels  - (n_E x n_pH)'''
+        return self.lookup(np.asarray(pH)[None, :], np.asarray(E)[:, None])
+
+    def leaves(self):
+        '''
+        RETURNS:
+        pH, E, width, height, label of the leaf cells, e.g. for plotting with matplotlib Rectangles
+        '''
+        x, y, size = np.zeros(1), np.zeros(1), np.ones(1)
+        nodes, found = np.zeros(1, dtype=np.int64), []
+        while len(nodes):
+            leaf = self.children[nodes, 0] < 0
+            found.append((x[leaf], y[leaf], size[leaf], self.labels[nodes[leaf]]))
+            nodes, x, y, size = nodes[~leaf], x[~leaf], y[~leaf], size[~leaf]/2
+            nodes = self.children[nodes].ravel()
+            x = (x[:, None] + size[:, None]*np.array([0, 1, 0, 1])).ravel()
+            y = (y[:, None] + size[:, None]*np.array([0, 0, 1, 1])).ravel()
+            size = np.repeat(size, 4)
+        x, y, size, labels = map(np.concatenate, zip(*found))
+        (x0, x1), (y0, y1) = self.pH_range, self.E_range
+        return x0 + x*(x1 - x0), y0 + y*(y1 - y0), size*(x1 - x0), size*(y1 - y0), labels
+
+    @staticmethod
+    def _unit(value, limits):
+        return (np.asarray(value, dtype=float) - limits[0])/(limits[1] - limits[0])
+
+    def __repr__(self):
+        return f'QuadtreeMap({int((self.labels >= 0).sum())} leaves, depth {self.depth}, {self.evaluations} evaluations, T = {self.T} K, pZn = {self.pZn})'
+
+def _cell(unit, level):
+    return np.clip(np.floor(unit*2**level).astype(np.int64), 0, 2**level - 1)
+
+# Adaptive predominance map
+def adaptive_map(db=None, species=None, T=None, pZn=6, pH_range=(0, 16), E_range=(-1.5, 1.5), resolution=1024, coarse=4,
+                 method='deltaG_T2', element='Zn'):
+    '''
+    Assumptions:
+    A cell whose four corners have the same species is taken to be that species everywhere. A domain smaller than the
+    cells of the coarse level can be missed, so coarse should give cells smaller than the smallest domain of interest
+
+    Input:
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    species, T, pZn, method, element : See Functions.pourbaix.energy_planes
+    pH_range, E_range : The window
+    resolution : The boundaries are resolved as on a resolution x resolution grid, rounded up to a power of 2
+    coarse : The first level where cells may become leaves, 2**coarse x 2**coarse cells
+
+    Output:
+    QuadtreeMap
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    species, a, b, c = energy_planes(db, species, T, pZn, method, element)
+    depth = max(coarse, int(np.ceil(np.log2(resolution))))
+    (x0, x1), (y0, y1) = pH_range, E_range
+    lattice = 2**depth + 1                                      # Corner points on the finest level
+
+    # The species at lattice points, each point is compared only once
+    known_keys, known_labels = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int16)
+    def label_at(i, j):
+        nonlocal known_keys, known_labels
+        keys = i*lattice + j
+        unique, inverse = np.unique(keys, return_inverse=True)
+        position = np.clip(np.searchsorted(known_keys, unique), 0, max(len(known_keys) - 1, 0))
+        found = known_keys[position] == unique if len(known_keys) else np.zeros(len(unique), dtype=bool)
+        labels = np.empty(len(unique), dtype=np.int16)
+        labels[found] = known_labels[position[found]]
+        new = unique[~found]
+        pH = x0 + (new // lattice)*(x1 - x0)/(lattice - 1)
+        E = y0 + (new % lattice)*(y1 - y0)/(lattice - 1)
+        labels[~found] = (a[:, None] + b[:, None]*pH[None, :] + c[:, None]*E[None, :]).argmin(axis=0)
+        order = np.argsort(np.concatenate([known_keys, new]))
+        known_keys = np.concatenate([known_keys, new])[order]
+        known_labels = np.concatenate([known_labels, labels[~found]])[order]
+        return labels[inverse].reshape(np.shape(i))
+
+    # Breadth first, one level at a time
+    children, labels = np.full((1, 4), -1), np.full(1, -1, dtype=np.int16)
+    nodes, ix, iy = np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    count = 1
+    for level in range(depth + 1):
+        step = 2**(depth - level)                               # Size of the cells in lattice units
+        if level == depth:
+            leaf = np.ones(len(nodes), dtype=bool)
+            corners = label_at(ix*step, iy*step)[:, None]
+        elif level < coarse:
+            leaf = np.zeros(len(nodes), dtype=bool)
+        else:
+            corners = label_at((ix[:, None] + np.array([0, 1, 0, 1]))*step, (iy[:, None] + np.array([0, 0, 1, 1]))*step)
+            leaf = (corners == corners[:, :1]).all(axis=1)
+        if leaf.any():
+            labels[nodes[leaf]] = corners[leaf, 0]
+        if level == depth:
+            break
+
+        # Splitting the other cells
+        split = nodes[~leaf]
+        new = count + np.arange(4*len(split)).reshape(-1, 4)
+        children[split] = new
+        count += new.size
+        children = np.vstack([children, np.full((new.size, 4), -1)])
+        labels = np.concatenate([labels, np.full(new.size, -1, dtype=np.int16)])
+        nodes = new.ravel()
+        ix = (2*ix[~leaf, None] + np.array([0, 1, 0, 1])).ravel()
+        iy = (2*iy[~leaf, None] + np.array([0, 0, 1, 1])).ravel()
+
+    return QuadtreeMap(children, labels, depth, pH_range, E_range, species, len(known_keys),
+                       db.T_ref if T is None else float(T), pZn, method)
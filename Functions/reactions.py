@@ -0,0 +1,168 @@
+import numpy as np
+
+# Building the stoichiometry matrix from the reaction declarations
+def stoichiometry_matrix(reactions, species):
+    '''
+    Assumptions:
+    Products have positive and reactants negative stoichiometric coefficients. Electrons are not species,
+    they are given separately as the number of electrons consumed by the reaction
+
+    Input:
+    reactions : Dictionary with the reactions as {name: {'nu': {species: coefficient}, 'n': electrons}}
+    species : List with the species names, decides the column order of the matrix
+
+    Output:
+    nu : Stoichiometry matrix - (n_reactions x n_species)
+    '''
+    column = {name: j for j, name in enumerate(species)}
+    nu = np.zeros((len(reactions), len(species)))
+    for i, (name, reaction) in enumerate(reactions.items()):
+        for species_name, coefficient in reaction['nu'].items():
+            if species_name not in column:
+                raise KeyError(f'Reaction {name} uses the unknown species {species_name}')
+            nu[i, column[species_name]] = coefficient
+    return nu
+
+# Checking that every reaction is balanced in elements and charge
+def check_balance(nu, electrons, species, reaction_names, elements=('Zn', 'O', 'H', 'C')):
+    '''
+    Input:
+    nu : Stoichiometry matrix                                   - (n_reactions x n_species)
+    electrons : Number of electrons consumed by each reaction   - (n_reactions)
+    species : Dictionary with the composition of the species as {name: {'Zn': 1, 'O': 1, 'H': 1, 'charge': -1, ...}}
+    reaction_names : The names of the reactions (rows of nu), only used for the error message
+    elements : The elements that are checked
+
+    Output:
+    Raises ValueError for the first reaction that is not balanced
+    '''
+    composition = np.array([[species[name].get(element, 0) for element in elements] for name in species])
+    charge = np.array([species[name].get('charge', 0) for name in species])
+
+    element_balance = nu @ composition              # Should be zero for all elements
+    charge_balance = nu @ charge + electrons        # Products - reactants, where the electrons are reactants with charge -1
+    for i, name in enumerate(reaction_names):
+        if np.any(np.abs(element_balance[i]) > 1e-9) or abs(charge_balance[i]) > 1e-9:
+            raise ValueError(f'Reaction {name} is not balanced: elements {dict(zip(elements, element_balance[i]))}, charge {charge_balance[i]}')
+
+# Counting the protons consumed by the reactions
+def reaction_protons(nu, species):
+    '''
+    Assumptions:
+    A consumed OH^- is counted as a released H^+, so that the number corresponds to the reaction written in acidic form
+
+    Input:
+    nu : Stoichiometry matrix                       - (n_reactions x n_species)
+    species : List with the species names (columns of nu)
+
+    Output:
+    h : Number of protons consumed by each reaction - (n_reactions)
+    '''
+    species = list(species)
+    h = np.zeros(nu.shape[0])
+    if 'H^+' in species:
+        h -= nu[:, species.index('H^+')]
+    if 'OH^-' in species:
+        h += nu[:, species.index('OH^-')]
+    return h
+
+# Hess' law for all reactions at once
+def reaction_properties(nu, formation):
+    '''
+    Input:
+    nu : Stoichiometry matrix                                   - (n_reactions x n_species)
+    formation : Formation property of the species, one row per species, e.g. deltaG, S or the Cp coefficients - (n_species, ...)
+
+    Output:
+    The property of reaction for every reaction                 - (n_reactions, ...)
+    '''
+    return np.tensordot(nu, formation, axes=(1, 0))
+
+# The key used for the standard reduction potentials, e.g. 'III-eps' --> 'EIII_0-eps'
+def E0_key(reaction_name):
+    base, separator, variant = reaction_name.partition('-')
+    return 'E' + base + '_0' + separator + variant
+
+# The activity terms of the reactions, used by the Nernst equation and the chemical equilibria
+def activity_terms(nu, species):
+    '''
+    Assumptions:
+    All dissolved species except H^+ and OH^- have the same activity, 10^-pZn, as in the scripts where every species dominates
+    its own domain. Solids, liquid water and gases at 1 atm have activity 1. OH^- has the activity Kw/a_H+
+
+    Input:
+    nu : Stoichiometry matrix                                   - (n_reactions x n_species)
+    species : Dictionary with the phase of the species as {name: {'phase': 'aq', ...}}, in the column order of nu
+
+    Output:
+    s : Sum of the coefficients of the dissolved species        - (n_reactions)
+    h : Number of protons consumed, see reaction_protons        - (n_reactions)
+    nu_OH : Coefficient of OH^-                                 - (n_reactions)
+
+    With these, log10(Q) = -s*pZn + h*pH - nu_OH*pKw
+    '''
+    names = list(species)
+    dissolved = np.array([species[name]['phase'] == 'aq' and name not in ('H^+', 'OH^-') for name in names])
+    s = nu[:, dissolved].sum(axis=1)
+    nu_OH = nu[:, names.index('OH^-')] if 'OH^-' in names else np.zeros(nu.shape[0])
+    return s, reaction_protons(nu, names), nu_OH
+
+# The Nernst equation for electrochemical reactions
+def nernst_potential(E0, n, s, h, nu_OH, T, pH, pZn, pKw, R=8.31451, F=96485):
+    '''
+    Input:
+    E0 : Standard reduction potentials                          - [V vs SHE]
+    n, s, h, nu_OH : Electrons and activity terms, see activity_terms
+    T : Temperature                                             - [K]
+    pH, pZn, pKw : -log10 of the activities and of the ion product of water
+
+    Output:
+    E : Equilibrium potential, E = E0 - RT*ln(10)/(nF)*log10(Q) - [V vs SHE]. All inputs broadcast
+    '''
+    return E0 - R*T*np.log(10)/(n*F)*(-s*pZn + h*pH - nu_OH*pKw)
+
+# The pH of the vertical lines given by chemical reactions
+def boundary_pH(deltaG, s, h, nu_OH, T, pZn, pKw, R=8.31451):
+    '''
+    Input:
+    deltaG : Gibbs free energy for the reactions at T           - [J/mol]
+    s, h, nu_OH : Activity terms, see activity_terms. h must be non-zero
+    T : Temperature                                             - [K]
+    pZn, pKw : -log10 of the activity of the dissolved Zn species and of the ion product of water
+
+    Output:
+    pH where the reaction is at equilibrium, from deltaG + RT*ln(10)*log10(Q) = 0. All inputs broadcast
+    '''
+    return (-deltaG/(R*T*np.log(10)) + s*pZn + nu_OH*pKw)/h
+
+# The lines of all reactions as intercepts and slopes, from the stoichiometry
+def line_coefficients(E0, deltaG, n, s, h, nu_OH, T, pKw, R=8.31451, F=96485, shift=0):
+    '''
+    Input:
+    E0 : Standard reduction potentials, used for the reactions with electrons - [V vs SHE] - (n_reactions)
+    deltaG : Gibbs free energy for the reactions at T, used for the others    - [J/mol] - (n_reactions)
+    n : Electrons consumed by the reactions                     - (n_reactions)
+    s, h, nu_OH : Activity terms, see activity_terms            - (n_reactions)
+    T : Temperature                                             - [K]
+    pKw : -log10 of the ion product of water
+    shift : Added to log10(Q), e.g. from the activity coefficients, see Functions.activity.reaction_activity_shift
+            - (..., n_reactions)
+
+    Output:
+    intercept, pH_slope, pZn_slope                              - (n_reactions), intercept has the shape of shift
+    For electrochemical reactions (n > 0) the line is E = intercept + pH_slope*pH + pZn_slope*pZn, as nernst_potential.
+    For chemical reactions with protons it is the vertical line pH = intercept + pZn_slope*pZn, as boundary_pH, and
+    pH_slope is NaN. Chemical reactions without protons have no line, all NaN
+    '''
+    E0, deltaG, n, s, h, nu_OH = (np.asarray(value, dtype=float) for value in (E0, deltaG, n, s, h, nu_OH))
+    RTln10 = R*T*np.log(10)
+    electrochemical = n > 0
+    chemical = ~electrochemical & (h != 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        nF = np.where(electrochemical, n*F, np.nan)
+        intercept = np.where(electrochemical, E0 + RTln10*(nu_OH*pKw - shift)/nF, (-deltaG/RTln10 + nu_OH*pKw - shift)/h)
+        pZn_slope = np.where(electrochemical, RTln10*s/nF, s/h)
+        pH_slope = -RTln10*h/nF
+    intercept = np.where(electrochemical | chemical, intercept, np.nan)
+    pZn_slope = np.where(electrochemical | chemical, pZn_slope, np.nan)
+    return intercept, pH_slope, pZn_slope
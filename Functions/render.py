@@ -0,0 +1,143 @@
+import numpy as np
+from matplotlib.collections import LineCollection, PolyCollection
+
+# Drawing a diagram with one artist for the domains and one for the lines
+def draw_domains(ax, domains, colours=None, alpha=0.3, labels=None, water=True, linewidth=1.0, fontsize=12):
+    '''
+    Draws the domains as one PolyCollection and the boundaries (and the water lines) as one LineCollection. The
+    boundaries are straight, so only their end points are drawn
+
+    INPUT:
+    ax: The Axes
+    domains: Functions.pourbaix.PourbaixDomains
+    colours: {species: colour}, the matplotlib colour cycle if None
+    alpha: Transparency of the domains (0-1)
+    labels: {species: text} written at the centroids, the species names if None, False for no text
+    water: Adds the HER and OER lines, dashed
+    linewidth: Width of the lines
+    fontsize: Size of the text
+
+    RETURNS:
+    The PolyCollection and the LineCollection
+    '''
+    names = list(domains.polygons)
+    faces = [f'C{k % 10}' if colours is None else colours[name] for k, name in enumerate(names)]
+    polygons = PolyCollection([domains.polygons[name] for name in names], facecolors=faces, edgecolors='none', alpha=alpha)
+    ax.add_collection(polygons)
+
+    segments, styles = _line_segments(domains, water)
+    lines = LineCollection(segments, colors='k', linewidths=linewidth, linestyles=styles)
+    ax.add_collection(lines)
+
+    if labels is not False:
+        for name in names:
+            ax.text(*domains.centroid(name), name if labels is None else labels[name], fontsize=fontsize, ha='center', va='center')
+    (x0, x1), (y0, y1) = _window(domains)
+    ax.set_xlim(x0, x1)
+    ax.set_ylim(y0, y1)
+    ax.set_xlabel('pH / [-]')
+    ax.set_ylabel('E / [V vs SHE]')
+    return polygons, lines
+
+# A diagram as an image file, without pyplot
+def render(domains, path=None, figsize=(8, 6), dpi=100, title=None, **options):
+    '''
+    Draws the diagram on a new Agg figure that is not registered with pyplot, so no window is opened and nothing is
+    kept alive after the call
+
+    INPUT:
+    domains: Functions.pourbaix.PourbaixDomains
+    path: Saves the figure to this file if given
+    figsize, dpi: Size and resolution of the figure
+    title: The title, T and pZn if None
+    options: colours, alpha, labels, water, linewidth and fontsize, see draw_domains
+
+    RETURNS:
+    The Figure
+    '''
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    draw_domains(ax, domains, **options)
+    ax.set_title(_title(domains) if title is None else title)
+    if path is not None:
+        fig.savefig(path)
+    return fig
+
+# Many diagrams, reusing the figure and the artists
+def render_many(diagrams, paths, figsize=(8, 6), dpi=100, colours=None, alpha=0.3, water=True, linewidth=1.0, fontsize=12):
+    '''
+    Renders diagrams to files. The figure, the collections and the text are made once and only their data is
+    replaced for every diagram, so the cost per diagram is mostly the rasterization
+
+    INPUT:
+    diagrams: Iterable of Functions.pourbaix.PourbaixDomains, e.g. a generator
+    paths: The file of each diagram
+    colours: {species: colour}, the same colour for a species in all diagrams. The colour cycle in the order the
+             species are met if None
+    figsize, dpi, alpha, water, linewidth, fontsize: See render and draw_domains
+
+    RETURNS:
+    The paths that were written
+    '''
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_xlabel('pH / [-]')
+    ax.set_ylabel('E / [V vs SHE]')
+    polygons = ax.add_collection(PolyCollection([], edgecolors='none', alpha=alpha))
+    lines = ax.add_collection(LineCollection([], colors='k', linewidths=linewidth))
+    texts = []
+    colours = {} if colours is None else dict(colours)
+
+    written = []
+    for domains, path in zip(diagrams, paths):
+        names = list(domains.polygons)
+        for name in names:
+            colours.setdefault(name, f'C{len(colours) % 10}')
+        polygons.set_verts([domains.polygons[name] for name in names])
+        polygons.set_facecolor([colours[name] for name in names])
+        segments, styles = _line_segments(domains, water)
+        lines.set_segments(segments)
+        lines.set_linestyle(styles)
+
+        while len(texts) < len(names):
+            texts.append(ax.text(0, 0, '', fontsize=fontsize, ha='center', va='center'))
+        for k, text in enumerate(texts):
+            if k < len(names):
+                text.set_position(domains.centroid(names[k]))
+                text.set_text(names[k])
+            text.set_visible(k < len(names))
+
+        (x0, x1), (y0, y1) = _window(domains)
+        ax.set_xlim(x0, x1)
+        ax.set_ylim(y0, y1)
+        ax.set_title(_title(domains))
+        fig.savefig(path)
+        written.append(path)
+    return written
+
+def _window(domains):
+    vertices = np.concatenate(list(domains.polygons.values()))     # The domains fill the window
+    return (vertices[:, 0].min(), vertices[:, 0].max()), (vertices[:, 1].min(), vertices[:, 1].max())
+
+def _title(domains):
+    return f'T = {domains.T - 273.15:.1f} $^\\circ$C, pZn = {domains.pZn}'
+
+# The boundaries and the water lines, as end points
+def _line_segments(domains, water):
+    segments = [np.array(ends) for ends in domains.boundaries.values()]
+    styles = ['solid']*len(segments)
+    if water:
+        from Data.thermodynamic_data import database
+        from Functions.pourbaix import reaction_lines
+        (x0, x1), _ = _window(domains)
+        water_lines = reaction_lines(database(domains.dataset), ['HER', 'OER'], domains.T, np.array([x0, x1]), domains.pZn,
+                                     domains.method or 'deltaG_T2')
+        segments += [np.column_stack([[x0, x1], E[0]]) for E in water_lines['E']]
+        styles += ['dashed']*2
+    return segments, styles
@@ -0,0 +1,143 @@
+import numpy as np
+from Functions.heat_capacity import species_integrals
+from Functions.reactions import boundary_pH
+
+class Sensitivity:
+    '''
+    Values and exact derivatives of E0, log(K), boundary pH and pZn thresholds with respect to the formation data.
+    Row i of jacobian is the gradient of outputs[i], column j the derivative with respect to parameters[j].
+    '''
+
+    def __init__(self, outputs, values, parameters, jacobian, T, method):
+        '''
+        INPUT:
+        outputs: Names of the outputs, e.g. 'E0_III-ox', 'logK_X', 'pH_XI-ox', 'pZn_passivation'
+        values: The outputs                                         - (n_outputs)
+        parameters: Names of the parameters, e.g. 'G_ZnO', 'S_ZnO', 'Cp_ZnO[1]'
+        jacobian: d(output)/d(parameter), in the units of the output per J/mol, J/K*mol or the unit of the Cp coefficient - (n_outputs x n_parameters)
+        T, method: The temperature and method they are valid for
+        '''
+        self.outputs = list(outputs)
+        self.values = values
+        self.parameters = list(parameters)
+        self.jacobian = jacobian
+        self.T = T
+        self.method = method
+        self._index = {name: i for i, name in enumerate(self.outputs)}
+
+    def gradient(self, output):
+        '''The derivatives of one output as {parameter: value}'''
+        return dict(zip(self.parameters, self.jacobian[self._index[output]]))
+
+    def ranking(self, output, sigma=None, top=10, kind=None):
+        '''
+        The parameters have different units, so either give sigma or compare one kind of parameter at a time.
+
+        INPUT:
+        output: Name of the output
+        sigma: Typical error of the parameters as {parameter: value}, ranks by |derivative|*sigma if given. Parameters not in sigma are left out
+        top: Number of parameters returned, all if None
+        kind: Only the parameters of one kind, 'G', 'S' or 'Cp'
+
+        RETURNS:
+        [(parameter, derivative), ...] with the largest effect first
+        '''
+        row = self.jacobian[self._index[output]]
+        if sigma is None:
+            weight = np.abs(row)
+        else:
+            weight = np.array([abs(value)*sigma.get(name, 0) for name, value in zip(self.parameters, row)])
+        if kind is not None:
+            weight = np.where([name.startswith(kind + '_') for name in self.parameters], weight, 0)
+        order = np.argsort(-weight, kind='stable')
+        order = order[weight[order] > 0][:top]
+        return [(self.parameters[j], row[j]) for j in order]
+
+    def __repr__(self):
+        return f'Sensitivity({len(self.outputs)} outputs, {len(self.parameters)} parameters, T = {self.T} K, {self.method})'
+
+# Derivatives of the Gibbs free energy of formation at T with respect to the formation data
+def species_derivatives(db, T, method='deltaG_T2'):
+    '''
+    Assumptions:
+    All methods give deltaG(T) = deltaG_1 - (T - T1)*deltaS_1 + (terms linear in the Cp coefficients), so the derivatives are
+    constants: 1 for G, -(T - T1) for S, and the Cp terms of the model evaluated with a unit coefficient. 'vant_Hoff',
+    'deltaG_weak' and 'E0_2' do not use Cp, 'deltaG_T2' uses the Maier-Kelley coefficients and 'heat_capacity' the model of each species
+
+    Input:
+    db : ThermoDatabase
+    T : Temperature                                             - [K]
+    method : As for ThermoDatabase.deltaG and ThermoDatabase.E0
+
+    Output:
+    parameters : Names of the parameters
+    D : d(G_species(T))/d(parameter)                            - (n_species x n_parameters)
+    '''
+    names = db.species_names
+    n = len(names)
+    cp_models = db.species_cp_models if method == 'heat_capacity' else [('maier_kelley', Cp) for Cp in db.formation_Cp]
+    cp_columns = [(j, k) for j, (_, coefficients) in enumerate(cp_models) for k in range(len(coefficients))]
+
+    D = np.zeros((n, 2*n + len(cp_columns)))
+    D[:, :n] = np.eye(n)                            # G
+    D[:, n:2*n] = -(T - db.T_ref)*np.eye(n)         # S
+    if method in ('deltaG_T2', 'heat_capacity'):
+        unit = [(cp_models[j][0], np.eye(len(cp_models[j][1]))[k]) for j, k in cp_columns]
+        H, S = species_integrals(unit, db.T_ref, T)
+        D[[j for j, _ in cp_columns], 2*n + np.arange(len(cp_columns))] = (H - T*S)[:, 0]
+
+    parameters = ['G_' + name for name in names] + ['S_' + name for name in names] + [f'Cp_{names[j]}[{k}]' for j, k in cp_columns]
+    return parameters, D
+
+# All sensitivities of a diagram in one pass
+def sensitivities(db, T=None, method='deltaG_T2', pZn=6, phase_model=None):
+    '''
+    Input:
+    db : ThermoDatabase
+    T : Temperature, the reference temperature if None      - [K]
+    method : As for ThermoDatabase.E0
+    pZn : -log10 of the activity of the dissolved Zn species, only changes the values of the boundary pH, not the derivatives
+    phase_model : Adds the pZn thresholds of a phase model, see Data.thermodynamic_data.phase_models
+
+    Output:
+    Sensitivity with, for every reaction, 'logK_<reaction>', 'E0_<reaction>' for the electrochemical reactions,
+    'pH_<reaction>' for the chemical reactions with protons, and 'pZn_<threshold>' for the thresholds of phase_model.
+    Every output is a linear function of the reaction Gibbs free energies, jacobian = C @ nu @ D
+    '''
+    T = db.T_ref if T is None else float(T)
+    R, F = db.constants['R'], db.constants['F']
+    RTln10 = R*T*np.log(10)
+    deltaG_method = 'deltaG_weak' if method == 'E0_2' else method   # E0_2 is the same as deltaG_weak
+    deltaG = db.deltaG(None, None if T == db.T_ref else T, deltaG_method)
+    s, h, nu_OH = db.activity_terms
+    W = db.reaction_index['W']
+    pKw = deltaG[W]/RTln10
+
+    # C holds the derivatives of the outputs with respect to the reaction Gibbs free energies
+    outputs, values, C = [], [], []
+    for i, name in enumerate(db.reaction_names):
+        row = np.zeros(len(db.reaction_names))
+        row[i] = -1/RTln10
+        outputs.append('logK_' + name)
+        values.append(-deltaG[i]/RTln10)
+        C.append(row)
+        if db.electrons[i] > 0:
+            outputs.append('E0_' + name)
+            values.append(-deltaG[i]/(db.electrons[i]*F))
+            C.append(row*RTln10/(db.electrons[i]*F))
+        elif h[i] != 0 and i != W:
+            row = row/h[i]
+            row[W] += nu_OH[i]/(h[i]*RTln10)                # Through pKw
+            outputs.append('pH_' + name)
+            values.append(boundary_pH(deltaG[i], s[i], h[i], nu_OH[i], T, pZn, pKw, R))
+            C.append(row)
+    for name, combination in ({} if phase_model is None else phase_model.get('pZn_thresholds', {})).items():
+        row = np.zeros(len(db.reaction_names))
+        for reaction, coefficient in combination.items():
+            row[db.reaction_index[reaction]] += coefficient/RTln10
+        outputs.append('pZn_' + name)
+        values.append(row @ deltaG)
+        C.append(row)
+
+    parameters, D = species_derivatives(db, T, method)
+    return Sensitivity(outputs, np.array(values), parameters, np.array(C) @ db.stoichiometry @ D, T, method)
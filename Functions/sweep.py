@@ -0,0 +1,151 @@
+import os
+from collections import deque
+import numpy as np
+from multiprocessing import Pool
+
+# One diagram of the sweep, run in the worker processes
+def sweep_frame(T, dataset=None, species=None, pZn=6, pH=None, E=None, method='deltaG_T2', raster=True):
+    '''
+    Input:
+    T : Temperature                                             - [K]
+    dataset : Name of the dataset, see Data.thermodynamic_data.database. Only the name is sent to the workers,
+              each worker builds the database once
+    species, pZn, method : See Functions.pourbaix.energy_planes
+    pH, E : The grid of the raster and the window of the polygons, see Functions.pourbaix.predominance_map
+    raster : Also compute the predominance map on the grid
+
+    Output:
+    Dictionary with 'T', 'pZn', 'species', 'polygons', 'boundaries', 'triple_points' and 'labels' (n_E x n_pH, if raster)
+    '''
+    from Data.thermodynamic_data import database
+    from Functions.pourbaix import pourbaix_domains, predominance_map
+    db = database(dataset)
+    pH = np.arange(0, 16, 0.01) if pH is None else np.asarray(pH, dtype=float)
+    E = np.linspace(-1.5, 1.5, 1000) if E is None else np.asarray(E, dtype=float)
+
+    domains = pourbaix_domains(db, species, T, pZn, (pH[0], pH[-1]), (E[0], E[-1]), method)
+    frame = {'T': float(T), 'pZn': pZn, 'species': domains.species, 'polygons': domains.polygons,
+             'boundaries': domains.boundaries, 'triple_points': domains.triple_points}
+    if raster:
+        pmap = predominance_map(db, species, T, pZn, pH, E, method)
+        frame.update(species=pmap.species, labels=pmap.labels, pH=pH, E=E)
+    return frame
+
+def _sweep_frames(chunk, options):
+    return [sweep_frame(T, **options) for T in chunk]
+
+# The frames of a temperature sweep, in the order of T, as soon as they are ready
+def iter_sweep(T, processes=None, chunksize=1, max_pending=None, **options):
+    '''
+    Assumptions:
+    At most max_pending chunks are in the pool at a time, and a new chunk is only sent when the oldest one has been
+    consumed. A slow consumer (e.g. an animation writer) therefore holds the pool back instead of the finished frames
+    piling up in this process
+
+    Input:
+    T : The temperatures                                        - [K] - (n_T)
+    processes : Number of worker processes, os.cpu_count() if None. 1 runs in this process
+    chunksize : Temperatures sent to a worker at a time
+    max_pending : Chunks that are computed or waiting at a time, 2*processes if None
+    options : dataset, species, pZn, pH, E, method and raster, see sweep_frame
+
+    Output:
+    Generator of the frames. At most max_pending*chunksize frames are kept in memory, independent of n_T
+    '''
+    T = [float(T_i) for T_i in np.atleast_1d(T)]
+    chunks = (T[k:k + chunksize] for k in range(0, len(T), chunksize))
+    if processes == 1:
+        for chunk in chunks:
+            yield from _sweep_frames(chunk, options)
+        return
+    processes = os.cpu_count() if processes is None else processes
+    max_pending = 2*processes if max_pending is None else max_pending
+    with Pool(processes) as pool:
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) == max_pending:
+                yield from pending.popleft().get()
+            pending.append(pool.apply_async(_sweep_frames, (chunk, options)))
+        while pending:
+            yield from pending.popleft().get()
+
+# Saving and reading single frames
+def save_frame(frame, path):
+    '''Saves a frame from sweep_frame as a compressed .npz file'''
+    arrays = {'T': frame['T'], 'pZn': frame['pZn'], 'species': np.array(frame['species']),
+              'domains': np.array(list(frame['polygons']))}
+    arrays.update({f'polygon_{k}': vertices for k, vertices in enumerate(frame['polygons'].values())})
+    if frame['triple_points']:
+        arrays['triple_names'] = np.array(['/'.join(names) for names in frame['triple_points']])
+        arrays['triple_points'] = np.array(list(frame['triple_points'].values()))
+    if frame['boundaries']:
+        arrays['boundary_names'] = np.array(['/'.join(pair) for pair in frame['boundaries']])
+        arrays['boundaries'] = np.array(list(frame['boundaries'].values()))
+    if 'labels' in frame:
+        arrays.update(labels=frame['labels'], pH=frame['pH'], E=frame['E'])
+    np.savez_compressed(path, **arrays)
+
+def load_frame(path):
+    '''Reads a frame saved with save_frame'''
+    with np.load(path) as data:
+        frame = {'T': float(data['T']), 'pZn': data['pZn'][()], 'species': [str(name) for name in data['species']],
+                 'polygons': {str(name): data[f'polygon_{k}'] for k, name in enumerate(data['domains'])},
+                 'triple_points': {}, 'boundaries': {}}
+        if 'triple_names' in data:
+            frame['triple_points'] = {tuple(name.split('/')): tuple(point) for name, point in zip(data['triple_names'], data['triple_points'])}
+        if 'boundary_names' in data:
+            frame['boundaries'] = {tuple(name.split('/')): tuple(map(tuple, ends)) for name, ends in zip(data['boundary_names'], data['boundaries'])}
+        if 'labels' in data:
+            frame.update(labels=data['labels'], pH=data['pH'], E=data['E'])
+    return frame
+
+# Drawing one frame, used for the animation
+def draw_frame(ax, frame, colours=None, alpha=0.3):
+    '''
+    Draws the domains of a frame with Functions.render.draw_domains
+
+    INPUT:
+    ax: The Axes, cleared first
+    frame: A frame from sweep_frame
+    colours: {species: colour}, the same colour for a species in all frames if None
+    alpha: Transparency (0-1)
+    '''
+    from Functions.pourbaix import PourbaixDomains
+    from Functions.render import draw_domains
+    ax.clear()
+    domains = PourbaixDomains(frame['polygons'], frame['boundaries'], frame['triple_points'], frame['T'], frame['pZn'], None)
+    if colours is None:
+        colours = {name: f'C{frame["species"].index(name) % 10}' for name in domains.polygons}
+    draw_domains(ax, domains, colours, alpha, water=False)
+    ax.set_title(f'T = {frame["T"] - 273.15:.1f} $^\\circ$C, pZn = {frame["pZn"]}')
+
+# The sweep, streamed to disk and/or to an animation
+def pourbaix_sweep(T, out_dir=None, writer=None, fig=None, processes=None, chunksize=1, max_pending=None, **options):
+    '''
+    Computes the diagrams for a temperature grid in a process pool. Every frame is written as soon as it is ready
+    and then dropped, and the pool only runs ahead of the writing by max_pending chunks (see iter_sweep), so the
+    memory does not grow with the number of temperatures.
+
+    Input:
+    T : The temperatures                                        - [K] - (n_T)
+    out_dir : Directory for the frames, frame_0000.npz, ... (see save_frame), nothing is saved if None
+    writer : A matplotlib animation writer that is already saving, e.g. inside
+             "with writer.saving(fig, 'sweep.mp4', dpi=100):", one frame is grabbed per temperature
+    fig : The figure of the writer, its first Axes is drawn on
+    processes, chunksize, max_pending : See iter_sweep
+    options : dataset, species, pZn, pH, E, method and raster, see sweep_frame
+
+    Output:
+    The paths of the saved frames
+    '''
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for k, frame in enumerate(iter_sweep(T, processes, chunksize, max_pending, **options)):
+        if out_dir is not None:
+            paths.append(os.path.join(out_dir, f'frame_{k:04d}.npz'))
+            save_frame(frame, paths[-1])
+        if writer is not None:
+            draw_frame(fig.axes[0], frame)
+            writer.grab_frame()
+    return paths
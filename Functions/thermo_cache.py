@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+import numpy as np
+
+CACHE_VERSION = 2   # Increase when the layout of the cached tables or the formulas behind them change
+
+# Where the tables are stored if no directory is given, can be changed with the environment variable ZABAT_CACHE
+default_cache_dir = os.environ.get('ZABAT_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'zabat'))
+
+def _jsonable(value):
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+# Content hash of everything the derived tables depend on
+def data_hash(db, method):
+    '''
+    Input:
+    db : ThermoDatabase
+    method : The temperature extrapolation method
+
+    Output:
+    Hexadecimal SHA-256 of the formation data, the reactions, the constants and the method. Any change of a value in
+    constants_deltaG_formation, constants_S_formation or constants_Cp gives a new hash, and with it a new cache entry
+    '''
+    content = {
+        'version': CACHE_VERSION,
+        'method': method,
+        'deltaG_formation': _jsonable(db.deltaG_formation),
+        'S_formation': _jsonable(db.S_formation),
+        'Cp': _jsonable(db.Cp),
+        'cp_models': _jsonable(db.cp_models),
+        'species': _jsonable(db.species),
+        'reactions': _jsonable(db.reactions),
+        'constants': _jsonable(db.constants),
+    }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+def _temperature_hash(T):
+    T = np.ascontiguousarray(T, dtype=float)
+    return hashlib.sha256(T.tobytes() + str(T.shape).encode()).hexdigest()
+
+def cache_path(db, T, method, cache_dir=None):
+    '''
+    Output:
+    The directory holding the tables for this data, temperature grid and method
+    '''
+    cache_dir = default_cache_dir if cache_dir is None else cache_dir
+    return os.path.join(cache_dir, f'{method}-{data_hash(db, method)[:20]}-{_temperature_hash(T)[:12]}')
+
+# Deriving all tables for a temperature grid
+def compute_tables(db, T, method):
+    '''
+    Output:
+    Dictionary with the temperature grid 'T', the reference properties 'deltaG_ref', 'deltaS', 'deltaH', 'deltaCp',
+    and the grids 'deltaG', 'E0' and 'logK' as (n_reactions x n_T) arrays. The rows follow db.reaction_names
+    '''
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    deltaG_method = 'deltaG_T2' if method == 'E0_2' else method
+    return {
+        'T': T,
+        'deltaG_ref': db.deltaG(),
+        'deltaS': db.deltaS(),
+        'deltaH': db.deltaH(),
+        'deltaCp': db.deltaCp(),
+        'deltaG': db.deltaG(None, T, deltaG_method),
+        'E0': db.E0(None, T, method),
+        'logK': db.logK(None, T, deltaG_method),
+    }
+
+def load_tables(db, T, method='deltaG_T2', cache_dir=None):
+    '''
+    Loads the derived tables for the temperature grid from the cache, computing and writing them the first time.
+
+    Input:
+    db : ThermoDatabase
+    T : The temperature grid                        - [K] - (n_T)
+    method : The method, see ThermoDatabase.deltaG and ThermoDatabase.E0
+    cache_dir : Directory for the cache, default_cache_dir if None
+
+    Output:
+    Dictionary with the tables as in compute_tables. When read from the cache the arrays are read-only memory maps
+    '''
+    path = cache_path(db, np.atleast_1d(np.asarray(T, dtype=float)), method, cache_dir)
+    if not os.path.isdir(path):
+        tables = compute_tables(db, T, method)
+        _write_tables(path, tables, db.reaction_names)
+        return tables
+
+    with open(os.path.join(path, 'reaction_names.json')) as file:
+        names = json.load(file)
+    if names != db.reaction_names:
+        raise ValueError(f'The cached tables in {path} do not match the reactions of the database')
+    return {name[:-4]: np.load(os.path.join(path, name), mmap_mode='r') for name in os.listdir(path) if name.endswith('.npy')}
+
+def _write_tables(path, tables, reaction_names):
+    # Written to a temporary directory that is renamed when complete, so that other processes never see half a cache entry
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.tmp-{uuid.uuid4().hex}'
+    os.makedirs(tmp)
+    for name, table in tables.items():
+        np.save(os.path.join(tmp, name + '.npy'), np.ascontiguousarray(table))
+    with open(os.path.join(tmp, 'reaction_names.json'), 'w') as file:
+        json.dump(list(reaction_names), file)
+    try:
+        os.rename(tmp, path)
+    except OSError:     # Another process wrote the same entry first
+        shutil.rmtree(tmp, ignore_errors=True)
@@ -0,0 +1,274 @@
+import numpy as np
+from functools import cached_property
+from Functions.reactions import stoichiometry_matrix, check_balance, reaction_protons, reaction_properties, E0_key, activity_terms
+
+class ThermoDatabase:
+    '''
+    Thermodynamic database with lazily computed and memoized reaction properties.
+
+    Nothing is derived when the object is created. The properties are computed for the reactions that are
+    asked for, and stored per reaction, temperature and method, so asking again is a dictionary lookup.
+    '''
+
+    def __init__(self, species, reactions, deltaG_formation, S_formation, Cp, constants, cp_models=None):
+        '''
+        INPUT:
+        species: Phase and composition of the species as {name: {'phase': 'aq', 'Zn': 1, 'O': 1, 'H': 1, 'charge': 1}}
+        reactions: The reactions as {name: {'nu': {species: coefficient}, 'n': electrons}}
+        deltaG_formation: Gibbs free energy of formation as {'deltaG_<species>': value}     - [J/mol]
+        S_formation: Entropy of the species as {'S_<species>': value}                       - [J/K*mol]
+        Cp: Heat capacity coefficients as {'Cp_<species>': [a, b, c]}                       - [J/K*mol]
+        constants: Dictionary with 'R', 'F' and the reference temperature 'T'
+        cp_models: Heat capacity model of the species as {name: (model, coefficients)}, see Functions.heat_capacity.
+                   Used by method='heat_capacity', the Maier-Kelley coefficients in Cp are used for species not given
+        '''
+        self.species = species
+        self.reactions = reactions
+        self.deltaG_formation = deltaG_formation
+        self.S_formation = S_formation
+        self.Cp = Cp
+        self.constants = constants
+        self.cp_models = {} if cp_models is None else cp_models
+        self.T_ref = constants['T']     # [K] - Temperature of the formation data
+
+        self._memo = {}                 # {(quantity, method, temperature): {reaction: value}}
+
+    ## Structure of the reaction network, built on first use
+    @cached_property
+    def species_names(self):
+        return list(self.species)
+
+    @cached_property
+    def reaction_names(self):
+        return list(self.reactions)
+
+    @cached_property
+    def reaction_index(self):
+        return {name: i for i, name in enumerate(self.reaction_names)}
+
+    @cached_property
+    def stoichiometry(self):
+        nu = stoichiometry_matrix(self.reactions, self.species_names)
+        check_balance(nu, self.electrons, self.species, self.reaction_names)
+        return nu
+
+    @cached_property
+    def electrons(self):
+        return np.array([self.reactions[name]['n'] for name in self.reaction_names], dtype=float)
+
+    @cached_property
+    def protons(self):
+        return reaction_protons(self.stoichiometry, self.species_names)
+
+    @cached_property
+    def activity_terms(self):
+        return activity_terms(self.stoichiometry, self.species)     # (s, h, nu_OH), see Functions.reactions.activity_terms
+
+    @cached_property
+    def formation_G(self):
+        return np.array([self.deltaG_formation['deltaG_' + name] for name in self.species_names], dtype=float)
+
+    @cached_property
+    def formation_S(self):
+        return np.array([self.S_formation['S_' + name] for name in self.species_names], dtype=float)
+
+    @cached_property
+    def formation_Cp(self):
+        return np.array([self.Cp['Cp_' + name] for name in self.species_names], dtype=float)
+
+    @cached_property
+    def species_cp_models(self):
+        return [self.cp_models.get(name, ('maier_kelley', self.Cp['Cp_' + name])) for name in self.species_names]
+
+    ## Reaction properties
+    def deltaG(self, reactions=None, T=None, method='deltaG_T2'):
+        '''
+        INPUT:
+        reactions: A reaction name, a list of names or None for all reactions
+        T: None for the reference temperature, or a temperature or an array of temperatures - [K]
+        method: 'deltaG_T2', 'vant_Hoff' or 'deltaG_weak', see Functions.Functions, or 'heat_capacity' for the exact
+                integrals of the heat capacity models of the species, see Functions.heat_capacity
+
+        RETURNS:
+        Gibbs free energy of reaction - [J/mol] - (n_reactions, n_T), without the axes that were not given as lists/arrays
+        '''
+        return self._query('deltaG', reactions, T, method)
+
+    def E0(self, reactions=None, T=None, method='deltaG_T2'):
+        '''
+        INPUT:
+        reactions, T: As for deltaG
+        method: 'deltaG_T2', 'vant_Hoff', 'deltaG_weak', 'heat_capacity' or 'E0_2', see Functions.Functions
+
+        RETURNS:
+        Standard reduction potential - [V vs SHE] - NaN for reactions without electrons
+        '''
+        return self._query('E0', reactions, T, method)
+
+    def deltaS(self, reactions=None, T=None):
+        # [J/K*mol] - At the reference temperature, or at T from the heat capacity models
+        return self._query('deltaS', reactions, T, None if T is None else 'heat_capacity')
+
+    def deltaH(self, reactions=None, T=None):
+        # [J/mol] - At the reference temperature, or at T from the heat capacity models
+        return self._query('deltaH', reactions, T, None if T is None else 'heat_capacity')
+
+    def deltaCp(self, reactions=None):
+        return self._query('deltaCp', reactions, None, None)    # [J/K*mol] - Heat capacity coefficients
+
+    def deltaG_stoichiometry(self, nu, T=None, method='deltaG_T2'):
+        '''
+        Gibbs free energy of reactions that are not in the database, e.g. the formation of the species from the element.
+        Not memoized.
+
+        INPUT:
+        nu: Stoichiometry matrix over species_names             - (n_reactions x n_species)
+        T, method: As for deltaG, 'E0_2' is the same as 'deltaG_weak'
+
+        RETURNS:
+        Gibbs free energy of reaction - [J/mol] - (n_reactions, n_T), without the temperature axis if T is not an array
+        '''
+        nu = np.atleast_2d(np.asarray(nu, dtype=float))
+        G_1 = reaction_properties(nu, self.formation_G)
+        if T is None:
+            return G_1
+        S_1 = reaction_properties(nu, self.formation_S)
+        H_1 = G_1 + self.T_ref*S_1
+        if method == 'heat_capacity':
+            from Functions.heat_capacity import reaction_thermo_T
+            used = np.flatnonzero(nu.any(axis=0))
+            values = reaction_thermo_T(nu[:, used], H_1, S_1, [self.species_cp_models[j] for j in used], self.T_ref, T)[2]
+        else:
+            from Functions.Functions import deltaG_sweep
+            values = deltaG_sweep(G_1, H_1, S_1, reaction_properties(nu, self.formation_Cp), self.T_ref, T,
+                                  'deltaG_weak' if method == 'E0_2' else method)
+        return values[:, 0] if np.ndim(T) == 0 else values
+
+    def logK(self, reactions=None, T=None, method='deltaG_T2'):
+        '''
+        RETURNS:
+        Base 10 logarithm of the equilibrium constant, log(K) = -deltaG/(RT*ln(10)) - [-]
+        '''
+        deltaG = self.deltaG(reactions, T, method)
+        T = self.T_ref if T is None else np.asarray(T, dtype=float)
+        return -deltaG/(self.constants['R']*T*np.log(10))
+
+    def table(self, quantity, T=None, method='deltaG_T2'):
+        '''
+        The property for all reactions as a dictionary with the same keys as in Data.thermodynamic_data,
+        e.g. table('deltaG') --> {'deltaG_I': ..., } and table('E0') --> {'EI_0': ..., }
+        '''
+        if quantity == 'E0':
+            names = [name for name in self.reaction_names if self.reactions[name]['n'] > 0]
+            return dict(zip(map(E0_key, names), self.E0(names, T, method)))
+        names = self.reaction_names
+        values = self.deltaG(names, T, method) if quantity == 'deltaG' else self._query(quantity, names, None, None)
+        return {quantity + '_' + name: value for name, value in zip(names, values)}
+
+    def tables(self, T, method='deltaG_T2', cache_dir=None):
+        '''
+        All derived tables for a temperature grid, read from the on-disk cache (see Functions.thermo_cache) when they
+        have been computed before for the same data and method. The grids are also used for later deltaG/E0 queries at T.
+
+        INPUT:
+        T: The temperature grid - [K] - (n_T)
+        method: As for E0
+        cache_dir: Directory for the cache, Functions.thermo_cache.default_cache_dir if None
+
+        RETURNS:
+        Dictionary with 'T', 'deltaG', 'E0' and 'logK' as (n_reactions x n_T) arrays and the reference properties
+        '''
+        from Functions.thermo_cache import load_tables
+        T = np.atleast_1d(np.asarray(T, dtype=float))
+        tables = load_tables(self, T, method, cache_dir)
+
+        key = self._temperature_key(T)
+        self._memo.setdefault(('E0', method, key), {}).update(zip(self.reaction_names, tables['E0']))
+        if method != 'E0_2':
+            self._memo.setdefault(('deltaG', method, key), {}).update(zip(self.reaction_names, tables['deltaG']))
+        return tables
+
+    def interpolants(self, T_min=273.15, T_max=373.15, degree=10, method='deltaG_T2'):
+        '''
+        Chebyshev series of E0(T) and logK(T) for all reactions, for fast queries at arbitrary temperatures.
+        The fit is made once per range, degree and method.
+
+        INPUT:
+        T_min, T_max: The temperature range - [K]
+        degree: Degree of the Chebyshev series
+        method: As for E0, 'E0_2' is only used for E0
+
+        RETURNS:
+        Dictionary with the ChebyshevTable for 'E0' and 'logK', see Functions.interpolants. The max_error of the
+        tables is the largest deviation from the exact formula, in V and in log units
+        '''
+        key = ('interpolants', method, (T_min, T_max, degree))
+        if key not in self._memo:
+            from Functions.interpolants import fit_chebyshev
+            deltaG_method = 'deltaG_T2' if method == 'E0_2' else method
+            exact_E0 = lambda T: self._compute('E0', self.reaction_names, T, method)
+            exact_logK = lambda T: -self._compute('deltaG', self.reaction_names, T, deltaG_method)/(self.constants['R']*T*np.log(10))
+            self._memo[key] = {
+                'E0': fit_chebyshev(exact_E0, T_min, T_max, self.reaction_names, degree, quantity='E0'),
+                'logK': fit_chebyshev(exact_logK, T_min, T_max, self.reaction_names, degree, quantity='logK'),
+            }
+        return self._memo[key]
+
+    def clear_cache(self):
+        '''Forgets all memoized values, needed if the formation data is changed in place'''
+        self._memo.clear()
+        for name in ('stoichiometry', 'electrons', 'protons', 'activity_terms', 'formation_G', 'formation_S', 'formation_Cp', 'species_cp_models'):
+            self.__dict__.pop(name, None)
+
+    ## Memoization
+    def _query(self, quantity, reactions, T, method):
+        single = isinstance(reactions, str)
+        names = self.reaction_names if reactions is None else [reactions] if single else list(reactions)
+
+        memo = self._memo.setdefault((quantity, method, self._temperature_key(T)), {})
+        missing = [name for name in names if name not in memo]
+        if missing:
+            memo.update(zip(missing, self._compute(quantity, missing, T, method)))
+
+        values = np.array([memo[name] for name in names])
+        return values[0] if single else values
+
+    @staticmethod
+    def _temperature_key(T):
+        if T is None:
+            return None
+        T = np.asarray(T, dtype=float)
+        return (T.shape, T.tobytes())
+
+    def _compute(self, quantity, names, T, method):
+        nu = self.stoichiometry[[self.reaction_index[name] for name in names]]
+        G_1 = reaction_properties(nu, self.formation_G)
+        S_1 = reaction_properties(nu, self.formation_S)
+        H_1 = G_1 + self.T_ref*S_1
+        Cp_1 = reaction_properties(nu, self.formation_Cp)
+
+        if quantity == 'deltaCp':
+            return Cp_1
+        if quantity in ('deltaS', 'deltaH', 'deltaG') and T is None:
+            return {'deltaS': S_1, 'deltaH': H_1, 'deltaG': G_1}[quantity]
+
+        n = self.electrons[[self.reaction_index[name] for name in names]]
+        T_eval = self.T_ref if T is None else T
+        if method == 'heat_capacity':
+            from Functions.heat_capacity import reaction_thermo_T
+            used = np.flatnonzero(nu.any(axis=0))     # Only the species taking part in the reactions are integrated
+            deltaH, deltaS, deltaG = reaction_thermo_T(nu[:, used], H_1, S_1, [self.species_cp_models[j] for j in used], self.T_ref, T_eval)
+            if quantity == 'E0':
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    values = np.where(n[:, None] > 0, -deltaG/(n[:, None]*self.constants['F']), np.nan)
+            else:
+                values = {'deltaH': deltaH, 'deltaS': deltaS, 'deltaG': deltaG}[quantity]
+            return values[:, 0] if np.ndim(T_eval) == 0 else values
+        from Functions.Functions import deltaG_sweep, E0_sweep     # Imported here to keep matplotlib out of the import of the database
+        if quantity == 'deltaG':
+            values = deltaG_sweep(G_1, H_1, S_1, Cp_1, self.T_ref, T_eval, method)
+        elif quantity == 'E0':
+            values = E0_sweep(G_1, H_1, S_1, Cp_1, n, self.T_ref, T_eval, method)
+        else:
+            raise ValueError(f"Unknown quantity '{quantity}'")
+        return values[:, 0] if np.ndim(T_eval) == 0 else values
@@ -0,0 +1,161 @@
+import itertools
+import numpy as np
+from Functions.pourbaix import energy_planes_T, formation_reactions
+
+class PhaseTopology:
+    '''
+    The pZn range where every domain of a Pourbaix diagram exists, at every temperature. The domains appear and vanish
+    at the ends of the ranges, so together they give the phase topology map in the (T, pZn) plane.
+    '''
+
+    def __init__(self, T, species, lower, upper, pH_range, E_range, method):
+        '''
+        INPUT:
+        T: The temperatures                                                 - [K] - (n_T)
+        species: Names of the species
+        lower, upper: The domain exists for lower <= pZn <= upper, -inf/inf if it does not end, NaN if never - (n_T x n_species)
+        pH_range, E_range: The window of the diagrams
+        method: The method of the Gibbs free energies
+        '''
+        self.T = T
+        self.species = list(species)
+        self.lower = lower
+        self.upper = upper
+        self.pH_range = pH_range
+        self.E_range = E_range
+        self.method = method
+
+    def thresholds(self, name):
+        '''The pZn where the domain of a species appears and vanishes      - (n_T), (n_T)'''
+        k = self.species.index(name)
+        return self.lower[:, k], self.upper[:, k]
+
+    def exists(self, pZn):
+        '''Whether the domain of each species exists                        - (n_T x n_pZn x n_species)'''
+        pZn = np.atleast_1d(np.asarray(pZn, dtype=float))[None, :, None]
+        return (self.lower[:, None, :] <= pZn) & (pZn <= self.upper[:, None, :])
+
+    def regions(self, pZn):
+        '''
+        The set of domains as a bit mask, bit k for species k, e.g. for a filled contour plot of the topology map
+        - (n_T x n_pZn)
+        '''
+        return (self.exists(pZn)*(1 << np.arange(len(self.species)))).sum(axis=2)
+
+    def __repr__(self):
+        return f'PhaseTopology({len(self.species)} species, T = {self.T[0]} - {self.T[-1]} K)'
+
+# The pZn ranges of the domains, for all temperatures at once
+def domain_thresholds(db=None, species=None, T=None, pH_range=(0, 16), E_range=(-1.5, 1.5), method='deltaG_T2', element='Zn'):
+    '''
+    Assumptions:
+    With x = (pH, E, pZn) the energy of a species is linear in x, so the points where species i predominates inside the
+    window form a convex polyhedron, bounded by g_i <= g_j and the window. The pZn range of the domain is the range of
+    pZn over the polyhedron, whose ends are at vertices: points where three of the bounding planes meet, i.e. a 3 x 3
+    linear system per combination, solved for all temperatures together. Four species with a common point, or a domain
+    leaving through the window, are both found this way
+
+    Input:
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    species, method, element : See Functions.pourbaix.energy_planes
+    T : The temperatures, the reference temperature if None        - [K] - (n_T)
+    pH_range, E_range : The window of the diagrams
+
+    Output:
+    PhaseTopology
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    T = np.atleast_1d(np.asarray(db.T_ref if T is None else T, dtype=float))
+    species, a, b, c, d = _planes(db, species, T, method, element)
+    L = db.constants['R']*T*np.log(10)
+    (x0, x1), (y0, y1) = pH_range, E_range
+    n_T, n_s = a.shape
+
+    # The window as rows of A x <= r
+    window_A = np.array([[-1, 0, 0], [1, 0, 0], [0, -1, 0], [0, 1, 0]], dtype=float)
+    window_r = np.array([-x0, x1, -y0, y1], dtype=float)
+
+    lower, upper = np.full((n_T, n_s), np.nan), np.full((n_T, n_s), np.nan)
+    for i in range(n_s):
+        others = [j for j in range(n_s) if j != i]
+        A = np.zeros((n_T, len(others) + 4, 3))
+        A[:, :len(others), 0] = b[:, [i]] - b[:, others]
+        A[:, :len(others), 1] = c[i] - c[others]
+        A[:, :len(others), 2] = -(d[i] - d[others])*L[:, None]
+        A[:, len(others):] = window_A
+        r = np.concatenate([a[:, others] - a[:, [i]], np.broadcast_to(window_r, (n_T, 4))], axis=1)
+        scale = np.linalg.norm(A, axis=2)
+        parallel = scale < 1e-12                                    # Parallel planes, the lowest (or the first of equal ones) wins
+        empty = (parallel & ((r < 0) | ((r == 0) & (np.arange(r.shape[1]) < i)))).any(axis=1)
+        scale[parallel] = 1
+        A, r = A/scale[:, :, None], np.where(parallel, 1, r/scale)
+
+        vertices = _vertices(A, r)                                  # (n_T x n_combinations x 3), NaN if not a vertex
+        p = vertices[:, :, 2]
+        found = ~np.isnan(p).all(axis=1) & ~empty
+        lower[found, i] = np.nanmin(p[found], axis=1)
+        upper[found, i] = np.nanmax(p[found], axis=1)
+
+        # Unbounded in pZn if no bounding plane depends on pZn in that direction
+        lower[found & (A[:, :, 2] >= -1e-12).all(axis=1), i] = -np.inf
+        upper[found & (A[:, :, 2] <= 1e-12).all(axis=1), i] = np.inf
+    return PhaseTopology(T, species, lower, upper, pH_range, E_range, method)
+
+def _vertices(A, r, tolerance=1e-9):
+    combinations = np.array(list(itertools.combinations(range(A.shape[1]), 3)))
+    M, v = A[:, combinations], r[:, combinations]                  # (n_T x n_combinations x 3 x 3), (n_T x n_combinations x 3)
+    singular = np.abs(np.linalg.det(M)) < 1e-10
+    M = np.where(singular[..., None, None], np.eye(3), M)
+    x = np.linalg.solve(M, v[..., None])[..., 0]
+    feasible = ~singular & (np.einsum('tmk,tck->tcm', A, x) <= r[:, None, :] + tolerance*(1 + np.abs(x).max(axis=2, keepdims=True))).all(axis=2)
+    return np.where(feasible[..., None], x, np.nan)
+
+# All triple points as functions of T and pZn
+def triple_points_T(db=None, species=None, T=None, pZn=6, pH_range=(0, 16), E_range=(-1.5, 1.5), method='deltaG_T2', element='Zn'):
+    '''
+    Assumptions:
+    A triple point is where three planes are equal and no other plane is lower, a 2 x 2 linear system per combination
+    of three species. Species with parallel planes in E (the same number of electrons per atom) have no common point
+
+    Input:
+    db, species, T, method, element : See domain_thresholds
+    pZn : The values of pZn                                         - (n_pZn)
+    pH_range, E_range : Only the points inside the window are kept
+
+    Output:
+    {(species, species, species): (pH, E)}, NaN where the point is not part of the diagram   - (n_T x n_pZn)
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    T = np.atleast_1d(np.asarray(db.T_ref if T is None else T, dtype=float))
+    pZn = np.atleast_1d(np.asarray(pZn, dtype=float))
+    species, a, b, c, d = _planes(db, species, T, method, element)
+    L = db.constants['R']*T*np.log(10)
+    a = a[:, None, :] - d*L[:, None, None]*pZn[:, None]             # (n_T x n_pZn x n_species)
+    b = b[:, None, :]
+    (x0, x1), (y0, y1) = pH_range, E_range
+
+    points = {}
+    for i, j, k in itertools.combinations(range(len(species)), 3):
+        b1, b2, c1, c2 = b[..., i] - b[..., j], b[..., i] - b[..., k], c[i] - c[j], c[i] - c[k]
+        determinant = b1*c2 - b2*c1
+        if np.all(np.abs(determinant) < 1e-12*(np.abs(b1*c2) + np.abs(b2*c1) + 1e-300)):
+            continue
+        a1, a2 = a[..., j] - a[..., i], a[..., k] - a[..., i]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = (a1*c2 - a2*c1)/determinant
+            y = (b1*a2 - b2*a1)/determinant
+        g = a + b*x[..., None] + c*y[..., None]
+        valid = (g[..., i] <= g.min(axis=2) + 1e-9*np.abs(g).max(axis=2)) & (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+        if valid.any():
+            points[(species[i], species[j], species[k])] = (np.where(valid, x, np.nan), np.where(valid, y, np.nan))
+    return points
+
+# The planes at pZn = 0 and the pZn term per element atom
+def _planes(db, species, T, method, element):
+    species, a, b, c = energy_planes_T(db, species, T, 0, method, element)
+    _, _, k, _, _, dissolved = formation_reactions(db, species, element)
+    return species, a, b, c, dissolved/k
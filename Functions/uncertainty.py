@@ -0,0 +1,121 @@
+import numpy as np
+from Functions.reactions import nernst_potential, boundary_pH
+
+# Drawing samples of the formation data
+def sample_formation(db, N, sigma_G, sigma_S=0, seed=None):
+    '''
+    Assumptions:
+    The errors of the species are independent and normally distributed. A single number is used for all species except those
+    where the value is zero, which are zero by definition (deltaG of Zn(s), H^+, H2(g), O2(g) and S of H^+)
+
+    Input:
+    db : ThermoDatabase
+    N : Number of samples
+    sigma_G : Standard deviation of the Gibbs free energy of formation, a number, an array (n_species) or {species: value} - [J/mol]
+    sigma_S : Standard deviation of the entropy, as for sigma_G, only matters away from the reference temperature         - [J/K*mol]
+    seed : Seed for the random numbers, for repeatable results
+
+    Output:
+    dG, dS : The deviations from the formation data in db      - (N x n_species)
+    '''
+    rng = np.random.default_rng(seed)
+    dG = rng.standard_normal((N, len(db.species_names)))*_species_sigma(db, sigma_G, db.formation_G)
+    dS = rng.standard_normal((N, len(db.species_names)))*_species_sigma(db, sigma_S, db.formation_S)
+    return dG, dS
+
+def _species_sigma(db, sigma, formation):
+    if isinstance(sigma, dict):
+        return np.array([sigma.get(name, 0) for name in db.species_names], dtype=float)
+    if np.ndim(sigma) == 0:
+        return np.where(formation != 0, float(sigma), 0)
+    return np.asarray(sigma, dtype=float)
+
+# Gibbs free energy of all reactions for all samples
+def ensemble_deltaG(db, dG, dS, T, method='deltaG_T2'):
+    '''
+    Assumptions:
+    Every method in ThermoDatabase is of the form deltaG(T) = deltaG_1 - (T - T1)*deltaS_1 + (terms with Cp only), so a deviation
+    of the formation data gives the exact deviation nu @ (dG - (T - T1)*dS) for all samples at once. Cp is not sampled
+
+    Input:
+    db : ThermoDatabase
+    dG, dS : Deviations of the formation data, see sample_formation - (N x n_species)
+    T : Temperature                                                 - [K]
+    method : As for ThermoDatabase.deltaG
+
+    Output:
+    deltaG : Gibbs free energy for all reactions and samples        - [J/mol] - (N x n_reactions)
+    '''
+    # E0_2 is the same as deltaG_weak, E0_1 + deltaS_1*(T - T1)/(nF) = -(deltaH_1 - T*deltaS_1)/(nF)
+    deltaG = db.deltaG(None, None if T == db.T_ref else T, 'deltaG_weak' if method == 'E0_2' else method)
+    return deltaG[None, :] + (dG - (T - db.T_ref)*dS) @ db.stoichiometry.T
+
+# Confidence bands of the boundaries and triple points of a Pourbaix diagram
+def pourbaix_uncertainty(db, phase_model, sigma_G, sigma_S=0, N=10000, T=None, pZn=6, pH=None, method='deltaG_T2',
+                         percentiles=(2.5, 50, 97.5), seed=None):
+    '''
+    Input:
+    db : ThermoDatabase
+    phase_model : The boundaries as {'reactions': [...], 'triple_points': {name: (chemical, electrochemical)}},
+                  see Data.thermodynamic_data.phase_models
+    sigma_G, sigma_S, seed : See sample_formation
+    N : Number of samples
+    T : Temperature, the reference temperature if None      - [K]
+    pZn : -log10 of the activity of the dissolved Zn species
+    pH : pH values for the bands of the electrochemical lines, np.arange(0, 16, 0.01) if None
+    method : As for ThermoDatabase.deltaG
+    percentiles : The percentiles of the bands, e.g. (2.5, 50, 97.5) for the median and a 95 % band
+
+    Output:
+    Dictionary with, for the percentiles along the first axis:
+    'E0' : {reaction: E0}                       - [V vs SHE] for the electrochemical reactions
+    'pH_boundary' : {reaction: pH}              - [-] for the chemical reactions
+    'lines' : {reaction: E(pH)}                 - [V vs SHE] - (n_percentiles x n_pH) for the electrochemical reactions
+    'triple_points' : {name: {'pH': pH, 'E': E}}
+    'samples' : The samples behind the bands, {'E0': {...}, 'pH_boundary': {...}, 'triple_points': {...}} with arrays (N)
+    and the inputs 'T', 'pZn', 'pH', 'N' and 'percentiles'
+    '''
+    T = db.T_ref if T is None else float(T)
+    pH = np.arange(0, 16, 0.01) if pH is None else np.asarray(pH, dtype=float)
+    R, F = db.constants['R'], db.constants['F']
+
+    dG, dS = sample_formation(db, N, sigma_G, sigma_S, seed)
+    deltaG = ensemble_deltaG(db, dG, dS, T, method)                       # (N x n_reactions)
+    pKw = deltaG[:, db.reaction_index['W']]/(R*T*np.log(10))              # (N)
+    s, h, nu_OH = db.activity_terms
+
+    E0_samples, pH_samples = {}, {}
+    for name in phase_model['reactions']:
+        i = db.reaction_index[name]
+        if db.electrons[i] > 0:
+            E0_samples[name] = -deltaG[:, i]/(db.electrons[i]*F)
+        else:
+            pH_samples[name] = boundary_pH(deltaG[:, i], s[i], h[i], nu_OH[i], T, pZn, pKw, R)
+
+    triple_samples = {}
+    for point, (chemical, electrochemical) in phase_model['triple_points'].items():
+        i, j = db.reaction_index[chemical], db.reaction_index[electrochemical]
+        pH_point = boundary_pH(deltaG[:, i], s[i], h[i], nu_OH[i], T, pZn, pKw, R)
+        E0 = -deltaG[:, j]/(db.electrons[j]*F)
+        triple_samples[point] = {'pH': pH_point, 'E': nernst_potential(E0, db.electrons[j], s[j], h[j], nu_OH[j], T, pH_point, pZn, pKw, R, F)}
+
+    # The lines only move up and down with E0 (and pKw for reactions with OH^-), so their bands follow from the bands of E0
+    lines = {}
+    for name, E0 in E0_samples.items():
+        i = db.reaction_index[name]
+        if nu_OH[i] == 0:
+            E0_band = np.percentile(E0, percentiles)
+            lines[name] = nernst_potential(E0_band[:, None], db.electrons[i], s[i], h[i], 0, T, pH[None, :], pZn, 0, R, F)
+        else:
+            lines[name] = np.percentile(nernst_potential(E0[:, None], db.electrons[i], s[i], h[i], nu_OH[i], T, pH[None, :], pZn,
+                                                         pKw[:, None], R, F), percentiles, axis=0)
+
+    return {
+        'T': T, 'pZn': pZn, 'pH': pH, 'N': N, 'percentiles': np.asarray(percentiles),
+        'E0': {name: np.percentile(value, percentiles) for name, value in E0_samples.items()},
+        'pH_boundary': {name: np.percentile(value, percentiles) for name, value in pH_samples.items()},
+        'lines': lines,
+        'triple_points': {point: {axis: np.percentile(value, percentiles) for axis, value in values.items()}
+                          for point, values in triple_samples.items()},
+        'samples': {'E0': E0_samples, 'pH_boundary': pH_samples, 'triple_points': triple_samples},
+    }
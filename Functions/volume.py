@@ -0,0 +1,147 @@
+import hashlib
+import os
+import uuid
+import numpy as np
+from Functions.pourbaix import PredominanceMap, energy_planes_T, lowest_line, domain_polygons
+
+class PredominanceVolume:
+    '''
+    The predominating species on a (T x E x pH) grid. The labels are a read-only memory map of the cached volume,
+    so slices are read from disk when they are used and nothing is recomputed.
+    '''
+
+    def __init__(self, pH, E, T, labels, species, pZn, method, path=None):
+        '''
+        INPUT:
+        pH, E, T: The axes of the grid                          - (n_pH), [V vs SHE] - (n_E), [K] - (n_T)
+        labels: Index in species of the predominating species   - (n_T x n_E x n_pH)
+        species: Names of the species
+        pZn, method: -log10 of the activity of the dissolved species and the method
+        path: The cache file of the labels, None if not cached
+        '''
+        self.pH = pH
+        self.E = E
+        self.T = T
+        self.labels = labels
+        self.species = list(species)
+        self.pZn = pZn
+        self.method = method
+        self.path = path
+
+    def at_T(self, T):
+        '''The PredominanceMap at the grid temperature nearest to T'''
+        k = np.abs(self.T - T).argmin()
+        return PredominanceMap(self.pH, self.E, np.asarray(self.labels[k]), self.species, self.T[k], self.pZn, self.method)
+
+    def at_pH(self, pH):
+        '''The labels at the grid pH nearest to pH           - (n_T x n_E)'''
+        return np.asarray(self.labels[:, :, np.abs(self.pH - pH).argmin()])
+
+    def at_E(self, E):
+        '''The labels at the grid potential nearest to E     - (n_T x n_pH)'''
+        return np.asarray(self.labels[:, np.abs(self.E - E).argmin(), :])
+
+    def __repr__(self):
+        return f'PredominanceVolume({len(self.species)} species, {self.labels.shape[2]} x {self.labels.shape[1]} x {self.labels.shape[0]} grid, pZn = {self.pZn})'
+
+# The labelled (pH, E, T) volume
+def predominance_volume(db=None, species=None, T=None, pZn=6, pH=None, E=None, method='deltaG_T2', element='Zn',
+                        cache_dir=None, block=16):
+    '''
+    Assumptions:
+    Every (T, E) row is a set of lines in pH, and all rows of all temperatures are labelled together with
+    Functions.pourbaix.lowest_line, a block of temperatures at a time so the memory does not grow with n_T
+
+    Input:
+    db : ThermoDatabase, Data.thermodynamic_data.database() if None
+    species, pZn, method, element : See Functions.pourbaix.energy_planes
+    T : The temperatures, np.linspace(273.15, 373.15, 101) if None   - [K]
+    pH : Increasing pH values, np.arange(0, 16.001, 0.05) if None
+    E : The potentials, np.linspace(-1.5, 1.5, 301) if None          - [V vs SHE]
+    cache_dir : Directory of the cached volumes, Functions.thermo_cache.default_cache_dir if None, False to not cache
+    block : Number of temperatures labelled at a time
+
+    Output:
+    PredominanceVolume, with the labels memory mapped from the cache file
+    '''
+    from Functions.thermo_cache import data_hash, default_cache_dir
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    T = np.linspace(273.15, 373.15, 101) if T is None else np.atleast_1d(np.asarray(T, dtype=float))
+    pH = np.arange(0, 16.001, 0.05) if pH is None else np.asarray(pH, dtype=float)
+    E = np.linspace(-1.5, 1.5, 301) if E is None else np.asarray(E, dtype=float)
+    species, a, b, c = energy_planes_T(db, species, T, pZn, method, element)
+    shape = (len(T), len(E), len(pH))
+
+    path = None
+    if cache_dir is not False:
+        key = hashlib.sha256(b''.join(np.ascontiguousarray(axis, dtype=float).tobytes() + str(len(axis)).encode() for axis in (T, E, pH))
+                             + repr((species, float(pZn), element)).encode()).hexdigest()[:16]
+        path = os.path.join(default_cache_dir if cache_dir is None else cache_dir, f'volume-{method}-{data_hash(db, method)[:20]}-{key}.npy')
+        if os.path.exists(path):
+            return PredominanceVolume(pH, E, T, np.load(path, mmap_mode='r'), species, pZn, method, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.tmp-{uuid.uuid4().hex}'
+        labels = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.int16, shape=shape)
+    else:
+        labels = np.empty(shape, dtype=np.int16)
+
+    for start in range(0, len(T), block):
+        stop = min(start + block, len(T))
+        alpha = a[start:stop, None, :] + c*E[None, :, None]            # (n_block x n_E x n_species)
+        beta = np.broadcast_to(b[start:stop, None, :], alpha.shape)
+        labels[start:stop] = lowest_line(alpha.reshape(-1, len(species)), beta.reshape(-1, len(species)), pH).reshape(stop - start, *shape[1:])
+
+    if path is None:
+        return PredominanceVolume(pH, E, T, labels, species, pZn, method)
+    labels.flush()
+    del labels
+    os.replace(tmp, path)       # Complete files only, so other processes never read half a volume
+    return PredominanceVolume(pH, E, T, np.load(path, mmap_mode='r'), species, pZn, method, path)
+
+# The boundary surfaces between the domains as triangle meshes
+def boundary_surfaces(db=None, species=None, T=None, pZn=6, pH_range=(0, 16), E_range=(-1.5, 1.5), method='deltaG_T2', element='Zn'):
+    '''
+    Assumptions:
+    At every temperature the boundaries are the exact segments of Functions.pourbaix.domain_polygons. The surface of a
+    pair of domains is made of the quads between its segments at neighbouring temperatures, so it is exact on the
+    temperature grid and linear in between. Where a boundary appears or vanishes the surface ends at the last
+    temperature it exists at
+
+    Input:
+    db, species, pZn, method, element : As for predominance_volume
+    T : The temperatures, np.linspace(273.15, 373.15, 101) if None   - [K]
+    pH_range, E_range : The window
+
+    Output:
+    {(species, species): (vertices, faces)}, the (pH, E, T) vertices (n_vertices x 3) and the triangles as indices
+    into the vertices (n_faces x 3)
+    '''
+    if db is None:
+        from Data.thermodynamic_data import database
+        db = database()
+    T = np.linspace(273.15, 373.15, 101) if T is None else np.atleast_1d(np.asarray(T, dtype=float))
+    species, a, b, c = energy_planes_T(db, species, T, pZn, method, element)
+    direction = np.array([1.0, 10.0])       # Orients the segments the same way at every temperature
+
+    segments = {}
+    for k in range(len(T)):
+        for pair, ends in domain_polygons(species, a[k], b[k], c, pH_range, E_range)[1].items():
+            P, Q = np.array(ends)
+            if (Q - P) @ direction < 0:
+                P, Q = Q, P
+            segments.setdefault(pair, {})[k] = (P, Q)
+
+    surfaces = {}
+    for pair, by_T in segments.items():
+        vertices, faces, index = [], [], {}
+        for k in sorted(by_T):
+            index[k] = len(vertices)
+            vertices += [(*by_T[k][0], T[k]), (*by_T[k][1], T[k])]
+            if k - 1 in index:
+                i, j = index[k - 1], index[k]
+                faces += [(i, i + 1, j), (i + 1, j + 1, j)]
+        if faces:
+            surfaces[pair] = (np.array(vertices), np.array(faces))
+    return surfaces
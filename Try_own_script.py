@@ -10,9 +10,10 @@ Based on chat_gpt.py
 import numpy as np
 from scipy.optimize import fsolve
 import matplotlib.pyplot as plt
+from Functions.equilibrium_constants import constants_at_T
 
 class Zn_solution:
-    def __init__(self, initial_concentrations):
+    def __init__(self, initial_concentrations, T=25+273.15, logK_table=None):
 
         '''
         INPUT:
@@ -21,6 +22,8 @@ class Zn_solution:
         Currently, KOH is not used since it would dominate the pH, so the pH is instead set to vary.
         It is also assumed full dissociation of K2CO3 and KF.
         Concentration of Zn^+ is assumed to be a natural occuring concentration and usually very low
+        T: Temperature in K, the constants are given at 25 degrees and moved to T with the thermodynamic data (Functions.equilibrium_constants)
+        logK_table: Table from Functions.equilibrium_constants.logK_table, to avoid the database call when many temperatures are used
         '''
         
         # Dictionary with equilibrium constants
@@ -29,6 +32,11 @@ class Zn_solution:
                                         'pCO2': 10**(-1.55), 'HF': 10**3.3, 'HF2': 10**0.86,\
                                         'ZnF': 10**0.8}  # Initialize with a non-zero value
         #'CO3': 10**(-2.0), , 'H2O': 10**4.18, 'KOH': 10**(-0.2)
+
+        # Constants at the temperature T
+        self.T = T
+        self.equilibrium_constants = constants_at_T(self.equilibrium_constants, T, table=logK_table)
+        self.Kw = constants_at_T({'Kw': 10**(-13.96)}, T, table=logK_table)['Kw']     # Ion product of water
         
         # Initial concentration of species
         self.c_Zn_2 = initial_concentrations[0]     # Setting the initial concentration of Zn^2+ for the system
@@ -66,7 +74,7 @@ class Zn_solution:
 
         # Concentration of protons and hydroxide from pH
         c_H = 10**(-pH)
-        c_OH = 10**(-13.96)/c_H
+        c_OH = self.Kw/c_H
 
         # Values from x needed to solve the system
         c_Zn_2 = x[0]
@@ -292,10 +300,11 @@ c_Zn_2_0 = 10**(-6)
 c_KOH_0 = 7
 c_K2CO3_0 = 1.4
 c_KF_0 = 1.4
+T = 25 + 273.15                                                             # Temperature - [K]
 
 # Initialises and solving the system
 initial_concentrations = np.array([c_Zn_2_0, c_KOH_0, c_K2CO3_0, c_KF_0])   # Initial concentrations
-Zn_solution_system = Zn_solution(initial_concentrations)                    # Initialises the Zn-solution class
+Zn_solution_system = Zn_solution(initial_concentrations, T)                 # Initialises the Zn-solution class
 Zn_solution_system.calculate_Zn_solution_concentrations()                   # Calculates the concentration distributions
 Zn_solution_system.plot_Zn_species_distribution()                           # Plots the Zn-species concentration distribution
 Zn_solution_system.plot_COx_species_distribution()                          # Plots the COx-species concentration distribution
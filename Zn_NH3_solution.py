@@ -10,9 +10,10 @@ Based on chat_gpt.py
 import numpy as np
 from scipy.optimize import fsolve
 import matplotlib.pyplot as plt
+from Functions.equilibrium_constants import constants_at_T
 
 class Zn_solution:
-    def __init__(self, initial_concentrations):
+    def __init__(self, initial_concentrations, T=25+273.15, logK_table=None):
 
         '''
         INPUT:
@@ -21,6 +22,8 @@ class Zn_solution:
         Currently, KOH is not used since it would dominate the pH, so the pH is instead set to vary.
         It is also assumed full dissociation of K2CO3 and KF.
         Concentration of Zn^+ is assumed to be a natural occuring concentration and usually very low
+        T: Temperature in K, the constants are given at 25 degrees and moved to T with the thermodynamic data (Functions.equilibrium_constants)
+        logK_table: Table from Functions.equilibrium_constants.logK_table, to avoid the database call when many temperatures are used
         '''
         
         # Dictionary with equilibrium constants
@@ -38,6 +41,12 @@ class Zn_solution:
                                         'NH3': 10**(-9.246)}  # Initialize with a non-zero value
         
         #'CO3': 10**(-2.0), , 'H2O': 10**4.18, 'KOH': 10**(-0.2)
+
+        # Constants at the temperature T
+        self.T = T
+        self.equilibrium_constants = constants_at_T(self.equilibrium_constants, T, table=logK_table)
+        self.equilibrium_constants_2 = constants_at_T(self.equilibrium_constants_2, T, table=logK_table)
+        self.Kw = constants_at_T({'Kw': 10**(-13.96)}, T, table=logK_table)['Kw']     # Ion product of water
         
         # Initial concentration of species
         self.c_Zn_2 = initial_concentrations[0]     # Setting the initial concentration of Zn^2+ for the system
@@ -74,7 +83,7 @@ class Zn_solution:
 
         # Concentration of protons and hydroxide from pH
         c_H = 10**(-pH)
-        c_OH = 10**(-13.96)/c_H
+        c_OH = self.Kw/c_H
 
         # Values from x needed to solve the system
         c_Zn_2 = x[0]
@@ -435,10 +444,11 @@ c_K2CO3_0 = 1.5#1.5
 c_NH4OH_0 = 1.5*10**(0)#0.5 --  Check this number, can't be 1.5
 
 pZn = -np.log10(c_Zn_2_0)
+T = 25 + 273.15                                                             # Temperature - [K]
 
 # Initialises and solving the system
 initial_concentrations = np.array([c_Zn_2_0, c_KOH_0, c_K2CO3_0, c_NH4OH_0])   # Initial concentrations
-Zn_solution_system = Zn_solution(initial_concentrations)                    # Initialises the Zn-solution class
+Zn_solution_system = Zn_solution(initial_concentrations, T)                 # Initialises the Zn-solution class
 Zn_solution_system.calculate_Zn_solution_concentrations()                   # Calculates the concentration distributions
 Zn_solution_system.plot_Zn_species_distribution()                           # Plots the Zn-species concentration distribution
 Zn_solution_system.plot_COx_species_distribution()                          # Plots the COx-species concentration distribution
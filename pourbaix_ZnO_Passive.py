@@ -1,168 +1,22 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from Functions.Functions import vant_Hoff, deltaG_weak, deltaG_T2, E0_2
-from Data.thermodynamic_data import *
+from Data.thermodynamic_data import constants, constants_deltaG_formation, database, reaction_deltaG_T, reaction_E0_T, delta_r_G, constants_E0, electrochemical
+from Functions.pourbaix import reaction_lines
 
 T = 85+273.15           # [K] - Temperature
 
 ################################ THERMODYNAMIC DATA AT DIFFERENT TEMPERATURES ################################
 
-## Gibbs free energy using no assumptions, except that the heat capacities are valid in this range
-deltaG_new_T = {
-    'deltaG_I': deltaG_T2(delta_r_H['deltaH_I'], delta_r_S['deltaS_I'], delta_r_Cp['deltaCp_I'], constants['T'], T),                               # [J/mol] - Zn^2+ + 2e^- <--> Zn(s)
-    'deltaG_II': deltaG_T2(delta_r_H['deltaH_II'], delta_r_S['deltaS_II'], delta_r_Cp['deltaCp_II'], constants['T'], T),                           # [J/mol] - Zn(OH)^+ + 2e^- + H^+ <--> Zn(s) + H2O
-    
-    'deltaG_III-eps': deltaG_T2(delta_r_H['deltaH_III-eps'], delta_r_S['deltaS_III-eps'], delta_r_Cp['deltaCp_III-eps'], constants['T'], T),       # [J/mol] - Zn(OH)2 + 2e^- + 2H^+ <--> Zn(s) + H2O
-    'deltaG_III': deltaG_T2(delta_r_H['deltaH_III'], delta_r_S['deltaS_III'], delta_r_Cp['deltaCp_III'], constants['T'], T),                       # [J/mol] - Zn(OH)2 + 2e^- + 2H^+ <--> Zn(s) + H2O
-    'deltaG_III-ox': deltaG_T2(delta_r_H['deltaH_III-ox'], delta_r_S['deltaS_III-ox'], delta_r_Cp['deltaCp_III-ox'], constants['T'], T),           # [J/mol] - ZnO + 2e^- + 2H^+ <--> Zn + H2O
-    
-    'deltaG_IV': deltaG_T2(delta_r_H['deltaH_IV'], delta_r_S['deltaS_IV'], delta_r_Cp['deltaCp_IV'], constants['T'], T),                           # [J/mol] - Zn(OH)3^- + 2e^- + 3H^+ <--> Zn(s) + 3H2O 
-    'deltaG_V': deltaG_T2(delta_r_H['deltaH_V'], delta_r_S['deltaS_V'], delta_r_Cp['deltaCp_V'], constants['T'], T),                               # [J/mol] - Zn(OH)4^2- + 2e^- + 4H^+ <--> Zn(s) + 4H2O
-    
-    'deltaG_VIII-eps': deltaG_T2(delta_r_H['deltaH_VIII-eps'], delta_r_S['deltaS_VIII-eps'], delta_r_Cp['deltaCp_VIII-eps'], constants['T'], T),   # [J/mol] - Zn^2+ + 2OH^- <--> Zn(OH)2
-    'deltaG_VIII': deltaG_T2(delta_r_H['deltaH_VIII'], delta_r_S['deltaS_VIII'], delta_r_Cp['deltaCp_VIII'], constants['T'], T),                   # [J/mol] - Zn^2+ + 2OH^- <--> Zn(OH)2
-    'deltaG_VIII-ox': deltaG_T2(delta_r_H['deltaH_VIII-ox'], delta_r_S['deltaS_VIII-ox'], delta_r_Cp['deltaCp_VIII-ox'], constants['T'], T),       # [J/mol] - Zn^2+ + 2OH^- <--> ZnO + H2O
-    
-    'deltaG_IX-eps': deltaG_T2(delta_r_H['deltaH_IX-eps'], delta_r_S['deltaS_IX-eps'], delta_r_Cp['deltaCp_IX-eps'], constants['T'], T),           # [J/mol] - Zn(OH)2 + OH^- <--> Zn(OH)3^-
-    'deltaG_IX': deltaG_T2(delta_r_H['deltaH_IX'], delta_r_S['deltaS_IX'], delta_r_Cp['deltaCp_IX'], constants['T'], T),                           # [J/mol] - Zn(OH)2 + OH^- <--> Zn(OH)3^-
-    'deltaG_IX-ox': deltaG_T2(delta_r_H['deltaH_IX-ox'], delta_r_S['deltaS_IX-ox'], delta_r_Cp['deltaCp_IX-ox'], constants['T'], T),                  # [J/mol] - ZnO + H2O + OH^- <--> Zn(OH)3^-
-    
-    'deltaG_X': deltaG_T2(delta_r_H['deltaH_X'], delta_r_S['deltaS_X'], delta_r_Cp['deltaCp_X'], constants['T'], T),                               # [J/mol] - Zn(OH)3^- + OH^- <--> Zn(OH)4^-2
-    
-    'deltaG_XI-eps': deltaG_T2(delta_r_H['deltaH_XI-eps'], delta_r_S['deltaS_XI-eps'], delta_r_Cp['deltaCp_XI-eps'], constants['T'], T),           # [J/mol] - Zn(OH)2 + 2OH^- <--> Zn(OH)4^2-
-    'deltaG_XI': deltaG_T2(delta_r_H['deltaH_XI'], delta_r_S['deltaS_XI'], delta_r_Cp['deltaCp_XI'], constants['T'], T),                           # [J/mol] - Zn(OH)2 + 2OH^- <--> Zn(OH)4^2-
-    'deltaG_XI-ox': deltaG_T2(delta_r_H['deltaH_XI-ox'], delta_r_S['deltaS_XI-ox'], delta_r_Cp['deltaCp_XI-ox'], constants['T'], T),               # [J/mol] - ZnO + H2O + 2OH^- <--> Zn(OH)4^2-
-    
-    'deltaG_HER': deltaG_T2(delta_r_H['deltaH_HER'], delta_r_S['deltaS_HER'], delta_r_Cp['deltaCp_HER'], constants['T'], T),                       # [J/mol] - 4H^+ + 4e^- <--> 2H2(g)
-    'deltaG_OER': deltaG_T2(delta_r_H['deltaH_OER'], delta_r_S['deltaS_OER'], delta_r_Cp['deltaCp_OER'], constants['T'], T),                       # [J/mol] - O2(g) + 4e^- + 4H^+ <--> 2H2O
-    'deltaG_W': deltaG_T2(delta_r_H['deltaH_W'], delta_r_S['deltaS_W'], delta_r_Cp['deltaCp_W'], constants['T'], T),                               # [J/mol] - H2O(l) <--> H^+(aq) + OH^-(aq)
-}
-
-## Gibbs free energy using the van't Hoff approximation
-deltaG_Vant_Hoff = {
-    'deltaG_I': vant_Hoff(delta_r_G['deltaG_I'], delta_r_H['deltaH_I'], constants['T'], T),                       # [J/mol] - Zn^2+ + 2e^- <--> Zn(s)
-    'deltaG_II': vant_Hoff(delta_r_G['deltaG_II'], delta_r_H['deltaH_II'], constants['T'], T),                    # [J/mol] - Zn(OH)^+ + 2e^- + H^+ <--> Zn(s) + H2O
-    
-    'deltaG_III-eps': vant_Hoff(delta_r_G['deltaG_III-eps'], delta_r_H['deltaH_III-eps'], constants['T'], T),     # [J/mol] - Zn(OH)2 + 2e^- + 2H^+ <--> Zn(s) + H2O
-    'deltaG_III': vant_Hoff(delta_r_G['deltaG_III'], delta_r_H['deltaH_III'], constants['T'], T),                 # [J/mol] - Zn(OH)2 + 2e^- + 2H^+ <--> Zn(s) + H2O
-    'deltaG_III-ox': vant_Hoff(delta_r_G['deltaG_III-ox'], delta_r_H['deltaH_III-ox'], constants['T'], T),        # [J/mol] - ZnO + 2e^- + 2H^+ <--> Zn + H2O
-    
-    'deltaG_IV': vant_Hoff(delta_r_G['deltaG_IV'], delta_r_H['deltaH_IV'], constants['T'], T),                    # [J/mol] - Zn(OH)3^- + 2e^- + 3H^+ <--> Zn(s) + 3H2O
-    'deltaG_V': vant_Hoff(delta_r_G['deltaG_V'], delta_r_H['deltaH_V'], constants['T'], T),                       # [J/mol] - Zn(OH)4^2- + 2e^- + 4H^+ <--> Zn(s) + 4H2O
-    
-    'deltaG_VIII-eps': vant_Hoff(delta_r_G['deltaG_VIII-eps'], delta_r_H['deltaH_VIII-eps'], constants['T'], T),  # [J/mol] - Zn^2+ + 2OH^- <--> Zn(OH)2
-    'deltaG_VIII': vant_Hoff(delta_r_G['deltaG_VIII'], delta_r_H['deltaH_VIII'], constants['T'], T),              # [J/mol] - Zn^2+ + 2OH^- <--> Zn(OH)2
-    'deltaG_VIII-ox': vant_Hoff(delta_r_G['deltaG_VIII-ox'], delta_r_H['deltaH_VIII-ox'], constants['T'], T),     # [J/mol] - Zn^2+ + 2OH^- <--> ZnO + H2O
-    
-    'deltaG_IX-eps': vant_Hoff(delta_r_G['deltaG_IX-eps'], delta_r_H['deltaH_IX-eps'], constants['T'], T),        # [J/mol] - Zn(OH)2 + OH^- <--> Zn(OH)3^-
-    'deltaG_IX': vant_Hoff(delta_r_G['deltaG_IX'], delta_r_H['deltaH_IX'], constants['T'], T),                    # [J/mol] - Zn(OH)2 + OH^- <--> Zn(OH)3^-
-    'deltaG_IX-ox': vant_Hoff(delta_r_G['deltaG_IX-ox'], delta_r_H['deltaH_IX-ox'], constants['T'], T),           # [J/mol] - ZnO + H2O + OH^- <--> Zn(OH)3^-
-    
-    'deltaG_X': vant_Hoff(delta_r_G['deltaG_X'], delta_r_H['deltaH_X'], constants['T'], T),                       # [J/mol] - Zn(OH)3^- + OH^- <--> Zn(OH)4^-2
-    
-    'deltaG_XI-eps': vant_Hoff(delta_r_G['deltaG_XI-eps'], delta_r_H['deltaH_XI-eps'], constants['T'], T),        # [J/mol] - Zn(OH)2 + 2OH^- <--> Zn(OH)4^2-
-    'deltaG_XI': vant_Hoff(delta_r_G['deltaG_XI'], delta_r_H['deltaH_XI'], constants['T'], T),                    # [J/mol] - Zn(OH)2 + 2OH^- <--> Zn(OH)4^2-
-    'deltaG_XI-ox': vant_Hoff(delta_r_G['deltaG_XI-ox'], delta_r_H['deltaH_XI-ox'], constants['T'], T),           # [J/mol] - ZnO + H2O + 2OH^- <--> Zn(OH)4^2-
-    
-    'deltaG_HER': vant_Hoff(delta_r_G['deltaG_HER'], delta_r_H['deltaH_HER'], constants['T'], T),                 # [J/mol] - 4H^+ + 4e^- <--> 2H2(g)
-    'deltaG_OER': vant_Hoff(delta_r_G['deltaG_OER'], delta_r_H['deltaH_OER'], constants['T'], T),                 # [J/mol] - O2(g) + 4e^- + 4H^+ <--> 2H2O
-    'deltaG_W': vant_Hoff(delta_r_G['deltaG_W'], delta_r_H['deltaH_W'], constants['T'], T),                       # [J/mol] - H2O(l) <--> H^+(aq) + OH^-(aq)
-}
-
-## DeltaG using enthalpy and entropy as weak functions of temperature
-deltaG_approx = {
-    'deltaG_I': deltaG_weak(delta_r_H['deltaH_I'], delta_r_S['deltaS_I'], T),                     # [J/mol] - Zn^2+ + 2e^- <--> Zn(s)
-    'deltaG_II': deltaG_weak(delta_r_H['deltaH_II'], delta_r_S['deltaS_II'], T),                  # [J/mol] - Zn(OH)^+ + 2e^- + H^+ <--> Zn(s) + H2O
-    
-    'deltaG_III-eps': deltaG_weak(delta_r_H['deltaH_III-eps'], delta_r_S['deltaS_III-eps'], T),   # [J/mol] - Zn(OH)2 + 2e^- + 2H^+ <--> Zn(s) + H2O
-    'deltaG_III': deltaG_weak(delta_r_H['deltaH_III'], delta_r_S['deltaS_III'], T),               # [J/mol] - Zn(OH)2 + 2e^- + 2H^+ <--> Zn(s) + H2O
-    'deltaG_III-ox': deltaG_weak(delta_r_H['deltaH_III-ox'], delta_r_S['deltaS_III-ox'], T),      # [J/mol] - ZnO + 2e^- + 2H^+ <--> Zn + H2O
-    
-    'deltaG_IV': deltaG_weak(delta_r_H['deltaH_IV'], delta_r_S['deltaS_IV'], T),                  # [J/mol] - Zn(OH)3^- + 2e^- + 3H^+ <--> Zn(s) + 3H2O 
-    'deltaG_V': deltaG_weak(delta_r_H['deltaH_V'], delta_r_S['deltaS_V'], T),                     # [J/mol] - Zn(OH)4^2- + 2e^- + 4H^+ <--> Zn(s) + 4H2O
-    
-    'deltaG_VIII-eps': deltaG_weak(delta_r_H['deltaH_VIII-eps'], delta_r_S['deltaS_VIII-eps'], T),# [J/mol] - Zn^2+ + 2OH^- <--> Zn(OH)2
-    'deltaG_VIII': deltaG_weak(delta_r_H['deltaH_VIII'], delta_r_S['deltaS_VIII'], T),            # [J/mol] - Zn^2+ + 2OH^- <--> Zn(OH)2
-    'deltaG_VIII-ox': deltaG_weak(delta_r_H['deltaH_VIII-ox'], delta_r_S['deltaS_VIII-ox'], T),   # [J/mol] - Zn^2+ + 2OH^- <--> ZnO + H2O
-    
-    'deltaG_IX-eps': deltaG_weak(delta_r_H['deltaH_IX-eps'], delta_r_S['deltaS_IX-eps'], T),      # [J/mol] - Zn(OH)2 + OH^- <--> Zn(OH)3^-
-    'deltaG_IX': deltaG_weak(delta_r_H['deltaH_IX'], delta_r_S['deltaS_IX'], T),                  # [J/mol] - Zn(OH)2 + OH^- <--> Zn(OH)3^-
-    'deltaG_IX-ox': deltaG_weak(delta_r_H['deltaH_IX-ox'], delta_r_S['deltaS_IX-ox'], T),         # [J/mol] - ZnO + H2O + OH^- <--> Zn(OH)3^-
-    
-    'deltaG_X': deltaG_weak(delta_r_H['deltaH_X'], delta_r_S['deltaS_X'], T),                     # [J/mol] - Zn(OH)3^- + OH^- <--> Zn(OH)4^-2
-    
-    'deltaG_XI-eps': deltaG_weak(delta_r_H['deltaH_XI-eps'], delta_r_S['deltaS_XI-eps'], T),      # [J/mol] - Zn(OH)2 + 2OH^- <--> Zn(OH)4^2-
-    'deltaG_XI': deltaG_weak(delta_r_H['deltaH_XI'], delta_r_S['deltaS_XI'], T),                  # [J/mol] - Zn(OH)2 + 2OH^- <--> Zn(OH)4^2-
-    'deltaG_XI-ox': deltaG_weak(delta_r_H['deltaH_XI-ox'], delta_r_S['deltaS_XI-ox'], T),         # [J/mol] - ZnO + H2O + 2OH^- <--> Zn(OH)4^2-
-    
-    'deltaG_HER': deltaG_weak(delta_r_H['deltaH_HER'], delta_r_S['deltaS_HER'], T),               # [J/mol] - 4H^+ + 4e^- <--> 2H2(g)
-    'deltaG_OER': deltaG_weak(delta_r_H['deltaH_OER'], delta_r_S['deltaS_OER'], T),               # [J/mol] - O2(g) + 4e^- + 4H^+ <--> 2H2O
-    'deltaG_W': deltaG_weak(delta_r_H['deltaH_W'], delta_r_S['deltaS_W'], T),                     # [J/mol] - H2O(l) <--> H^+(aq) + OH^-(aq)
-}
-
-## E0 using van't approximation
-E0_vant_Hoff = {
-    'EI_0': -(deltaG_Vant_Hoff['deltaG_I'])/(constants['n']*constants['F']),            # [V vs SHE] - Zn^2+(aq) --> Zn(s)
-    'EII_0': -(deltaG_Vant_Hoff['deltaG_II'])/(constants['n']*constants['F']),          # [V vs SHE] - Zn(OH)^+ --> Zn(s) - Not used
-    
-    'EIII_0-eps': -(deltaG_Vant_Hoff['deltaG_III-eps'])/(constants['n']*constants['F']),# [V vs SHE] - Zn(OH)2(s) --> Zn(s) -  assumed solid phase, not aq.
-    'EIII_0': -(deltaG_Vant_Hoff['deltaG_III'])/(constants['n']*constants['F']),        # [V vs SHE] - Zn(OH)2(s) --> Zn(s) -  assumed solid phase, not aq.
-    'EIII_0-ox': -(deltaG_Vant_Hoff['deltaG_III-ox'])/(constants['n']*constants['F']),  # [V vs SHE] - ZnO --> Zn(s) - Not used
-    
-    'EIV_0': -(deltaG_Vant_Hoff['deltaG_IV'])/(constants['n']*constants['F']),          # [V vs SHE] - Zn(OH)3^- --> Zn(s)
-    'EV_0': -(deltaG_Vant_Hoff['deltaG_V'])/(constants['n']*constants['F']),            # [V vs SHE] - Zn(OH)4^2- --> Zn(s)
-    
-    'EHER_0':-(deltaG_Vant_Hoff['deltaG_HER'])/(2*constants['n']*constants['F']),       # [V vs SHE] - HER
-    'EOER_0': -(deltaG_Vant_Hoff['deltaG_OER'])/(2*constants['n']*constants['F']),      # [V vs SHE] - OER
-}
-
-## E0 using assuming that enthalpy and entropy are weak functions of  temperature
-E0_approx = {
-    'EI_0': -(deltaG_approx['deltaG_I'])/(constants['n']*constants['F']),               # [V vs SHE] - Zn^2+(aq) --> Zn(s)
-    'EII_0': -(deltaG_approx['deltaG_II'])/(constants['n']*constants['F']),             # [V vs SHE] - Zn(OH)^+ --> Zn(s) - Not used
-    
-    'EIII_0-eps': -(deltaG_approx['deltaG_III-eps'])/(constants['n']*constants['F']),   # [V vs SHE] - Zn(OH)2(s) --> Zn(s) -  assumed solid phase, not aq.
-    'EIII_0': -(deltaG_approx['deltaG_III'])/(constants['n']*constants['F']),           # [V vs SHE] - Zn(OH)2(s) --> Zn(s) -  assumed solid phase, not aq.
-    'EIII_0-ox': -(deltaG_approx['deltaG_III-ox'])/(constants['n']*constants['F']),      # [V vs SHE] - ZnO --> Zn(s) - Not used
-    
-    'EIV_0': -(deltaG_approx['deltaG_IV'])/(constants['n']*constants['F']),             # [V vs SHE] - Zn(OH)3^- --> Zn(s)
-    'EV_0': -(deltaG_approx['deltaG_V'])/(constants['n']*constants['F']),               # [V vs SHE] - Zn(OH)4^2- --> Zn(s)
-    
-    'EHER_0':-(deltaG_approx['deltaG_HER'])/(2*constants['n']*constants['F']),          # [V vs SHE] - HER
-    'EOER_0': -(deltaG_approx['deltaG_OER'])/(2*constants['n']*constants['F']),         # [V vs SHE] - OER
-}
-
-## E0 with no assumptions, except that the heat capacities are valid for this range
-E0_new = {
-    'EI_0': -(deltaG_new_T['deltaG_I'])/(constants['n']*constants['F']),            # [V vs SHE] - Zn^2+(aq) --> Zn(s)
-    'EII_0': -(deltaG_new_T['deltaG_II'])/(constants['n']*constants['F']),          # [V vs SHE] - Zn(OH)^+ --> Zn(s) - Not used
-    
-    'EIII_0-eps': -(deltaG_new_T['deltaG_III-eps'])/(constants['n']*constants['F']),# [V vs SHE] - Zn(OH)2(s) --> Zn(s) -  assumed solid phase, not aq.
-    'EIII_0': -(deltaG_new_T['deltaG_III'])/(constants['n']*constants['F']),        # [V vs SHE] - Zn(OH)2(s) --> Zn(s) -  assumed solid phase, not aq.
-    'EIII_0-ox': -(deltaG_new_T['deltaG_III-ox'])/(constants['n']*constants['F']),  # [V vs SHE] - ZnO --> Zn(s) - Not used
-    
-    'EIV_0': -(deltaG_new_T['deltaG_IV'])/(constants['n']*constants['F']),          # [V vs SHE] - Zn(OH)3^- --> Zn(s)
-    'EV_0': -(deltaG_new_T['deltaG_V'])/(constants['n']*constants['F']),            # [V vs SHE] - Zn(OH)4^2- --> Zn(s)
-    
-    'EHER_0':-(deltaG_new_T['deltaG_HER'])/(2*constants['n']*constants['F']),       # [V vs SHE] - HER
-    'EOER_0': -(deltaG_new_T['deltaG_OER'])/(2*constants['n']*constants['F'])       # [V vs SHE] - OER
-}
+## Gibbs free energy for all reactions at T in one call, keyed like delta_r_G (e.g. 'deltaG_IX-ox')
+deltaG_new_T = dict(zip(delta_r_G, reaction_deltaG_T(T, 'deltaG_T2')[:, 0]))        # No assumptions, except that the heat capacities are valid in this range
+deltaG_Vant_Hoff = dict(zip(delta_r_G, reaction_deltaG_T(T, 'vant_Hoff')[:, 0]))     # The van't Hoff approximation
+deltaG_approx = dict(zip(delta_r_G, reaction_deltaG_T(T, 'deltaG_weak')[:, 0]))      # Enthalpy and entropy as weak functions of temperature
 
-## Using that the derivative of the standard reduction potential with respect to temperature is the change in entropy 
-E0_S = {
-    'EI_0': E0_2(constants_E0['EI_0'], delta_r_S['deltaS_I'], constants['T'], T, constants['n']),                    # [V vs SHE] - Zn^2+(aq) --> Zn(s)
-    'EII_0': E0_2(constants_E0['EII_0'], delta_r_S['deltaS_II'], constants['T'], T, constants['n']),                 # [V vs SHE] - Zn(OH)^+ --> Zn(s) - Not used
-    
-    'EIII_0-eps': E0_2(constants_E0['EIII_0-eps'], delta_r_S['deltaS_III-eps'], constants['T'], T, constants['n']),  # [V vs SHE] - Zn(OH)2(s) --> Zn(s) -  assumed solid phase, not aq.
-    'EIII_0': E0_2(constants_E0['EIII_0'], delta_r_S['deltaS_III'], constants['T'], T, constants['n']),              # [V vs SHE] - Zn(OH)2(s) --> Zn(s) -  assumed solid phase, not aq.
-    'EIII_0-ox': E0_2(constants_E0['EIII_0-ox'], delta_r_S['deltaS_III-ox'], constants['T'], T, constants['n']),     # [V vs SHE] - ZnO --> Zn(s) - Not used
-    
-    'EIV_0': E0_2(constants_E0['EIV_0'], delta_r_S['deltaS_IV'], constants['T'], T, constants['n']),                 # [V vs SHE] - Zn(OH)3^- --> Zn(s)
-    'EV_0': E0_2(constants_E0['EV_0'], delta_r_S['deltaS_V'], constants['T'], T, constants['n']),                    # [V vs SHE] - Zn(OH)4^2- --> Zn(s)
-    
-    'EHER_0': E0_2(constants_E0['EHER_0'], delta_r_S['deltaS_HER'], constants['T'], T, 2*constants['n']),            # [V vs SHE] - HER
-    'EOER_0': E0_2(constants_E0['EOER_0'], delta_r_S['deltaS_OER'], constants['T'], T, 2*constants['n'])             # [V vs SHE] - OER
-}
+## E0 for the electrochemical reactions at T, keyed like constants_E0 (e.g. 'EIII_0-ox')
+E0_vant_Hoff = dict(zip(constants_E0, reaction_E0_T(T, 'vant_Hoff')[electrochemical, 0]))   # The van't Hoff approximation
+E0_approx = dict(zip(constants_E0, reaction_E0_T(T, 'deltaG_weak')[electrochemical, 0]))    # Enthalpy and entropy as weak functions of temperature
+E0_new = dict(zip(constants_E0, reaction_E0_T(T, 'deltaG_T2')[electrochemical, 0]))        # No assumptions, except that the heat capacities are valid for this range
+E0_S = dict(zip(constants_E0, reaction_E0_T(T, 'E0_2')[electrochemical, 0]))               # The derivative of E0 with respect to temperature is the change in entropy
 
 # The pZn where the equilibrium Zn(OH)2(s) <--> Zn(OH)3^-1 and Zn(OH)3^-1 <--> Zn(OH)4^2- becomes the same and the domain for Zn(OH)3^- vanishes
 pZn_threshold_eps = (deltaG_new_T['deltaG_IX-eps']-deltaG_new_T['deltaG_X'])/(constants['R']*T*np.log(10))
@@ -211,6 +65,9 @@ x_Zn2_ZnO = []
 x_ZnO_ZnOH4_2 = []
 x_ZnO_ZnOH3_1 = []
 
+# All lines from the reaction definitions for every pZn in one call, (reactions x pZn x pH) and (reactions x pZn)
+lines = reaction_lines(database(), T=T, pH=pH, pZn=pZn_values)
+
 # Initialising the figure before the for-loop
 plt.figure()
 
@@ -218,73 +75,42 @@ plt.figure()
 for i in range(len(pZn_values)):
     pZn_string = f'pZn =  {int(pZn_values_dict['pZn'][i])}' # The string printed for the different pZn values in the plot. 
 
-    # The amount of Zn in solution
-    constants_p = {             # Setting all values to be the same because they are the dominating species within their domain
-    'pZn': pZn_values[i],       # pZn = -log(Zn^2+)
-    'pZnOH': pZn_values[i],     # pZnOH = -log(Zn(OH)^+)
-    'pZnOH2': pZn_values[i],    # pZnOH2 = -log(Zn(OH)2)
-    'pZnOH3': pZn_values[i],    # pZnOH3 = -log(Zn(OH)3^-)
-    'pZnOH4': pZn_values[i]     # pZnOH4 = -log(Zn(OH)4^-2)
-    }
+    # The lines at this pZn, every dissolved species has the activity 10^-pZn in its own domain
+    E = dict(zip(lines['reactions'], lines['E'][:, i]))                     # [V vs SHE] - Electrochemical lines, E(pH)
+    pH_boundary = dict(zip(lines['reactions'], lines['pH_boundary'][:, i])) # Chemical lines, vertical at this pH
 
     ## E calculations
-
-    # Zn^2+ --> Zn(s)
-    EI = np.ones(len(pH))*E0_new['EI_0'] - constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZn'])
-    
-    # Zn(OH)^+ --> Zn(s)
-    EII = E0_new['EII_0'] - constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH']+pH)
-
-    # Zn(OH)2 --> Zn(s) ----- Solid hydroxide 
-    EIII_eps = E0_new['EIII_0-eps'] - 2*constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(pH)
-
-    # Zn(OH)2 --> Zn(s) ----- Soluble hydroxide
-    EIII = E0_new['EIII_0'] - 2*constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(0*constants_p['pZnOH2']/2+pH)
-
-    # ZnO --> Zn(s) ---- Solid oxide
-    EIII_ox = E0_new['EIII_0-ox'] - 2*constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(pH)
-    
-    # Zn(OH)3^- --> Zn(s)
-    EIV = E0_new['EIV_0'] - constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH3']+3*pH)
-
-    # Zn(OH)4^2- --> Zn(s)
-    EV = E0_new['EV_0'] - constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH4']+4*pH)
-
+    EI = E['I']                 # Zn^2+ --> Zn(s)
+    EII = E['II']               # Zn(OH)^+ --> Zn(s)
+    EIII_eps = E['III-eps']     # Zn(OH)2 --> Zn(s) ----- Solid hydroxide
+    EIII = E['III']             # Zn(OH)2 --> Zn(s) ----- Soluble hydroxide
+    EIII_ox = E['III-ox']       # ZnO --> Zn(s) ---- Solid oxide
+    EIV = E['IV']               # Zn(OH)3^- --> Zn(s)
+    EV = E['V']                 # Zn(OH)4^2- --> Zn(s)
 
     ## pH calculations
-
-    # Zn^2+ --> Zn(OH)2 ---- Solid hydroxide
-    pHVIII_eps = pKw + deltaG_new_T['deltaG_VIII-eps']/(2*constants['R']*T*np.log(10)) + constants_p['pZn']/2
+    pHVIII_eps = pH_boundary['VIII-eps']    # Zn^2+ --> Zn(OH)2 ---- Solid hydroxide
     x_Zn2_ZnOH2_eps.append(pHVIII_eps)
-    # Zn^2+ --> Zn(OH)2 ---- Soluble hydroxide
-    pHVIII = pKw + deltaG_new_T['deltaG_VIII']/(2*constants['R']*T*np.log(10)) + constants_p['pZn']/2 - constants_p['pZnOH2']/2
+    pHVIII = pH_boundary['VIII']            # Zn^2+ --> Zn(OH)2 ---- Soluble hydroxide
     x_Zn2_ZnOH2.append(pHVIII)
-    # Zn^2+ --> ZnO ---- Oxide oxide
-    pHVIII_ox = pKw + deltaG_new_T['deltaG_VIII-ox']/(2*constants['R']*T*np.log(10)) + constants_p['pZn']/2
+    pHVIII_ox = pH_boundary['VIII-ox']      # Zn^2+ --> ZnO ---- Oxide
     x_Zn2_ZnO.append(pHVIII_ox)
 
-    # Zn(OH)2 --> Zn(OH)3^- ---- Using Solid Zn(OH)2
-    pHIX_eps = pKw + deltaG_new_T['deltaG_IX-eps']/(constants['R']*T*np.log(10)) - constants_p['pZnOH3']
+    pHIX_eps = pH_boundary['IX-eps']        # Zn(OH)2 --> Zn(OH)3^- ---- Using Solid Zn(OH)2
     x_ZnOH2_eps_ZnOH3_1.append(pHIX_eps)
-    # Zn(OH)2 --> Zn(OH)3^- ---- Using Soluble Zn(OH)2
-    pHIX = pKw + deltaG_new_T['deltaG_IX']/(constants['R']*T*np.log(10)) + constants_p['pZnOH2'] - constants_p['pZnOH3']
+    pHIX = pH_boundary['IX']                # Zn(OH)2 --> Zn(OH)3^- ---- Using Soluble Zn(OH)2
     x_ZnOH2_ZnOH3_1.append(pHIX)
-    # ZnO --> Zn(OH)3^- ---- Using oxide ZnO
-    pHIX_ox = pKw + deltaG_new_T['deltaG_IX-ox']/(constants['R']*T*np.log(10)) - constants_p['pZnOH3']
+    pHIX_ox = pH_boundary['IX-ox']          # ZnO --> Zn(OH)3^- ---- Using oxide ZnO
     x_ZnO_ZnOH3_1.append(pHIX_ox)
 
-    # Zn(OH)3^- --> Zn(OH)4^2-
-    pHX = pKw + deltaG_new_T['deltaG_X']/(constants['R']*T*np.log(10)) + constants_p['pZnOH3'] - constants_p['pZnOH4']
+    pHX = pH_boundary['X']                  # Zn(OH)3^- --> Zn(OH)4^2-
     x_ZnOH3_1_ZnOH4_2.append(pHX)
 
-    # Zn(OH)2 --> Zn(OH)4^2- ---- Using the solid form
-    pHXI_eps = pKw + deltaG_new_T['deltaG_XI-eps']/(2*constants['R']*T*np.log(10)) - (1/2)*constants_p['pZnOH4']
+    pHXI_eps = pH_boundary['XI-eps']        # Zn(OH)2 --> Zn(OH)4^2- ---- Using the solid form
     x_ZnOH2_eps_ZnOH4_2.append(pHXI_eps)
-    # Zn(OH)2 --> Zn(OH)4^2- ---- Using the Soluble form
-    pHXI = pKw + deltaG_new_T['deltaG_XI-eps']/(2*constants['R']*T*np.log(10)) + (1/2)*constants_p['pZnOH2']- (1/2)*constants_p['pZnOH4']
+    pHXI = pH_boundary['XI']                # Zn(OH)2 --> Zn(OH)4^2- ---- Using the Soluble form
     x_ZnOH2_ZnOH4_2.append(pHXI)
-    # ZnO--> Zn(OH)4^2- ---- Using the oxide form
-    pHXI_ox = pKw + deltaG_new_T['deltaG_XI-ox']/(2*constants['R']*T*np.log(10)) - (1/2)*constants_p['pZnOH4']
+    pHXI_ox = pH_boundary['XI-ox']          # ZnO--> Zn(OH)4^2- ---- Using the oxide form
     x_ZnO_ZnOH4_2.append(pHXI_ox)
 
     # Finding intersections for the different lines
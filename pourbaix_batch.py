@@ -0,0 +1,127 @@
+'''
+BATCH OF POURBAIX DIAGRAMS
+
+Computes the Pourbaix diagram of Zn for every combination of temperature, pZn and phase model in a scenario, in
+parallel worker processes. Every diagram is written as json (see Functions.pourbaix.PourbaixDomains.save) and as a
+figure, and combinations that are already in the output directory are skipped, so an interrupted batch continues where
+it stopped.
+
+Examples:
+    python pourbaix_batch.py --T 25:100:5 --pZn 2,4,6 --phase-models eps aq ox --out diagrams
+    python pourbaix_batch.py --scenario scenario.json
+
+A scenario file holds the same options, e.g.
+    {"T": [25, 50, 85], "pZn": [6], "phase_models": ["ox"], "dataset": "revised_pourbaix", "method": "deltaG_T2"}
+'''
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+import numpy as np
+from multiprocessing import Pool
+
+methods = ['deltaG_T2', 'vant_Hoff', 'deltaG_weak', 'heat_capacity', 'E0_2']
+
+# '25:100:5' (end included) or '25,50,85' to values
+def parse_values(text):
+    if isinstance(text, (list, tuple)):
+        return [float(value) for value in text]
+    if ':' in str(text):
+        start, stop, step = (float(value) for value in str(text).split(':'))
+        return list(np.round(np.arange(start, stop + step/2, step), 10))
+    return [float(value) for value in str(text).split(',')]
+
+# All combinations of a scenario, with the file name of each
+def scenario_tasks(scenario):
+    '''
+    Input:
+    scenario : {'T': [C], 'pZn': [...], 'phase_models': [...], 'dataset', 'method', 'pH_range', 'E_range', 'out', 'format'}
+
+    Output:
+    List of dictionaries, one per diagram, with the arguments of Functions.pourbaix.pourbaix_diagram and the paths
+    '''
+    from Data.thermodynamic_data import dataset_name
+    dataset = scenario.get('dataset') or dataset_name
+    tasks = []
+    for T, pZn, phase_model in itertools.product(parse_values(scenario['T']), parse_values(scenario['pZn']), scenario['phase_models']):
+        name = f'{dataset}-{phase_model}-{scenario["method"]}-T{T:g}C-pZn{pZn:g}'
+        tasks.append({'dataset': dataset, 'phase_model': phase_model, 'T': T + 273.15, 'pZn': pZn, 'method': scenario['method'],
+                      'pH_range': tuple(scenario['pH_range']), 'E_range': tuple(scenario['E_range']),
+                      'data_path': os.path.join(scenario['out'], name + '.json'),
+                      'figure_path': os.path.join(scenario['out'], f'{name}.{scenario["format"]}') if scenario['format'] else None})
+    return tasks
+
+# Complete files only, so an interrupted batch never skips a broken diagram. The extension is kept for savefig
+def _tmp(path):
+    root, extension = os.path.splitext(path)
+    return f'{root}.tmp-{os.getpid()}{extension}'
+
+def done(task):
+    return os.path.exists(task['data_path']) and (task['figure_path'] is None or os.path.exists(task['figure_path']))
+
+# One diagram, run in the worker processes
+def run_task(task):
+    from Functions.pourbaix import pourbaix_diagram
+    from Functions.render import render
+    start = time.perf_counter()
+    domains = pourbaix_diagram(task['dataset'], task['phase_model'], task['T'], task['pZn'], task['pH_range'], task['E_range'],
+                               task['method'], cache_dir=False)
+    domains.save(_tmp(task['data_path']))
+    os.replace(_tmp(task['data_path']), task['data_path'])
+    if task['figure_path'] is not None:
+        render(domains, _tmp(task['figure_path']))
+        os.replace(_tmp(task['figure_path']), task['figure_path'])
+    return task['data_path'], time.perf_counter() - start
+
+def read_scenario(argv=None):
+    parser = argparse.ArgumentParser(description='Pourbaix diagrams of Zn for all combinations of T, pZn and phase model')
+    parser.add_argument('--scenario', help='json file with the options below, the command line options take precedence')
+    parser.add_argument('--T', help="Temperatures in degrees C, '25,50,85' or '25:100:5' (end included)")
+    parser.add_argument('--pZn', help="Values of pZn, as for --T")
+    parser.add_argument('--phase-models', nargs='+', choices=['eps', 'aq', 'ox'], help='Forms of the passivating phase')
+    parser.add_argument('--dataset', help='Dataset in Data/datasets, the default dataset if not given')
+    parser.add_argument('--method', choices=methods, help='Temperature extrapolation of the Gibbs free energies')
+    parser.add_argument('--pH-range', nargs=2, type=float, metavar=('MIN', 'MAX'))
+    parser.add_argument('--E-range', nargs=2, type=float, metavar=('MIN', 'MAX'), help='[V vs SHE]')
+    parser.add_argument('--out', help='Output directory, also the cache of finished diagrams. The names do not hold the window, use one directory per window')
+    parser.add_argument('--format', help="Figure format, e.g. png, pdf or svg. 'none' for no figures")
+    parser.add_argument('--processes', type=int, help='Worker processes, os.cpu_count() if not given')
+    parser.add_argument('--force', action='store_true', help='Recompute diagrams that are already in the output directory')
+    arguments = parser.parse_args(argv)
+
+    scenario = {'T': '25', 'pZn': '6', 'phase_models': ['ox'], 'dataset': None, 'method': 'deltaG_T2',
+                'pH_range': (0, 16), 'E_range': (-1.5, 1.5), 'out': 'pourbaix_diagrams', 'format': 'png'}
+    if arguments.scenario:
+        with open(arguments.scenario) as file:
+            scenario.update(json.load(file))
+    scenario.update({key.replace('-', '_'): value for key, value in vars(arguments).items()
+                     if value is not None and key not in ('scenario', 'processes', 'force')})
+    if str(scenario['format']).lower() == 'none':
+        scenario['format'] = None
+    return scenario, arguments.processes, arguments.force
+
+def main(argv=None):
+    scenario, processes, force = read_scenario(argv)
+    os.makedirs(scenario['out'], exist_ok=True)
+    tasks = scenario_tasks(scenario)
+    todo = tasks if force else [task for task in tasks if not done(task)]
+    print(f'{len(tasks)} diagrams, {len(tasks) - len(todo)} already in {scenario["out"]}', file=sys.stderr)
+
+    if processes == 1:
+        report(map(run_task, todo), len(todo))
+    else:
+        with Pool(processes) as pool:
+            report(pool.imap_unordered(run_task, todo), len(todo))
+    return 0
+
+def report(results, total):
+    start = time.perf_counter()
+    for k, (path, seconds) in enumerate(results, 1):
+        elapsed = time.perf_counter() - start
+        print(f'[{k}/{total}] {os.path.basename(path)} {seconds:.2f} s, {elapsed/k*(total - k):.0f} s left', file=sys.stderr)
+
+if __name__ == '__main__':
+    sys.exit(main())
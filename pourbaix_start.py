@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from Functions.Functions import vant_Hoff, deltaG_weak
+from Data.thermodynamic_data import database
+from Functions.pourbaix import reaction_lines
 
 # Constants
 constants = {
@@ -14,56 +16,12 @@ T = 25+273.15 # [K]
 
 ## THERMODYNAMIC DATA ##
 
-# Gibbs free energy of formation of species at STP [REVISED POURBAIX DIAGRAM]
-constants_deltaG_formation = {
-    'deltaG_Zn': 0,                     # [J/mol] - Zn(s)
-    'deltaG_Zn^2+': -147.203*10**3,     # [J/mol] - Zn^2+(aq)
-    'deltaG_Zn(OH)^+': -333.20*10**3,   # [J/mol] - Zn(OH)^+(aq)
-    'deltaG_Zn(OH)2': -525.02*10**3,    # [J/mol] - Zn(OH)2(aq)  
-    'deltaG_Zn(OH)2-eps':-555.82*10**3, # [J/mol] - eps-Zn(OH)2(s) ----  Want to use this, but it seems like the article is using ZnOH2-eps...?
-    'deltaG_Zn(OH)3^-': -696.52*10**3,  # [J/mol] - Zn(OH)3^-(aq)
-    'deltaG_Zn(OH)4^2-': -860.59*10**3, # [J/mol] - Zn(OH)4^2-(aq)
-    'deltaG_ZnO': -320.479*10**3,       # [J/mol] - ZnO
-    'deltaG_H^+': 0,                    # [J/mol] - H^+(aq)
-    'deltaG_H2O': -237.1*10**3,         # [J/mol] - H2O
-    'deltaG_OH^-':-157.2*10**3,         # [J/mol] - OH^-(aq)
-    'deltaG_H2': 0,                     # [J/mol] - H2(g) -- SI
-    'deltaG_O2':0,                      # [J/mol] - O2(g) -- SI
-}
-
-# Entropy of formation of species at STP [REVISED POURBAIX DIAGRAM]
-constants_S_formation = {
-    'S_Zn': 41.63,          # [J/K*mol] - Zn(s)
-    'S_Zn^2+': -109.8,      # [J/K*mol] - Zn^2+(aq)
-    'S_Zn(OH)^+': -24,      # [J/K*mol] - Zn(OH)^+(aq)
-    'S_Zn(OH)2': 42,        # [J/K*mol] - Zn(OH)2(s)
-    'S_Zn(OH)2-eps': 77,    # [J/K*mol] - Solid form
-    'S_Zn(OH)3^-': 40,      # [J/K*mol] - Zn(OH)3^-(aq)
-    'S_Zn(OH)4^2-': 15,     # [J/K*mol] - Zn(OH)4^2-(aq)
-    'S_ZnO': 43.65,         # [J/K*mol] - ZnO
-    'S_H^+': 0,             # [J/K*mol] - H^+(aq)
-    'S_H2O': 70,            # [J/K*mol] - H2O
-    'S_OH^-':-11,           # [J/K*mol] - OH^-(aq)
-    'S_H2': 131,            # [J/K*mol] - H2(g) -- SI
-    'S_O2':205,             # [J/K*mol] - O2(g) -- SI
-}
+# Formation data of the species at STP, read from the dataset in Data/datasets (see Data.thermodynamic_data)
+from Data.thermodynamic_data import constants_deltaG_formation, constants_S_formation
+from Data.thermodynamic_data import constants_Cp as Cp_coefficients
 
-# Molar heat capacity of species at STP [REVISED POURBAIX DIAGRAM]
-constants_Cp = {
-    'Cp_Zn': [21.334, 11.648*10**(-3), 0.054*10**(6)],  # [J/K*mol] - Zn(s)
-    'Cp_ZnO':[45.338, 7.289*10**(-3), -0.573*10**(6)],  # [J/K*mol] - Zn^2+(aq)
-    'Cp_Zn(OH)2-eps':74.27,                             # [J/K*mol] - Zn(OH)^+(aq)
-    'Cp_Zn^2+':-25.8,                                   # [J/K*mol] - Zn(OH)2(s)
-    'Cp_Zn(OH)^+': 10,                                  # [J/K*mol] - Solid form
-    'Cp_Zn(OH)2': 70,                                   # [J/K*mol] - Zn(OH)3^-(aq)
-    'Cp_Zn(OH)3^-': 94,                                 # [J/K*mol] - Zn(OH)4^2-(aq)
-    'Cp_Zn(OH)4^2-': -284,                              # [J/K*mol] - ZnO
-    'Cp_H^+': 0,                                        # [J/K*mol] - H^+(aq)
-    'Cp_H2O': 75,                                       # [J/K*mol] - H2O
-    'Cp_OH^-': -149,                                    # [J/K*mol] - OH^-(aq)
-    'Cp_H2': 29,                                        # [J/mol] - H2(g) -- SI
-    'Cp_O2':29,                                     # [J/mol] - O2(g) -- SI
-}
+# Molar heat capacity of species at STP, only a number where Cp is constant, since only the first coefficient is used below
+constants_Cp = {key: Cp if Cp[1:].any() else Cp[0] for key, Cp in Cp_coefficients.items()}
 
 
 equilibrium_constants_2 = {'Zn(OH)': 10**4.4, 'ZnOH2_aq': 10**11.3, 'Zn(OH)3': 10**14.14, 'Zn(OH)4': 10**17.66,\
@@ -251,57 +209,34 @@ x_ZnOH2_ZnOH4_2 = []
 x_ZnOH2_ZnOH3_1 = []
 x_ZnOH3_1_ZnOH4_2 = []
 
+# All lines from the reaction definitions for every pZn in one call, (reactions x pZn x pH) and (reactions x pZn)
+lines = reaction_lines(database(), T=T, pH=pH, pZn=pZn_values, method='vant_Hoff')
 
 ## Printing the Pourbaix diagram
 for i in range(len(pZn_values)):
     pZn_string = f'pZn =  {int(pZn_values_dict['pZn'][i])}' # The string printed for the different pZn values in the plot. 
 
-    # The amount of Zn in solution
-    constants_p = {             # Setting all values to be the same because they are the dominating species within their domain
-    'pZn': pZn_values[i],       # pZn = -log(Zn^2+)
-    'pZnOH': pZn_values[i],     # pZnOH = -log(Zn(OH)^+)
-    'pZnOH2': pZn_values[i],    # pZnOH2 = -log(Zn(OH)2)
-    'pZnOH3': pZn_values[i],    # pZnOH3 = -log(Zn(OH)3^-)
-    'pZnOH4': pZn_values[i]     # pZnOH4 = -log(Zn(OH)4^-2)
-    }
+    # The lines at this pZn
+    E = dict(zip(lines['reactions'], lines['E'][:, i]))                     # [V vs SHE] - Electrochemical lines, E(pH)
+    pH_boundary = dict(zip(lines['reactions'], lines['pH_boundary'][:, i])) # Chemical lines, vertical at this pH
 
     ## E calculations
-
-    # Zn^2+ --> Zn(s)
-    EI = np.ones(len(pH))*constants_E0['EI_0'] - constants['R']*constants['T']*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZn'])
-    
-    # Zn(OH)^+ --> Zn(s)
-    EII = constants_E0['EII_0'] - constants['R']*constants['T']*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH']+pH)
-
-    # Zn(OH)2 --> Zn(s)
-    EIII_eps = constants_E0['EIII_0-eps'] - 2*constants['R']*constants['T']*np.log(10)/(constants['n']*constants['F'])*(0*constants_p['pZnOH2']/2+pH)
-
-    # Zn(OH)2 --> Zn(s)
-    EIII = constants_E0['EIII_0'] - 2*constants['R']*constants['T']*np.log(10)/(constants['n']*constants['F'])*(0*constants_p['pZnOH2']/2+pH)
-
-    # Zn(OH)3^- --> Zn(s)
-    EIV = constants_E0['EIV_0'] - constants['R']*constants['T']*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH3']+3*pH)
-
-    # Zn(OH)4^2- --> Zn(s)
-    EV = constants_E0['EV_0'] - constants['R']*constants['T']*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH4']+4*pH)
-
-    # ZnO --> Zn(s)
-    EVI = constants_E0['EVI_0'] - 2*constants['R']*constants['T']*np.log(10)/(constants['n']*constants['F'])*(pH)
+    EI = E['I']                 # Zn^2+ --> Zn(s)
+    EII = E['II']               # Zn(OH)^+ --> Zn(s)
+    EIII_eps = E['III-eps']     # Zn(OH)2 --> Zn(s)
+    EIII = E['III']             # Zn(OH)2 --> Zn(s)
+    EIV = E['IV']               # Zn(OH)3^- --> Zn(s)
+    EV = E['V']                 # Zn(OH)4^2- --> Zn(s)
+    EVI = E['III-ox']           # ZnO --> Zn(s)
 
     ## pH calculations
-
-    # Zn^2+ --> Zn(OH)2
-    pHVIII = 14 + constants_deltaG['deltaG_VIII-eps']/(2*constants['R']*constants['T']*np.log(10)) + constants_p['pZn']/2 - 0*constants_p['pZnOH2']/2
+    pHVIII = pH_boundary['VIII-eps']    # Zn^2+ --> Zn(OH)2
     x_Zn2_ZnOH2.append(pHVIII)
-
-    # Zn(OH)2 --> Zn(OH)3^-
-    pHIX = 14 + constants_deltaG['deltaG_IX-eps']/(constants['R']*constants['T']*np.log(10)) + 0*constants_p['pZnOH2'] - constants_p['pZnOH3']
+    pHIX = pH_boundary['IX-eps']        # Zn(OH)2 --> Zn(OH)3^-
     x_ZnOH2_ZnOH3_1.append(pHIX)
-    # Zn(OH)3^- --> Zn(OH)4^2-
-    pHX = 14 + constants_deltaG['deltaG_X']/(constants['R']*constants['T']*np.log(10)) + constants_p['pZnOH3'] - constants_p['pZnOH4']
+    pHX = pH_boundary['X']              # Zn(OH)3^- --> Zn(OH)4^2-
     x_ZnOH3_1_ZnOH4_2.append(pHX)
-    # Zn(OH)2 --> Zn(OH)4^2-
-    pHXI = 14 + constants_deltaG['deltaG_XI-eps']/(2*constants['R']*constants['T']*np.log(10)) - (1/2)*constants_p['pZnOH4']
+    pHXI = pH_boundary['XI-eps']        # Zn(OH)2 --> Zn(OH)4^2-
     x_ZnOH2_ZnOH4_2.append(pHXI)
 
     # Finding intersections for the different lines
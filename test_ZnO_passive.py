@@ -13,7 +13,8 @@ Made by: Pål Emil England Karstensen and Sidsel Meli Hanetho
 import matplotlib.pyplot as plt
 import numpy as np
 from Functions.Functions import vant_Hoff, deltaG_weak, deltaG_T2, E0_2, add_polygon, E_OER_HER
-from Data.thermodynamic_data import *   # Imports all the thermodynamic data as well as the constants
+from Data.thermodynamic_data import constants, database, delta_r_G, delta_r_S, delta_r_H, delta_r_Cp, constants_E0   # The thermodynamic data and the constants
+from Functions.pourbaix import reaction_lines
 
 T = 85+273.15           # [K] - Temperature
 # Concentration of Zn ions
@@ -218,64 +219,31 @@ linestyle = ['-', '--']
 
 pZn_string = 'pZn = {}'.format(pZn_value) # The string printed for the different pZn values in the plot. 
 
-# The amount of Zn in solution
-constants_p = {         # Setting all values to be the same because they are the dominating species within their domain
-'pZn': pZn_value,       # pZn = -log(Zn^2+)
-'pZnOH': pZn_value,     # pZnOH = -log(Zn(OH)^+)
-'pZnOH2': pZn_value,    # pZnOH2 = -log(Zn(OH)2)
-'pZnOH3': pZn_value,    # pZnOH3 = -log(Zn(OH)3^-)
-'pZnOH4': pZn_value,    # pZnOH4 = -log(Zn(OH)4^-2)
-}
+# All lines from the reaction definitions, every dissolved species has the activity 10^-pZn in its own domain
+lines = reaction_lines(database(), T=T, pH=pH, pZn=pZn_value)
+E = dict(zip(lines['reactions'], lines['E'][:, 0]))                 # [V vs SHE] - Electrochemical lines, E(pH)
+pH_boundary = dict(zip(lines['reactions'], lines['pH_boundary'][:, 0])) # Chemical lines, vertical at this pH
 
 ## E calculations
-
-# Zn^2+ --> Zn(s)
-EI = np.ones(len(pH))*E0_new['EI_0'] - constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZn'])
-
-# Zn(OH)^+ --> Zn(s)
-EII = E0_new['EII_0'] - constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH']+pH)
-
-# Zn(OH)2(s) --> Zn(s) ----- Solid hydroxide 
-EIII_eps = E0_new['EIII_0-eps'] - 2*constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(pH)
-
-# Zn(OH)2(aq) --> Zn(s) ----- Soluble hydroxide
-EIII = E0_new['EIII_0'] - 2*constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH2']/2+pH)
-
-# ZnO(s) --> Zn(s) ---- Solid oxide
-EIII_ox = E0_new['EIII_0-ox'] - 2*constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(pH)
-
-# Zn(OH)3^- --> Zn(s)
-EIV = E0_new['EIV_0'] - constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH3']+3*pH)
-
-# Zn(OH)4^2- --> Zn(s)
-EV = E0_new['EV_0'] - constants['R']*T*np.log(10)/(constants['n']*constants['F'])*(constants_p['pZnOH4']+4*pH)
-
+EI = E['I']                 # Zn^2+ --> Zn(s)
+EII = E['II']               # Zn(OH)^+ --> Zn(s)
+EIII_eps = E['III-eps']     # Zn(OH)2(s) --> Zn(s) ----- Solid hydroxide
+EIII = E['III']             # Zn(OH)2(aq) --> Zn(s) ----- Soluble hydroxide
+EIII_ox = E['III-ox']       # ZnO(s) --> Zn(s) ---- Solid oxide
+EIV = E['IV']               # Zn(OH)3^- --> Zn(s)
+EV = E['V']                 # Zn(OH)4^2- --> Zn(s)
 
 ## pH calculations
-
-# Zn^2+ --> Zn(OH)2(s) ---- Solid hydroxide
-pHVIII_eps = pKw + deltaG_new_T['deltaG_VIII-eps']/(2*constants['R']*T*np.log(10)) + constants_p['pZn']/2
-# Zn^2+ --> Zn(OH)2(aq) ---- Soluble hydroxide
-pHVIII = pKw + deltaG_new_T['deltaG_VIII']/(2*constants['R']*T*np.log(10)) + constants_p['pZn']/2 - constants_p['pZnOH2']/2
-# Zn^2+ --> ZnO(s) ---- Oxide oxide
-pHVIII_ox = pKw + deltaG_new_T['deltaG_VIII-ox']/(2*constants['R']*T*np.log(10)) + constants_p['pZn']/2
-
-# Zn(OH)2(s) --> Zn(OH)3^- ---- Using Solid Zn(OH)2
-pHIX_eps = pKw + deltaG_new_T['deltaG_IX-eps']/(constants['R']*T*np.log(10)) - constants_p['pZnOH3']
-# Zn(OH)2(aq) --> Zn(OH)3^- ---- Using Soluble Zn(OH)2
-pHIX = pKw + deltaG_new_T['deltaG_IX']/(constants['R']*T*np.log(10)) + constants_p['pZnOH2'] - constants_p['pZnOH3']
-# ZnO(s) --> Zn(OH)3^- ---- Using oxide ZnO
-pHIX_ox = pKw + deltaG_new_T['deltaG_IX-ox']/(constants['R']*T*np.log(10)) - constants_p['pZnOH3']
-
-# Zn(OH)3^- --> Zn(OH)4^2-
-pHX = pKw + deltaG_new_T['deltaG_X']/(constants['R']*T*np.log(10)) + constants_p['pZnOH3'] - constants_p['pZnOH4']
-
-# Zn(OH)2(s) --> Zn(OH)4^2- ---- Using the solid form
-pHXI_eps = pKw + deltaG_new_T['deltaG_XI-eps']/(2*constants['R']*T*np.log(10)) - (1/2)*constants_p['pZnOH4']
-# Zn(OH)2(aq) --> Zn(OH)4^2- ---- Using the Soluble form
-pHXI = pKw + deltaG_new_T['deltaG_XI-eps']/(2*constants['R']*T*np.log(10)) + (1/2)*constants_p['pZnOH2']- (1/2)*constants_p['pZnOH4']
-# ZnO(s) --> Zn(OH)4^2- ---- Using the oxide form
-pHXI_ox = pKw + deltaG_new_T['deltaG_XI-ox']/(2*constants['R']*T*np.log(10)) - (1/2)*constants_p['pZnOH4']
+pHVIII_eps = pH_boundary['VIII-eps']    # Zn^2+ --> Zn(OH)2(s) ---- Solid hydroxide
+pHVIII = pH_boundary['VIII']            # Zn^2+ --> Zn(OH)2(aq) ---- Soluble hydroxide
+pHVIII_ox = pH_boundary['VIII-ox']      # Zn^2+ --> ZnO(s) ---- Oxide
+pHIX_eps = pH_boundary['IX-eps']        # Zn(OH)2(s) --> Zn(OH)3^- ---- Using Solid Zn(OH)2
+pHIX = pH_boundary['IX']                # Zn(OH)2(aq) --> Zn(OH)3^- ---- Using Soluble Zn(OH)2
+pHIX_ox = pH_boundary['IX-ox']          # ZnO(s) --> Zn(OH)3^- ---- Using oxide ZnO
+pHX = pH_boundary['X']                  # Zn(OH)3^- --> Zn(OH)4^2-
+pHXI_eps = pH_boundary['XI-eps']        # Zn(OH)2(s) --> Zn(OH)4^2- ---- Using the solid form
+pHXI = pH_boundary['XI']                # Zn(OH)2(aq) --> Zn(OH)4^2- ---- Using the Soluble form
+pHXI_ox = pH_boundary['XI-ox']          # ZnO(s) --> Zn(OH)4^2- ---- Using the oxide form
 
 
 # Finding intersections for the different lines